@@ -0,0 +1,388 @@
+# benchmarks for pyocfl
+
+# standard library
+import argparse
+from distutils.dir_util import copy_tree
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# pyocfl
+import pyocfl
+from pyocfl.pyocfl import *
+
+logger = logging.getLogger(__name__)
+
+
+
+############################
+# Defaults
+############################
+DEFAULT_SHAPE = {
+	'objects':10,
+	'files_per_object':100,
+	'files_per_dir':25,
+	'file_size':4096,
+	'file_size_max':None,
+	'file_size_distribution':'fixed', # ['fixed','uniform','lognormal']
+	'versions':3,
+	'churn':0.1,
+	'seed':0
+}
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.25
+
+
+
+############################
+# Synthetic Data
+############################
+class SyntheticDataset(object):
+
+	'''
+	Class to generate raw object directories with configurable shape
+		- content is pseudo-random and reproducible for a given seed
+	'''
+
+	def __init__(self, path, **shape):
+
+		'''
+		Args:
+			path (str): Directory for raw object directories
+			shape (dict): Overrides of DEFAULT_SHAPE
+				- objects (int): number of objects
+				- files_per_object (int): number of files in each version
+				- files_per_dir (int): files per nested directory
+				- file_size (int): file size in bytes, or median for lognormal, or minimum for uniform
+				- file_size_max (int): maximum file size for uniform and lognormal distributions
+				- file_size_distribution (str): ['fixed','uniform','lognormal']
+				- versions (int): number of versions for each object
+				- churn (float): fraction of files rewritten in each version after v1
+				- seed (int): seed for content and sizes
+		'''
+
+		self.path = path
+		self.shape = dict(DEFAULT_SHAPE)
+		for k,v in shape.items():
+			if k not in DEFAULT_SHAPE:
+				raise Exception('"%s" is not a recognized dataset shape parameter' % k)
+			if v != None:
+				self.shape[k] = v
+		if self.shape['file_size_distribution'] not in ['fixed','uniform','lognormal']:
+			raise Exception('"%s" is not a recognized file size distribution' % self.shape['file_size_distribution'])
+		self.rng = random.Random(self.shape['seed'])
+
+
+	def file_size(self):
+
+		'''
+		Method to draw file size from distribution
+		'''
+
+		size = self.shape['file_size']
+		size_max = self.shape['file_size_max'] or size * 16
+		if self.shape['file_size_distribution'] == 'uniform':
+			return self.rng.randint(size, max(size, size_max))
+		elif self.shape['file_size_distribution'] == 'lognormal':
+			return max(1, min(size_max, int(size * self.rng.lognormvariate(0, 1))))
+		return size
+
+
+	def filepaths(self):
+
+		'''
+		Method to return logical paths of files for each object
+		'''
+
+		return [ 'd%03d/f%06d.bin' % (i // self.shape['files_per_dir'], i) for i in range(self.shape['files_per_object']) ]
+
+
+	def write_file(self, filepath):
+
+		'''
+		Method to write file of drawn size
+		'''
+
+		size = self.file_size()
+		os.makedirs(os.path.dirname(filepath), exist_ok=True)
+		with open(filepath, 'wb') as f:
+			f.write(self.rng.getrandbits(8 * size).to_bytes(size, 'little'))
+
+
+	def generate_objects(self):
+
+		'''
+		Method to write raw object directories
+
+		Returns:
+			(list): paths of raw object directories
+		'''
+
+		raw_paths = []
+		for i in range(self.shape['objects']):
+			raw_path = os.path.join(self.path, 'obj_%06d' % i)
+			for filepath in self.filepaths():
+				self.write_file(os.path.join(raw_path, filepath))
+			raw_paths.append(raw_path)
+		return raw_paths
+
+
+	def add_versions(self, obj):
+
+		'''
+		Method to add versions to OCFLObject on disk, each a copy of previous version with churned files rewritten
+			- inventories are not updated, see OCFLObject.update
+
+		Returns:
+			(int): number of files rewritten
+		'''
+
+		filepaths = self.filepaths()
+		churn_count = int(round(len(filepaths) * self.shape['churn']))
+		rewritten = 0
+		for v_num in range(2, self.shape['versions'] + 1):
+			v_content = os.path.join(obj.full_path, 'v%s/content' % v_num)
+			copy_tree(os.path.join(obj.full_path, 'v%s/content' % (v_num - 1)), v_content)
+			for filepath in self.rng.sample(filepaths, churn_count):
+				self.write_file(os.path.join(v_content, filepath))
+				rewritten += 1
+		return rewritten
+
+
+
+############################
+# Benchmarks
+############################
+class Benchmark(object):
+
+	'''
+	Class to run timed OCFL operations against synthetic storage root
+	'''
+
+	def __init__(self, path, repeat=DEFAULT_REPEAT, processes=None, workers=None, **shape):
+
+		'''
+		Args:
+			path (str): Working directory for dataset, storage root, and checkouts
+			repeat (int): Runs of read-only benchmarks, fastest is reported
+			processes (int): Passed to OCFLStorageRoot.check_fixity
+			workers (int): Passed to hashing and checkout methods
+			shape (dict): Dataset shape, see SyntheticDataset
+		'''
+
+		self.path = path
+		self.repeat = repeat
+		self.processes = processes
+		self.workers = workers
+		self.dataset = SyntheticDataset(os.path.join(path, 'raw'), **shape)
+		self.results = {}
+
+
+	def _time(self, name, func, count, repeat=1):
+
+		'''
+		Method to time function, recording fastest of repeated runs with metrics of that run
+		'''
+
+		best = None
+		for i in range(repeat):
+			collector = metrics.add_collector(OCFLMetricsCollector())
+			try:
+				stime = time.perf_counter()
+				func()
+				seconds = time.perf_counter() - stime
+			finally:
+				metrics.remove_collector(collector)
+			if best == None or seconds < best['seconds']:
+				best = {
+					'seconds':seconds,
+					'count':count,
+					'per_op':seconds / count if count else None,
+					'counters':dict(collector.counters)
+				}
+		self.results[name] = best
+		logger.info('%s: %.4fs' % (name, best['seconds']))
+		return best
+
+
+	def run(self):
+
+		'''
+		Method to generate dataset and run benchmarks
+
+		Returns:
+			(dict): machine-readable report, with meta and results
+		'''
+
+		# generate raw objects
+		stime = time.perf_counter()
+		raw_paths = self.dataset.generate_objects()
+		generate_seconds = time.perf_counter() - stime
+
+		# new storage root
+		sr = OCFLStorageRoot(os.path.join(self.path, 'sr'))
+		sr.new()
+
+		# new
+		objs = [ OCFLObject(raw_path) for raw_path in raw_paths ]
+		def new():
+			for i,obj in enumerate(objs):
+				obj.new(obj_id='bench_%06d' % i)
+		self._time('new', new, len(objs))
+
+		# add_object
+		def add_object():
+			for obj in objs:
+				sr.add_object(obj)
+		self._time('add_object', add_object, len(objs))
+
+		# add versions to stored objects
+		stored_objs = [ sr.get_object(obj.id) for obj in objs ]
+		for obj in stored_objs:
+			self.dataset.add_versions(obj)
+
+		# update, without reconciliation
+		def update():
+			for obj in stored_objs:
+				obj.update(reconcile_deltas=False, workers=self.workers)
+		self._time('update', update, len(stored_objs))
+
+		# reconcile_deltas
+		def reconcile_deltas():
+			for obj in stored_objs:
+				obj.reconcile_deltas()
+		self._time('reconcile_deltas', reconcile_deltas, len(stored_objs))
+
+		# checkout latest version
+		checkout_path = os.path.join(self.path, 'checkouts')
+		def checkout():
+			for obj in stored_objs:
+				obj.checkout(os.path.join(checkout_path, obj.storage_id), workers=self.workers)
+		self._time('checkout', checkout, len(stored_objs), repeat=self.repeat)
+
+		# check_fixity, with fixity recorded first
+		for obj in stored_objs:
+			obj.calc_fixity(update_fixity=True, workers=self.workers)
+		def check_fixity():
+			results = sr.check_fixity(processes=self.processes, workers=self.workers)
+			if results != True:
+				raise Exception('fixity check failed: %s' % results)
+		self._time('check_fixity', check_fixity, len(stored_objs), repeat=self.repeat)
+
+		# get_objects, from filesystem
+		def get_objects():
+			for obj in sr.get_objects(use_index=False, workers=self.workers):
+				obj.id
+		self._time('get_objects', get_objects, len(stored_objs), repeat=self.repeat)
+
+		return {
+			'meta':{
+				'pyocfl':pyocfl.__version__,
+				'python':platform.python_version(),
+				'platform':platform.platform(),
+				'shape':self.dataset.shape,
+				'repeat':self.repeat,
+				'processes':self.processes,
+				'workers':self.workers,
+				'generate_seconds':generate_seconds
+			},
+			'results':self.results
+		}
+
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+
+	'''
+	Function to compare benchmark results against baseline report
+
+	Args:
+		report (dict): report from Benchmark.run
+		baseline (dict): previously saved report
+		tolerance (float): allowed slowdown, e.g. 0.25 for 25% slower than baseline
+
+	Returns:
+		(dict): {benchmark: {'seconds','baseline','ratio','regression'}} for benchmarks in both reports
+	'''
+
+	comparison = {}
+	for name,result in report['results'].items():
+		if name in baseline.get('results', {}):
+			baseline_seconds = baseline['results'][name]['seconds']
+			ratio = result['seconds'] / baseline_seconds if baseline_seconds else None
+			comparison[name] = {
+				'seconds':result['seconds'],
+				'baseline':baseline_seconds,
+				'ratio':ratio,
+				'regression':ratio != None and ratio > 1 + tolerance
+			}
+	return comparison
+
+
+
+def main(argv=None):
+
+	# init parser
+	parser = argparse.ArgumentParser(description='Benchmark pyocfl against synthetic storage root')
+
+	# dataset shape
+	parser.add_argument('--objects', type=int)
+	parser.add_argument('--files-per-object', type=int)
+	parser.add_argument('--files-per-dir', type=int)
+	parser.add_argument('--file-size', type=int, help='bytes, or median for lognormal, or minimum for uniform')
+	parser.add_argument('--file-size-max', type=int)
+	parser.add_argument('--file-size-distribution', choices=['fixed','uniform','lognormal'])
+	parser.add_argument('--versions', type=int)
+	parser.add_argument('--churn', type=float, help='fraction of files rewritten per version')
+	parser.add_argument('--seed', type=int)
+
+	# run
+	parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+	parser.add_argument('--processes', type=int)
+	parser.add_argument('--workers', type=int)
+	parser.add_argument('--path', help='working directory, defaults to temporary directory removed after run')
+	parser.add_argument('--output', help='write JSON report to file, else stdout')
+	parser.add_argument('--baseline', help='JSON report to compare against, exit 1 on regression')
+	parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+
+	# parse args
+	args = parser.parse_args(argv)
+	shape = { k:getattr(args, k) for k in DEFAULT_SHAPE.keys() }
+
+	# run in working directory
+	path = args.path or tempfile.mkdtemp(prefix='pyocfl_bench_')
+	try:
+		report = Benchmark(path, repeat=args.repeat, processes=args.processes, workers=args.workers, **shape).run()
+	finally:
+		if args.path == None:
+			shutil.rmtree(path)
+
+	# compare with baseline
+	regressions = []
+	if args.baseline != None:
+		with open(args.baseline) as f:
+			report['comparison'] = compare(report, json.load(f), tolerance=args.tolerance)
+		regressions = [ name for name,result in report['comparison'].items() if result['regression'] ]
+
+	# output
+	report_json = json.dumps(report, sort_keys=True, indent=4)
+	if args.output != None:
+		with open(args.output, 'w') as f:
+			f.write(report_json)
+	else:
+		print(report_json)
+
+	if len(regressions) > 0:
+		sys.stderr.write('regressions beyond %s tolerance: %s\n' % (args.tolerance, ', '.join(sorted(regressions))))
+		return 1
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
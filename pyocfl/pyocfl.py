@@ -2,31 +2,42 @@
 # https://github.com/wsulib/pyocfl
 
 # python 3.x standard library modules
+import array
+import codecs
+import collections.abc
+import concurrent.futures
+import contextlib
 import datetime
-from distutils.dir_util import copy_tree
+import fnmatch
 import glob
 import hashlib
+import io
+import itertools
 import json
 import logging
 import os
-import pathlib
-import pdb
 import re
 import shutil
+import sys
+import threading
 import time
-import uuid
 
-# 3rd party libraries
-import namaste
-from pypairtree import pairtree
+# platform specific modules
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
 
+# 3rd party libraries, namaste and pypairtree, and standard library modules needed only
+# by some operations, asyncio, sqlite3, tarfile, uuid, and zipfile, are imported on use for fast import
 
-# setup logger
-logging.basicConfig(level=logging.DEBUG)
+
+# setup logger, output configured by application
 # parso shims
 logging.getLogger('parso.python.diff').disabled = True
 logging.getLogger('parso.cache').disabled = True
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 
@@ -41,6 +52,20 @@ DEFAULT_OBJECT_CONFORMANCE = 'ocfl_object'
 DEFAULT_OBJECT_VERSION = '1.0'
 DEFAULT_OBJECT_FILE_DIGEST_ALGO = 'md5' # ['md5','sha256','sha512']
 DEFAULT_OBJECT_FILE_FIXITY_ALGO = 'md5' # ['md5','sha256','sha512']
+DEFAULT_OBJECT_CHECKOUT_MODE = 'copy' # ['copy','hardlink','reflink','symlink']
+DEFAULT_OBJECT_READ_CHUNK_SIZE = 1048576
+DEFAULT_OBJECT_ARCHIVE_FORMAT = 'tar' # ['tar','tar.gz','zip']
+# DIGEST CACHE
+DEFAULT_DIGEST_CACHE_FILENAME = 'pyocfl_digest_cache.sqlite'
+# OBJECT INDEX
+DEFAULT_OBJECT_INDEX_FILENAME = 'pyocfl_object_index.sqlite'
+# AUDIT LEDGER
+DEFAULT_AUDIT_LEDGER_FILENAME = 'pyocfl_audit_ledger.sqlite'
+# ASYNC
+DEFAULT_ASYNC_WORKERS = 8
+DEFAULT_ASYNC_BATCH_SIZE = 100
+# INVENTORY FIXITY
+INVENTORY_FILE_SIZE_FIXITY_ALGO = 'size' # fixity block of file sizes, {size in bytes: [files]}, OCFL extension 0009-digest-algorithms
 
 
 
@@ -65,7 +90,22 @@ class OCFLStorageRoot(object):
 		version=DEFAULT_STORAGE_ROOT_VERSION,
 		storage=DEFAULT_STORAGE_ROOT_STORAGE,
 		storage_id_algo=DEFAULT_STORAGE_ROOT_STORAGE_ID_ALGO,
-		auto_load=True):
+		auto_load=True,
+		digest_cache=None,
+		object_index=None):
+
+		'''
+		Args:
+			path (str): path of storage root
+			digest_cache (bool,str,OCFLDigestCache): Optional digest cache shared by objects in the Storage Root
+				- if True, SQLite cache is created at DEFAULT_DIGEST_CACHE_FILENAME in the Storage Root
+				- if str, path of SQLite cache file
+			object_index (bool,str,OCFLObjectIndex): Optional index of objects, used for listing and counting
+				- if None, index at DEFAULT_OBJECT_INDEX_FILENAME in the Storage Root is used if present
+				- if True, index is created at DEFAULT_OBJECT_INDEX_FILENAME in the Storage Root
+				- if str, path of SQLite index file
+				- if False, no index is used
+		'''
 
 		self.path = path
 		self.conformance = conformance
@@ -77,6 +117,24 @@ class OCFLStorageRoot(object):
 		if self.path != None:
 			self.path = self.path.rstrip('/')
 
+		# init digest cache
+		if digest_cache == True:
+			digest_cache = os.path.join(self.path, DEFAULT_DIGEST_CACHE_FILENAME)
+		if type(digest_cache) == str:
+			digest_cache = OCFLDigestCache(digest_cache)
+		self.digest_cache = digest_cache
+
+		# init object index
+		if object_index == None and self.path != None and os.path.exists(os.path.join(self.path, DEFAULT_OBJECT_INDEX_FILENAME)):
+			object_index = True
+		if object_index == True:
+			object_index = os.path.join(self.path, DEFAULT_OBJECT_INDEX_FILENAME)
+		if type(object_index) == str:
+			object_index = OCFLObjectIndex(object_index)
+		elif object_index == False:
+			object_index = None
+		self.object_index = object_index
+
 		# load pre-existing
 		if auto_load and self.path != None and os.path.exists(self.path):
 			self.load()
@@ -99,6 +157,7 @@ class OCFLStorageRoot(object):
 		'''
 
 		# get storage type
+		import namaste
 		storage_nam = namaste._get_namaste(self.path, 1)
 		if storage_nam != None:
 			self.storage = storage_nam[0].split('=')[-1]
@@ -190,6 +249,7 @@ class OCFLStorageRoot(object):
 		'''
 
 		# retrieve namaste information
+		import namaste
 		nam_d = namaste.get_types(self.path)
 
 		# compare conformance
@@ -204,15 +264,20 @@ class OCFLStorageRoot(object):
 			return False
 
 
-	def add_object(self, ocfl_obj, target_id=None):
+	def add_object(self, ocfl_obj, target_id=None, workers=None):
 
 		'''
 		Method to add OCFLObject to OCFLStorageRoot
 			- confirms ocfl_obj is valid ocfl_obj
+			- content files are hashed while copied, and inventories written from those digests,
+			so copied files are not read again
+			- ocfl_obj must already be an object, so was read once when created, see OCFLObject.new
+			with storage_root to create from a directory in a single read
 
 		Args:
 			ocfl_obj (pyocfl.OCFLObject): Object instance
 			target_id (str): new target id, overwriting what is found in ocfl_obj.id
+			workers (int): If greater than 1, copy files concurrently with a thread pool of this size
 		'''
 
 		# verify valid ocfl_object
@@ -223,7 +288,7 @@ class OCFLStorageRoot(object):
 		if target_id != None:
 
 			# set in obj inventory
-			ocfl_obj.object_inventory.inventory['id'] = target_id
+			ocfl_obj.object_inventory.set_id(target_id)
 
 		# prepare storage id and path
 		storage_id = self._calc_storage_id(ocfl_obj.id)
@@ -232,18 +297,62 @@ class OCFLStorageRoot(object):
 		# create dir
 		os.makedirs(os.path.join(self.path, storage_path))
 
-		# copy material
-		copy_tree(ocfl_obj.full_path, os.path.join(self.path, storage_path))
+		# copy material, hashing content in same read
+		digest_d = ocfl_obj.copy_object(os.path.join(self.path, storage_path), workers=workers)
 
 		# finish up
 		ocfl_obj.storage_root = self
 		ocfl_obj.path = storage_path
 
-		# update
-		ocfl_obj.update()
+		# update, with digests from copy
+		ocfl_obj.update(digests=digest_d, workers=workers)
+
 
+	def add_objects(self, ocfl_objs, workers=None):
 
-	def get_object(self, obj_id=None, obj_path=None):
+		'''
+		Method to add many OCFLObjects to OCFLStorageRoot, see add_object
+			- objects are added concurrently, overlapping reads, hashing, and writes across objects
+			- objects in flight are bounded, so ocfl_objs may be a generator over a large collection
+			- if an object fails, objects in flight finish and the exception is raised
+
+		Args:
+			ocfl_objs (iterable): OCFLObject instances, or (OCFLObject, target_id) tuples
+			workers (int): If greater than 1, add objects concurrently with a thread pool of this size
+
+		Returns:
+			list: added OCFLObject instances, in order provided
+		'''
+
+		# normalize to (object, target id)
+		items = ( item if type(item) == tuple else (item, None) for item in ocfl_objs )
+
+		# serial
+		if workers == None or workers <= 1:
+			added = []
+			for ocfl_obj, target_id in items:
+				self.add_object(ocfl_obj, target_id=target_id)
+				added.append(ocfl_obj)
+			return added
+
+		# thread pool, bounding objects in flight
+		added = {}
+		with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+			pending = {}
+			for i, (ocfl_obj, target_id) in enumerate(items):
+				pending[executor.submit(self.add_object, ocfl_obj, target_id=target_id)] = (i, ocfl_obj)
+				if len(pending) >= workers * 2:
+					done, not_done = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+					for future in done:
+						future.result()
+						added.setdefault(*pending.pop(future))
+			for future in concurrent.futures.as_completed(pending):
+				future.result()
+				added.setdefault(*pending[future])
+		return [ added[i] for i in sorted(added.keys()) ]
+
+
+	def get_object(self, obj_id=None, obj_path=None, auto_load=True):
 
 		'''
 		Method to retrieve object
@@ -251,6 +360,7 @@ class OCFLStorageRoot(object):
 		Args:
 			obj_id (str): If id provided, calculate path based on StorageRoot's storage engine
 			obj_path (str): If object path provided, use without calculation
+			auto_load (bool): If False, object is not read from disk until accessed, e.g. to resolve path only
 
 		Returns:
 			OCFLObject,None
@@ -264,40 +374,93 @@ class OCFLStorageRoot(object):
 			obj_path = self._calc_storage_path(storage_id)
 
 		# init OCFLObject and return
-		return OCFLObject(obj_path, storage_root=self)
+		return OCFLObject(obj_path, storage_root=self, auto_load=auto_load)
 
 
-	def get_objects(self, as_ocfl_objects=True):
+	def get_objects(self, as_ocfl_objects=True, use_index=True, workers=None):
 
 		'''
 		Return generator of all objects in Storage Root
+
+		Args:
+			as_ocfl_objects (bool): If True, yield OCFLObject instances, else object paths
+			use_index (bool): If True and object index is configured, read objects from index instead of filesystem
+			workers (int): If greater than 1, walk top-level directories of Storage Root concurrently with a thread pool
+		'''
+
+		# if index, read object paths
+		if use_index and self.object_index != None:
+			return self._obj_paths_generator(self.object_index.get_paths(), as_ocfl_objects=as_ocfl_objects)
+
+		# else, walk filesystem
+		return self._obj_paths_generator(self._walk_object_paths(workers=workers), as_ocfl_objects=as_ocfl_objects)
+
+
+	def _walk_object_paths(self, workers=None):
+
+		'''
+		Generator of object paths found on filesystem, relative to Storage Root
+			- walk does not descend into directories with an object declaration
+
+		Args:
+			workers (int): If greater than 1, walk top-level directories concurrently with a thread pool
+		'''
+
+		# walk top-level directories, as objects are not permitted at Storage Root
+		top_dirs = sorted([ entry.name for entry in os.scandir(self.path) if entry.is_dir(follow_symlinks=False) ])
+
+		# walk serially, or fan out across top-level directories
+		if workers != None and workers > 1:
+			with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+				for obj_paths in executor.map(lambda top_dir: list(self._walk_dir_object_paths(top_dir)), top_dirs):
+					for obj_path in obj_paths:
+						yield obj_path
+		else:
+			for top_dir in top_dirs:
+				for obj_path in self._walk_dir_object_paths(top_dir):
+					yield obj_path
+
+
+	def _walk_dir_object_paths(self, rel_path):
+
+		'''
+		Generator of object paths under directory, pruning at object declarations
+
+		Args:
+			rel_path (str): directory path relative to Storage Root
 		'''
 
-		# get pathlib
-		p = pathlib.Path(self.path)
+		# read directory once
+		entries = list(os.scandir(os.path.join(self.path, rel_path)))
 
-		# init generator of object declaration paths
-		obj_dec_paths = p.glob('**/0=ocfl_object_*')
+		# if object declaration present, yield and stop descending
+		for entry in entries:
+			if entry.name.startswith('0=%s_' % DEFAULT_OBJECT_CONFORMANCE) and entry.is_file():
+				yield rel_path
+				return
 
-		# wrap in generator to return parent, obj path
-		return self._obj_dec_paths_generator(obj_dec_paths, as_ocfl_objects=as_ocfl_objects)
+		# else, descend into sub-directories
+		for entry in sorted(entries, key=lambda entry: entry.name):
+			if entry.is_dir(follow_symlinks=False):
+				for obj_path in self._walk_dir_object_paths(os.path.join(rel_path, entry.name)):
+					yield obj_path
 
 
-	def _obj_dec_paths_generator(self, obj_dec_paths, as_ocfl_objects=True):
+	def _obj_paths_generator(self, obj_paths, as_ocfl_objects=True):
 
 		'''
-		Wrapper to accept generator of object declaration paths, return object path
+		Wrapper to accept generator of object paths, return object path or instance
 		'''
 
-		for obj_dec_path in obj_dec_paths:
+		for obj_path in obj_paths:
 
 			# yield object path
 			if not as_ocfl_objects:
-				yield str(obj_dec_path.parent).replace(self.path,'').lstrip('/')
+				yield obj_path
 
-			# yield object instance
+			# yield object instance, with inventory parsed on first access
 			elif as_ocfl_objects:
-				yield OCFLObject(str(obj_dec_path.parent).replace(self.path,'').lstrip('/'), storage_root=self)
+				yield OCFLObject(obj_path, storage_root=self, auto_load=False)
 
 
 	@property
@@ -334,6 +497,10 @@ class OCFLStorageRoot(object):
 			target_storage_id = self._calc_storage_id(target_id)
 			target_storage_path = self._calc_storage_path(target_storage_id)
 
+			# remove from index, re-added at new path on update
+			if obj.storage_root != None and obj.storage_root.object_index != None:
+				obj.storage_root.object_index.remove(obj.path)
+
 			# if incoming object has storage root, use to determine path
 			if obj.storage_root != None:
 				shutil.move(
@@ -350,10 +517,10 @@ class OCFLStorageRoot(object):
 
 			# udpate object
 			obj.path = target_storage_path
-			obj.object_inventory.inventory['id'] = target_id
+			obj.object_inventory.set_id(target_id)
 
-		# update
-		obj.update()
+		# update, content unchanged so only inventories need writing
+		obj.update(incremental=True)
 
 
 	def _calc_storage_id(self, obj_id):
@@ -364,8 +531,8 @@ class OCFLStorageRoot(object):
 
 		digest_func = getattr(hashlib, self.storage_id_algo)
 		storage_id = digest_func(obj_id.encode('utf-8')).hexdigest()
-		logger.debug('digest algo: %s' % digest_func)
-		logger.debug('storage_id: %s' % storage_id)
+		if metrics.enabled:
+			metrics.incr('storage_ids_calculated')
 
 		return storage_id
 
@@ -386,6 +553,7 @@ class OCFLStorageRoot(object):
 		elif self.storage == 'storage_pair_tree':
 
 			# use pypairtree library to generate structure
+			from pypairtree import pairtree
 			return os.path.join(pairtree.toPairTreePath(storage_id), storage_id)
 
 		else:
@@ -398,21 +566,63 @@ class OCFLStorageRoot(object):
 		Simple method to count all objects
 		'''
 
+		# if index, count from index
+		if self.object_index != None:
+			return self.object_index.count()
+
 		count = 0
 		for obj in self.get_objects(as_ocfl_objects=False):
 			count += 1
 		return count
 
 
-	def check_fixity(self, fixity_algo=None, use_manifest_digest=None):
+	def rebuild_object_index(self, object_index=None, workers=None):
+
+		'''
+		Method to rebuild object index from filesystem
+
+		Args:
+			object_index (str,OCFLObjectIndex): index to rebuild, if not already configured
+				- if None and no index configured, index is created at DEFAULT_OBJECT_INDEX_FILENAME
+			workers (int): If greater than 1, walk top-level directories of Storage Root concurrently with a thread pool
+
+		Returns:
+			int: count of objects indexed
+		'''
+
+		# set index
+		if object_index == None and self.object_index == None:
+			object_index = os.path.join(self.path, DEFAULT_OBJECT_INDEX_FILENAME)
+		if type(object_index) == str:
+			object_index = OCFLObjectIndex(object_index)
+		if object_index != None:
+			self.object_index = object_index
+
+		# clear, and index all objects found on filesystem
+		self.object_index.clear()
+		count = 0
+		for obj in self.get_objects(use_index=False, workers=workers):
+			self.object_index.index_object(obj, commit=False)
+			count += 1
+		self.object_index.commit()
+
+		logger.debug('indexed %s objects' % count)
+		return count
+
+
+	def check_fixity(self, fixity_algo=None, use_manifest_digest=None, processes=None, workers=None, compact_inventory=False, throttle=None):
 
 		'''
 		Check fixity for all Objects in Storage Root
 
 		Args:
-			fixity_algo (str): digest algorithm ['md5','sha256','sha512',etc.]
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
 			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
 				- pro: no re-compute time, con: limited to digest and freshness of manifest
+			processes (int): If greater than 1, check objects concurrently with a process pool of this size
+			workers (int): If greater than 1, hash files within each object with a thread pool of this size
+			compact_inventory (bool): If True, parse object inventories to read-only OCFLCompactInventory
+			throttle (OCFLThrottle): If provided, limit bytes and files read per second across the audit, see OCFLThrottle
 		'''
 
 		logger.debug('checking fixity for all objects in storage root')
@@ -423,20 +633,20 @@ class OCFLStorageRoot(object):
 		# init results
 		results_d = {}
 
-		for obj in self.get_objects():
+		for obj_path, obj_id, obj_fixity_check in self.iter_check_fixity(
+			fixity_algo=fixity_algo,
+			use_manifest_digest=use_manifest_digest,
+			processes=processes,
+			workers=workers,
+			compact_inventory=compact_inventory,
+			throttle=throttle):
 
 			# bumper counter
 			count += 1
 
-			# check fixity
-			if use_manifest_digest != None:
-				obj_fixity_check = obj.check_fixity(fixity_algo=fixity_algo, use_manifest_digest=use_manifest_digest)
-			else:
-				obj_fixity_check = obj.check_fixity(fixity_algo=fixity_algo)
-
 			# if not True, save
 			if obj_fixity_check != True:
-				results_d[obj.id] = obj_fixity_check
+				results_d[obj_id if obj_id != None else obj_path] = obj_fixity_check
 
 		# return
 		logger.debug('%s / %s objects failed fixity check' % (len(results_d),count))
@@ -446,26 +656,492 @@ class OCFLStorageRoot(object):
 			return results_d
 
 
-	def calc_fixity(self, fixity_algo=None, use_manifest_digest=None):
+	def calc_fixity(self, fixity_algo=None, use_manifest_digest=None, processes=None, workers=None):
 
 		'''
 		Method to calculate fixity for all Objects in Storage Root
 
 		Args:
-			fixity_algo (str): digest algorithm ['md5','sha256','sha512',etc.]
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
 			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
 				- pro: no re-compute time, con: limited to digest and freshness of manifest
+			processes (int): If greater than 1, calculate for objects concurrently with a process pool of this size
+			workers (int): If greater than 1, hash files within each object with a thread pool of this size
 		'''
 
 		logger.debug('calculating fixity for all objects in storage root')
 
-		for obj in self.get_objects():
+		# raise errors, as serial calculation always has
+		for obj_path, obj_id, obj_fixity_calc in self.iter_calc_fixity(
+			fixity_algo=fixity_algo,
+			use_manifest_digest=use_manifest_digest,
+			processes=processes,
+			workers=workers,
+			raise_errors=True):
+			pass
 
-			# calc fixity
-			if use_manifest_digest != None:
-				obj_fixity_check = obj.calc_fixity(use_manifest_digest=use_manifest_digest, fixity_algo=fixity_algo)
-			else:
-				obj_fixity_check = obj.calc_fixity(fixity_algo=fixity_algo)
+
+	def iter_check_fixity(self, fixity_algo=None, use_manifest_digest=None, processes=None, largest_first=None, workers=None, compact_inventory=False, throttle=None):
+
+		'''
+		Generator to check fixity for all Objects in Storage Root, yielding each result as it finishes
+
+		Args:
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
+			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
+			processes (int): If greater than 1, check objects concurrently with a process pool of this size
+			largest_first (bool): If True, schedule objects by descending size for load balance
+				- defaults to True when processes > 1 and object index is configured, as sizes are read from index
+			workers (int): If greater than 1, hash files within each object with a thread pool of this size
+			compact_inventory (bool): If True, parse object inventories to read-only OCFLCompactInventory
+				- reduces memory per worker for objects with many files
+			throttle (OCFLThrottle): If provided, limit bytes and files read per second across the audit
+				- with processes, each process is limited to an equal share of the rates
+
+		Yields:
+			tuple: (object path, object id, True or failures dictionary)
+				- if object could not be checked, result is {'error': message}
+		'''
+
+		method_kwargs = {'fixity_algo':fixity_algo, 'workers':workers}
+		if use_manifest_digest != None:
+			method_kwargs['use_manifest_digest'] = use_manifest_digest
+
+		return self._iter_objects_method('check_fixity', method_kwargs, processes=processes, largest_first=largest_first, obj_kwargs={'compact_inventory':compact_inventory, 'throttle':throttle})
+
+
+	def iter_calc_fixity(self, fixity_algo=None, use_manifest_digest=None, processes=None, largest_first=None, workers=None, raise_errors=False):
+
+		'''
+		Generator to calculate fixity for all Objects in Storage Root, yielding each result as it finishes
+
+		Args:
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
+			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
+			processes (int): If greater than 1, calculate for objects concurrently with a process pool of this size
+			largest_first (bool): If True, schedule objects by descending size for load balance
+				- defaults to True when processes > 1 and object index is configured, as sizes are read from index
+			workers (int): If greater than 1, hash files within each object with a thread pool of this size
+			raise_errors (bool): If True, exceptions raised for an object are raised, else yielded as results
+
+		Yields:
+			tuple: (object path, object id, True)
+				- if fixity could not be calculated, result is {'error': message}
+		'''
+
+		method_kwargs = {'fixity_algo':fixity_algo, 'workers':workers}
+		if use_manifest_digest != None:
+			method_kwargs['use_manifest_digest'] = use_manifest_digest
+
+		return self._iter_objects_method('calc_fixity', method_kwargs, processes=processes, largest_first=largest_first, raise_errors=raise_errors)
+
+
+	def audit(self, fixity_algo=None, use_manifest_digest=None, processes=None, workers=None, compact_inventory=False, throttle=None, ledger=None, max_objects=None, max_seconds=None):
+
+		'''
+		Check fixity for Objects in Storage Root, recording results in persistent audit ledger
+			- objects are scheduled by time last verified, oldest first, with objects never verified before all others
+			- each result is committed as it finishes, so an interrupted audit resumes with objects not yet verified
+			- max_objects and max_seconds bound a run, for steady coverage across repeated runs
+
+		Args:
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
+			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
+			processes (int): If greater than 1, check objects concurrently with a process pool of this size
+			workers (int): If greater than 1, hash files within each object with a thread pool of this size
+			compact_inventory (bool): If True, parse object inventories to read-only OCFLCompactInventory
+			throttle (OCFLThrottle): If provided, limit bytes and files read per second across the audit
+			ledger (str,OCFLAuditLedger): Audit ledger, defaults to DEFAULT_AUDIT_LEDGER_FILENAME in the Storage Root
+			max_objects (int): If provided, audit at most this many objects
+			max_seconds (int,float): If provided, stop scheduling objects after this many seconds
+
+		Returns:
+			True,dict: True if all objects audited in this run pass, else {object id: failures}
+		'''
+
+		results_d = {}
+		for obj_path, obj_id, obj_audit in self.iter_audit(
+			fixity_algo=fixity_algo,
+			use_manifest_digest=use_manifest_digest,
+			processes=processes,
+			workers=workers,
+			compact_inventory=compact_inventory,
+			throttle=throttle,
+			ledger=ledger,
+			max_objects=max_objects,
+			max_seconds=max_seconds):
+			if obj_audit != True:
+				results_d[obj_id if obj_id != None else obj_path] = obj_audit
+
+		if len(results_d) == 0:
+			return True
+		else:
+			return results_d
+
+
+	def iter_audit(self, fixity_algo=None, use_manifest_digest=None, processes=None, workers=None, compact_inventory=False, throttle=None, ledger=None, max_objects=None, max_seconds=None):
+
+		'''
+		Generator to check fixity for Objects in Storage Root, oldest verified first, recording results in audit ledger
+			- see audit
+
+		Yields:
+			tuple: (object path, object id, True or failures dictionary)
+				- if object could not be checked, result is {'error': message}
+		'''
+
+		# init ledger
+		if ledger == None:
+			ledger = os.path.join(self.path, DEFAULT_AUDIT_LEDGER_FILENAME)
+		if type(ledger) == str:
+			ledger = OCFLAuditLedger(ledger)
+
+		# schedule objects, oldest verified first
+		obj_paths = ledger.schedule(self.get_objects(as_ocfl_objects=False))
+		if max_objects != None:
+			obj_paths = obj_paths[:max_objects]
+
+		# stop scheduling after max_seconds
+		def scheduled_paths():
+			stime = time.monotonic()
+			for obj_path in obj_paths:
+				if max_seconds != None and time.monotonic() - stime >= max_seconds:
+					logger.debug('audit reached max_seconds, stopping')
+					break
+				yield obj_path
+
+		method_kwargs = {'fixity_algo':fixity_algo, 'workers':workers}
+		if use_manifest_digest != None:
+			method_kwargs['use_manifest_digest'] = use_manifest_digest
+
+		try:
+			for obj_path, obj_id, obj_audit in self._iter_objects_method(
+				'audit_fixity',
+				method_kwargs,
+				processes=processes,
+				largest_first=False,
+				obj_kwargs={'compact_inventory':compact_inventory, 'throttle':throttle},
+				obj_paths=scheduled_paths()):
+
+				# record, and yield fixity result
+				if type(obj_audit) == dict and 'result' in obj_audit:
+					ledger.record(obj_path, obj_id, obj_audit['result'], filepaths=obj_audit['filepaths'])
+					yield obj_path, obj_id, obj_audit['result']
+				else:
+					ledger.record(obj_path, obj_id, obj_audit)
+					yield obj_path, obj_id, obj_audit
+
+		finally:
+			ledger.commit()
+
+
+	def quick_audit(self, processes=None, compact_inventory=False):
+
+		'''
+		Quick audit of all Objects in Storage Root, comparing files on disk to manifests using stat only
+			- see OCFLObject.quick_audit
+
+		Args:
+			processes (int): If greater than 1, audit objects concurrently with a process pool of this size
+			compact_inventory (bool): If True, parse object inventories to read-only OCFLCompactInventory
+
+		Returns:
+			True,dict: True if all objects pass, else {object id: failures}
+		'''
+
+		results_d = {}
+		for obj_path, obj_id, obj_audit in self.iter_quick_audit(processes=processes, compact_inventory=compact_inventory):
+			if obj_audit != True:
+				results_d[obj_id if obj_id != None else obj_path] = obj_audit
+
+		if len(results_d) == 0:
+			return True
+		else:
+			return results_d
+
+
+	def iter_quick_audit(self, processes=None, largest_first=False, compact_inventory=False):
+
+		'''
+		Generator to quick audit all Objects in Storage Root, yielding each result as it finishes
+
+		Args:
+			processes (int): If greater than 1, audit objects concurrently with a process pool of this size
+			largest_first (bool): If True, schedule objects by descending size, read from object index, else at the cost of an extra walk of each object
+			compact_inventory (bool): If True, parse object inventories to read-only OCFLCompactInventory
+
+		Yields:
+			tuple: (object path, object id, True or failures dictionary)
+				- if object could not be audited, result is {'error': message}
+		'''
+
+		return self._iter_objects_method('quick_audit', {}, processes=processes, largest_first=largest_first, obj_kwargs={'compact_inventory':compact_inventory})
+
+
+	def _iter_objects_method(self, method, method_kwargs, processes=None, largest_first=None, obj_kwargs=None, obj_paths=None, raise_errors=False):
+
+		'''
+		Generator to run OCFLObject method for all Objects in Storage Root, optionally across a process pool
+
+		Args:
+			method (str): OCFLObject method name
+			method_kwargs (dict): keyword arguments for method
+			processes (int): If greater than 1, run concurrently with a process pool of this size
+			largest_first (bool): If True, schedule objects by descending size
+				- sizes are read from object index if configured, else each object is walked before the first is run
+				- defaults to True when processes > 1 and object index is configured
+			obj_kwargs (dict): keyword arguments for OCFLObject
+			obj_paths (iterable): If provided, object paths in order to run, else all objects in Storage Root
+			raise_errors (bool): If True, exceptions raised for an object are raised, else returned as {'error': message}
+
+		Yields:
+			tuple: (object path, object id, result)
+		'''
+
+		# get object paths
+		if obj_paths == None:
+			obj_paths = self.get_objects(as_ocfl_objects=False)
+
+		# schedule largest objects first, by size from index if available
+		if largest_first == None:
+			largest_first = processes != None and processes > 1 and self.object_index != None
+		if largest_first:
+			sizes = self.object_index.get_sizes() if self.object_index != None else {}
+			obj_paths = [ obj_path for size, obj_path in sorted(
+				[ (sizes[obj_path] if sizes.get(obj_path) != None else self._calc_object_size(obj_path), obj_path) for obj_path in obj_paths ], reverse=True
+			) ]
+
+		# serial, with this Storage Root
+		if processes == None or processes <= 1:
+			for obj_path in obj_paths:
+				yield _run_object_method(self, obj_path, method, method_kwargs, obj_kwargs, raise_errors=raise_errors)
+
+		# process pool, bounding objects in flight and yielding as completed
+		else:
+
+			# prepare worker args, sharing throttle rates across processes
+			sr_args = (
+				self.path,
+				self.storage,
+				self.storage_id_algo,
+				self.digest_cache.path if self.digest_cache != None else None,
+				self.object_index.path if self.object_index != None else False
+			)
+			if obj_kwargs != None and obj_kwargs.get('throttle') != None:
+				obj_kwargs = dict(obj_kwargs, throttle=obj_kwargs['throttle'].split(processes))
+
+			with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+				pending = set()
+				for obj_path in obj_paths:
+					pending.add(executor.submit(_run_object_method, sr_args, obj_path, method, method_kwargs, obj_kwargs, raise_errors))
+					if len(pending) >= processes * 2:
+						done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+						for future in done:
+							yield future.result()
+				for future in concurrent.futures.as_completed(pending):
+					yield future.result()
+
+
+	def _calc_object_size(self, obj_path):
+
+		'''
+		Method to calculate size in bytes of all files in object, using stat only
+
+		Args:
+			obj_path (str): object path relative to Storage Root
+		'''
+
+		size = 0
+		for root, folders, files in os.walk(os.path.join(self.path, obj_path)):
+			for filename in files:
+				size += os.stat(os.path.join(root, filename)).st_size
+		return size
+
+
+
+# Storage Roots, per process, for object methods run in process pool
+_process_storage_roots = {}
+
+
+def _run_object_method(sr, obj_path, method, method_kwargs, obj_kwargs=None, raise_errors=False):
+
+	'''
+	Function to run OCFLObject method for object in Storage Root, suitable for process pool
+
+	Args:
+		sr (OCFLStorageRoot,tuple): Storage Root, or in process pool,
+			(path, storage, storage_id_algo, digest cache path, object index path) of Storage Root
+		obj_path (str): object path relative to Storage Root
+		method (str): OCFLObject method name
+		method_kwargs (dict): keyword arguments for method
+		obj_kwargs (dict): keyword arguments for OCFLObject
+		raise_errors (bool): If True, exceptions raised by method are raised
+
+	Returns:
+		tuple: (object path, object id, result)
+			- calc_fixity results are returned as True, as digests are written to object inventory
+			- if method raises exception, and not raise_errors, result is {'error': message}
+	'''
+
+	obj_id = None
+	try:
+
+		# init Storage Root once per process
+		if type(sr) == tuple:
+			sr_args = sr
+			if sr_args not in _process_storage_roots:
+				sr_path, storage, storage_id_algo, digest_cache, object_index = sr_args
+				_process_storage_roots[sr_args] = OCFLStorageRoot(
+					sr_path,
+					storage=storage,
+					storage_id_algo=storage_id_algo,
+					digest_cache=digest_cache,
+					object_index=object_index)
+			sr = _process_storage_roots[sr_args]
+
+		# init object and run method
+		obj = OCFLObject(obj_path, storage_root=sr, **(obj_kwargs or {}))
+		obj_id = obj.id
+		result = getattr(obj, method)(**method_kwargs)
+		if method == 'calc_fixity':
+			result = True
+
+	except Exception as e:
+		logger.debug('%s failed for %s: %s' % (method, obj_path, e))
+		if raise_errors:
+			raise
+		result = {'error':str(e)}
+
+	return obj_path, obj_id, result
+
+
+
+def _map_bounded(executor, func, iterable, max_pending):
+
+	'''
+	Generator of func applied to items of iterable in executor, yielding results in order
+		- unlike executor.map, items are submitted as results are consumed, bounding tasks in flight,
+		e.g. for objects with hundreds of thousands of files
+
+	Args:
+		executor (concurrent.futures.Executor): executor to submit to
+		func (callable): function of one item
+		iterable (iterable): items, consumed lazily
+		max_pending (int): maximum tasks submitted and not yet yielded
+	'''
+
+	pending = collections.deque()
+	for item in iterable:
+		pending.append(executor.submit(func, item))
+		if len(pending) >= max_pending:
+			yield pending.popleft().result()
+	while len(pending) > 0:
+		yield pending.popleft().result()
+
+
+
+class _SizeDigest(object):
+
+	'''
+	Class with hashlib interface, counting bytes for size fixity algorithm
+	'''
+
+	block_size = 64
+
+	def __init__(self):
+		self.size = 0
+
+	def update(self, data):
+		self.size += len(data)
+
+	def hexdigest(self):
+		return str(self.size)
+
+
+
+def _new_digests(file_digest_algos):
+
+	'''
+	Function to return new digest for each algorithm, from hashlib, or size
+
+	Returns:
+		dict: {algorithm: digest}
+	'''
+
+	digests = {}
+	for file_digest_algo in file_digest_algos:
+		if file_digest_algo == INVENTORY_FILE_SIZE_FIXITY_ALGO:
+			digests[file_digest_algo] = _SizeDigest()
+			continue
+
+		# get file_digest_algo function
+		digest_func = getattr(hashlib, file_digest_algo, None)
+		if digest_func == None:
+			raise Exception('algorithm "%s" is not part of hashlib library' % file_digest_algo)
+		digests[file_digest_algo] = digest_func()
+	return digests
+
+
+
+def _unique_id():
+
+	'''
+	Function to return unique hex identifier, e.g. for temporary directories
+	'''
+
+	import uuid
+	return uuid.uuid4().hex
+
+
+
+def _write_file_atomic(filepath, data):
+
+	'''
+	Function to write bytes to temporary file in same directory, then rename over filepath
+		- readers see either previous or complete file
+
+	Args:
+		filepath (str): target filepath
+		data (bytes): file content
+	'''
+
+	tmp_filepath = '%s.%s.tmp' % (filepath, _unique_id())
+	try:
+		with open(tmp_filepath, 'wb') as f:
+			f.write(data)
+		os.replace(tmp_filepath, filepath)
+	except:
+		if os.path.exists(tmp_filepath):
+			os.remove(tmp_filepath)
+		raise
+
+
+
+# Linux ioctl for copy-on-write file clone
+FICLONE = 0x40049409
+
+
+def _reflink_file(src, target):
+
+	'''
+	Function to clone file with copy-on-write reflink, falling back to copy
+
+	Args:
+		src (str): source filepath
+		target (str): target filepath
+	'''
+
+	# attempt reflink on supporting platforms and filesystems
+	if fcntl != None and sys.platform.startswith('linux'):
+		try:
+			with open(src, 'rb') as f_src, open(target, 'wb') as f_target:
+				fcntl.ioctl(f_target.fileno(), FICLONE, f_src.fileno())
+			return
+		except OSError:
+			pass
+
+	# fallback to copy
+	shutil.copyfile(src, target)
 
 
 
@@ -483,7 +1159,11 @@ class OCFLObject(object):
 		conformance=DEFAULT_OBJECT_CONFORMANCE,
 		version=DEFAULT_OBJECT_VERSION,
 		file_digest_algo=DEFAULT_OBJECT_FILE_DIGEST_ALGO,
-		fixity_algo=DEFAULT_OBJECT_FILE_FIXITY_ALGO):
+		fixity_algo=DEFAULT_OBJECT_FILE_FIXITY_ALGO,
+		digest_cache=None,
+		compact_inventory=False,
+		compact_json=False,
+		throttle=None):
 
 		'''
 		Args:
@@ -491,6 +1171,12 @@ class OCFLObject(object):
 			storage_root (OCFLStorageRoot): instance of Storage Root
 				- if storage_root == None, assume self.path is full_path from cwd
 			file_digest_algo (str): hashing algorithim, ['md5','sha256','sha512']
+			digest_cache (str,OCFLDigestCache): Optional digest cache, path of SQLite file or instance
+				- if None, digest cache of Storage Root is used if present
+			compact_inventory (bool): If True, parse inventory.json to read-only OCFLCompactInventory
+				- expanded to OCFLObjectInventory automatically before object is updated
+			compact_json (bool): If True, write inventories without indentation or whitespace
+			throttle (OCFLThrottle): Optional limit on bytes and files read per second when hashing, e.g. for background fixity checks
 		'''
 
 		self.conformance = conformance
@@ -506,6 +1192,21 @@ class OCFLObject(object):
 		# if storage_root is provided
 		self.storage_root = storage_root
 
+		# init digest cache
+		if type(digest_cache) == str:
+			digest_cache = OCFLDigestCache(digest_cache)
+		self._digest_cache = digest_cache
+
+		# throttle for reading files
+		self.throttle = throttle
+
+		# inventory, parsed on load or first access
+		self.compact_inventory = compact_inventory
+		self.compact_json = compact_json
+		self._object_inventory = None
+		self._id = None
+		self._nam_d_dec = None
+
 		# if storage_root is present and auto_load
 		if self.full_path != None and auto_load:
 			self.parse_object()
@@ -516,9 +1217,48 @@ class OCFLObject(object):
 
 		'''
 		Return id from inventory
+			- if inventory not yet parsed, id is read without parsing full inventory
+		'''
+
+		if self._object_inventory != None:
+			return self._object_inventory.id
+		if self._id == None:
+			self._id = self.read_id()
+		return self._id
+
+
+	@property
+	def nam_d_dec(self):
+
+		'''
+		Property to return Namaste directory type, read on load or first access, see is_ocfl_object
+		'''
+
+		if self._nam_d_dec == None:
+			self._nam_d_dec = self.is_ocfl_object()
+		return self._nam_d_dec
+
+
+	@nam_d_dec.setter
+	def nam_d_dec(self, nam_d_dec):
+		self._nam_d_dec = nam_d_dec
+
+
+	@property
+	def object_inventory(self):
+
+		'''
+		Property to return OCFLObjectInventory, parsing inventory.json on first access
 		'''
 
-		return self.object_inventory.inventory['id']
+		if self._object_inventory == None and self.full_path != None and os.path.exists(os.path.join(self.full_path, 'inventory.json')):
+			self._parse_object_inventory()
+		return self._object_inventory
+
+
+	@object_inventory.setter
+	def object_inventory(self, object_inventory):
+		self._object_inventory = object_inventory
 
 
 	@property
@@ -534,6 +1274,21 @@ class OCFLObject(object):
 			return self.path
 
 
+	@property
+	def digest_cache(self):
+
+		'''
+		Property to return digest cache of object, falling back to Storage Root
+		'''
+
+		if self._digest_cache != None:
+			return self._digest_cache
+		elif self.storage_root != None:
+			return getattr(self.storage_root, 'digest_cache', None)
+		else:
+			return None
+
+
 	@property
 	def exists(self):
 
@@ -587,6 +1342,7 @@ class OCFLObject(object):
 		if self.exists:
 
 			# attempt to read and parse namaste tags
+			import namaste
 			nam_d = namaste.get_types(self.full_path)
 
 			# single type
@@ -625,48 +1381,176 @@ class OCFLObject(object):
 		self._parse_object_inventory()
 
 
-	def _parse_object_inventory(self):
+	def _parse_object_inventory(self, compact=None):
 
 		'''
 		Method to parse path of inventory
+
+		Args:
+			compact (bool): If True, parse to OCFLCompactInventory, defaulting to self.compact_inventory
 		'''
 
-		with open('%s/inventory.json' % self.full_path,'r') as f:
-			self.object_inventory = OCFLObjectInventory(inventory=f.read())
+		# determine representation
+		if compact == None:
+			compact = self.compact_inventory
+
+		with metrics.timer('inventory_parse'), open('%s/inventory.json' % self.full_path,'r') as f:
+			if compact:
+				self.object_inventory = OCFLCompactInventory(inventory=f.read())
+			else:
+				self.object_inventory = OCFLObjectInventory(inventory=f.read())
 
 
-	def _list_files(self, path, files_only=False):
+	def _expand_inventory(self):
 
 		'''
-		Method to return generator of recursive files/directories
+		Method to replace read-only OCFLCompactInventory with OCFLObjectInventory, before modification
 		'''
 
-		for root, folders, files in os.walk(path):
-			if files_only:
-				for filename in files:
-					yield os.path.join(root, filename)
-			else:
-				for filename in folders + files:
-					yield os.path.join(root, filename)
+		# if not yet parsed, parse as OCFLObjectInventory
+		if self._object_inventory == None:
+			if self.full_path != None and os.path.exists(os.path.join(self.full_path, 'inventory.json')):
+				self._parse_object_inventory(compact=False)
 
+		elif isinstance(self._object_inventory, OCFLCompactInventory):
+			self.object_inventory = self._object_inventory.to_inventory()
 
-	def new(self, obj_id=None, dec_readme=None, v1_msg=None):
+
+	def read_id(self, chunk_size=65536):
+
+		'''
+		Method to read id from inventory.json without parsing full inventory
+			- parses top-level object incrementally, member by member, until id key is found
+			- falls back to full parse if not found
+
+		Args:
+			chunk_size (int): bytes to read per chunk
+
+		Returns:
+			str: object id
+		'''
+
+		decoder = json.JSONDecoder()
+		utf8 = codecs.getincrementaldecoder('utf-8')()
+		whitespace = re.compile(r'\s*')
+
+		with open(os.path.join(self.full_path, 'inventory.json'), 'rb') as f:
+
+			buf = ''
+			eof = False
+			def read_more(min_bytes=1, to_eof=False):
+				nonlocal buf, eof
+				if to_eof:
+					buf += utf8.decode(f.read(), final=True)
+					eof = True
+					return
+				chunks = []
+				read = 0
+				while not eof and read < min_bytes:
+					chunk = f.read(chunk_size)
+					eof = chunk == b''
+					chunks.append(chunk)
+					read += len(chunk)
+				buf += utf8.decode(b''.join(chunks), final=eof)
+
+			# parse top-level object member by member, decoding values whole to skip nested content
+			# an incomplete value is retried with buffer doubled, or once large, decoded once from the remaining file,
+			# so an id after large nested values costs no more than a full parse
+			state = '{'
+			pos = 0
+			while True:
+				pos = whitespace.match(buf, pos).end()
+				if pos >= len(buf):
+					if eof:
+						break
+					read_more()
+					continue
+
+				# punctuation
+				if state in ['{', ':', ',']:
+					char = buf[pos]
+					if state == '{' and char == '{':
+						state = 'key'
+					elif state == ':' and char == ':':
+						state = 'value'
+					elif state == ',' and char == ',':
+						state = 'key'
+					else:
+						break
+					pos += 1
+					buf, pos = buf[pos:], 0
+					continue
+
+				# key or value
+				try:
+					value, end = decoder.raw_decode(buf, pos)
+					if end >= len(buf) and not eof and type(value) in [int, float]:
+						raise ValueError('number may continue in next chunk')
+				except ValueError:
+					if eof:
+						break
+					read_more(min_bytes=len(buf) - pos, to_eof=len(buf) - pos >= 65536)
+					continue
+				pos = end
+				if state == 'key':
+					if type(value) != str:
+						break
+					key = value
+					state = ':'
+				else:
+					if key == 'id':
+						return value
+					state = ','
+
+		# fallback to full parse
+		return self.object_inventory.id
+
+
+	def _list_files(self, path, files_only=False):
+
+		'''
+		Method to return generator of recursive files/directories
+		'''
+
+		for root, folders, files in os.walk(path):
+			if files_only:
+				for filename in files:
+					yield os.path.join(root, filename)
+			else:
+				for filename in folders + files:
+					yield os.path.join(root, filename)
+
+
+	def new(self, obj_id=None, dec_readme=None, v1_msg=None, storage_root=None, workers=None):
 
 		'''
 		Method to create OCFL Object from self.path
+
+		Args:
+			obj_id (str): If provided, id of object, else unique id is created
+			dec_readme (str): If provided, written as optional text file with Object declaration
+			v1_msg (str): If provided, message of v1
+			storage_root (OCFLStorageRoot): If provided, create object in Storage Root, leaving self.path unchanged
+				- content files are hashed as they are copied to v1, and inventories written from those digests,
+				so each source byte is read once
+			workers (int): If greater than 1, copy files concurrently with a thread pool of this size
 		'''
 
 		# confirm not already an OCFL object
 		if self.is_ocfl_object():
 			raise Exception('%s appears to already be an OCFL object, aborting' % self.path)
 
+		# create in Storage Root
+		if storage_root != None:
+			return self._new_in_storage_root(storage_root, obj_id=obj_id, dec_readme=dec_readme, v1_msg=v1_msg, workers=workers)
+
 		# if path is None, create uuid
 		if self.path == None:
 			logger.debug('path not provided, creating unique directory')
-			self.path = '%s' % (uuid.uuid4().hex)
+			self.path = '%s' % (_unique_id())
 
 		# create temporary v1 dir name
-		v1t = uuid.uuid4().hex
+		v1t = _unique_id()
 		v1t_full = os.path.join(self.full_path, v1t)
 
 		# create v1 directory
@@ -692,7 +1576,7 @@ class OCFLObject(object):
 		self.object_inventory.new(**inv_kwargs)
 
 		# set v1 message
-		self.object_inventory.inventory['versions']['v1']['message'] = v1_msg
+		self.object_inventory.set_version_message('v1', v1_msg)
 
 		# write Object declaration file
 		open('%s/0=%s_%s' % (self.full_path, self.conformance, self.version), 'w').close()
@@ -706,32 +1590,196 @@ class OCFLObject(object):
 		self.update()
 
 
+	def _new_in_storage_root(self, storage_root, obj_id=None, dec_readme=None, v1_msg=None, workers=None):
+
+		'''
+		Method to create OCFL Object in Storage Root from self.path, copying and hashing content in a single read, see new
+		'''
+
+		if self.path == None or not os.path.isdir(self.full_path):
+			raise Exception('path of directory to create object from is required with storage_root')
+
+		# init inventory and create new
+		self.object_inventory = OCFLObjectInventory()
+		inv_kwargs = {
+				'digestAlgorithm':self.file_digest_algo
+			}
+		if obj_id != None:
+			inv_kwargs['id'] = obj_id
+		self.object_inventory.new(**inv_kwargs)
+		self.object_inventory.set_version_message('v1', v1_msg)
+
+		# prepare storage path, and create dir
+		storage_path = storage_root._calc_storage_path(storage_root._calc_storage_id(self.id))
+		os.makedirs(os.path.join(storage_root.path, storage_path))
+
+		# copy material as v1 content, hashing in same read
+		digest_d = self.copy_object(os.path.join(storage_root.path, storage_path), workers=workers, raw=True)
+
+		# object now at storage path
+		self.storage_root = storage_root
+		self.path = storage_path
+
+		# write Object declaration file
+		open('%s/0=%s_%s' % (self.full_path, self.conformance, self.version), 'w').close()
+
+		# write as optional text file
+		if dec_readme is not None:
+			with open('%s/%s_%s.txt' % (self.full_path, self.conformance, self.version), 'w') as f:
+				f.write(dec_readme)
+
+		# update, with digests from copy
+		self.update(digests=digest_d, workers=workers)
+
+
 	def _calc_file_digest(self, filepath, file_digest_algo=DEFAULT_OBJECT_FILE_DIGEST_ALGO):
 
 		'''
 		Method to generate digests for filepath
 		'''
 
-		# get file_digest_algo function
-		digest_func = getattr(hashlib, file_digest_algo)
+		return self._calc_file_multi_digest(filepath, [file_digest_algo])[file_digest_algo]
+
+
+	def _calc_file_multi_digest(self, filepath, file_digest_algos):
+
+		'''
+		Method to generate digests for filepath with multiple algorithms, reading file once
+
+		Args:
+			filepath (str): path of file to digest
+			file_digest_algos (list): hashlib algorithms, e.g. ['md5','sha512']
+
+		Returns:
+			dict: {algorithm: hexdigest}
+		'''
+
+		# init digest for each algorithm
+		digests = _new_digests(file_digest_algos)
+
+		# read file in chunks, feeding each chunk to all digests
+		chunk_size = 128 * max([ digest.block_size for digest in digests.values() ])
+		throttle = self.throttle
+		if throttle != None:
+			throttle.consume(files=1)
+		with open(filepath, 'rb') as f:
+			for chunk in iter(lambda: f.read(chunk_size), b''):
+				for digest in digests.values():
+					digest.update(chunk)
+				if throttle != None:
+					throttle.consume(nbytes=len(chunk))
+			if metrics.enabled:
+				metrics.incr('files_hashed')
+				metrics.incr('bytes_hashed', f.tell())
+
+		return { file_digest_algo:digest.hexdigest() for file_digest_algo,digest in digests.items() }
 
-		# if file_digest_algo exists, use
-		if digest_func != None:
 
-			# init
-			digest = digest_func()
+	def _copy_file_multi_digest(self, filepath, target_filepath, file_digest_algos):
 
-			# read file in chunks
-			with open(filepath, 'rb') as f:
-				for chunk in iter(lambda: f.read(128 * digest.block_size), b''):
+		'''
+		Method to copy file, generating digests with multiple algorithms from the bytes copied
+
+		Args:
+			filepath (str): path of file to copy
+			target_filepath (str): path of copy
+			file_digest_algos (list): hashlib algorithms, e.g. ['md5','sha512']
+
+		Returns:
+			dict: {algorithm: hexdigest}
+		'''
+
+		# init digest for each algorithm
+		digests = _new_digests(file_digest_algos)
+
+		# read into reused buffer, feeding each chunk to all digests and the copy
+		buf = bytearray(DEFAULT_OBJECT_READ_CHUNK_SIZE)
+		view = memoryview(buf)
+		throttle = self.throttle
+		if throttle != None:
+			throttle.consume(files=1)
+		with open(filepath, 'rb') as f, open(target_filepath, 'wb') as target:
+			for n in iter(lambda: f.readinto(buf), 0):
+				chunk = view[:n]
+				for digest in digests.values():
 					digest.update(chunk)
-			return digest.hexdigest()
+				target.write(chunk)
+				if throttle != None:
+					throttle.consume(nbytes=n)
+			if metrics.enabled:
+				metrics.incr('files_hashed')
+				metrics.incr('bytes_hashed', f.tell())
+				metrics.incr('files_copied')
+		shutil.copystat(filepath, target_filepath)
+
+		return { file_digest_algo:digest.hexdigest() for file_digest_algo,digest in digests.items() }
 
+
+	def copy_object(self, target_path, file_digest_algo=None, workers=None, raw=False):
+
+		'''
+		Method to copy object to directory, generating digests of content files in the same read
+			- inventories, declarations, and other files outside version content are copied only
+
+		Args:
+			target_path (str): directory to copy object to
+			file_digest_algo (str,list): hashlib algorithm, or list of algorithms, defaults to object's
+			workers (int): If greater than 1, copy files concurrently with a thread pool of this size
+			raw (bool): If True, self.path is a directory not yet an object, and all files are copied as v1 content
+
+		Returns:
+			dict: {algorithm: {digest: [files]}} for content files, relative to object, see calc_file_digests
+		'''
+
+		# if file_digest_algo not passed, use from self
+		if file_digest_algo == None:
+			file_digest_algo = self.file_digest_algo
+		if type(file_digest_algo) == str:
+			file_digest_algos = [file_digest_algo]
 		else:
-			raise Exception('algorithm "%s" is not part of hashlib library' % file_digest_algo)
+			file_digest_algos = list(dict.fromkeys(file_digest_algo))
+
+		# create directories, and generator of (source file, file relative to object)
+		target_prefix = 'v1/content' if raw else ''
+		def files():
+			for root, folders, filenames in os.walk(self.full_path):
+				rel_root = os.path.relpath(root, self.full_path)
+				os.makedirs(os.path.join(target_path, target_prefix, rel_root), exist_ok=True)
+				for filename in filenames:
+					src = os.path.join(root, filename)
+					yield src, os.path.normpath(os.path.join(target_prefix, rel_root, filename))
+
+		# copy file, hashing if version content
+		def copy_file(src_f):
+			src, f = src_f
+			target = os.path.join(target_path, f)
+			if re.match(r'^v\d+/content/', f):
+				return f, self._copy_file_multi_digest(src, target, file_digest_algos)
+			shutil.copy2(src, target)
+			return f, None
+
+		# copy concurrently if workers set, results returned in walk order for deterministic output
+		digest_d = { algo:{} for algo in file_digest_algos }
+		executor = None
+		if workers != None and workers > 1:
+			executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+			results = _map_bounded(executor, copy_file, files(), workers * 2)
+		else:
+			results = map(copy_file, files())
+		try:
+			for f, digests in results:
+				if digests != None:
+					for algo,digest in digests.items():
+						digest_d[algo].setdefault(digest, []).append(f)
+		finally:
+			if executor != None:
+				executor.shutdown()
+
+		logger.debug('copied %s to %s' % (self.full_path, target_path))
+		return digest_d
 
 
-	def calc_file_digests(self, path_list, version_state=False, file_digest_algo=None):
+	def calc_file_digests(self, path_list, version_state=False, file_digest_algo=None, use_digest_cache=True, workers=None):
 
 		'''
 		Method to generate digest of files
@@ -739,29 +1787,53 @@ class OCFLObject(object):
 		Args:
 			path_list (list): List of paths to walk and generate digests
 			version_state (bool): If True, will remove version paths, resulting in relative manifest
-		'''
+			file_digest_algo (str,list): hashlib algorithm, or list of algorithms to calculate in a single read of each file
+			use_digest_cache (bool): If True and digest cache is configured, only hash files with new or changed stat
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
 
-		# init dictionary to return
-		digest_d = {}
+		Returns:
+			dict: {digest: [files]} if single algorithm, else {algorithm: {digest: [files]}}
+		'''
 
 		# if file_digest_algo not passed, use from self
 		if file_digest_algo == None:
 			file_digest_algo = self.file_digest_algo
 
-		# loop through provided paths
-		for path in path_list:
+		# normalize to list of unique algorithms
+		if type(file_digest_algo) == str:
+			file_digest_algos = [file_digest_algo]
+		else:
+			file_digest_algos = list(dict.fromkeys(file_digest_algo))
+
+		# init dictionary to return
+		digest_d = { algo:{} for algo in file_digest_algos }
 
-			# strip path
-			path = path.rstrip('/')
+		# get digest cache
+		digest_cache = self.digest_cache if use_digest_cache else None
 
-			# get list of files
-			files = self._list_files(path, files_only=True)
+		# generator of files across provided paths, paired with stripped path
+		files = ( (path, f) for path in [ path.rstrip('/') for path in path_list ] for f in self._list_files(path, files_only=True) )
 
-			# loop through
-			for f in files:
+		# calc digests, using cache if available
+		def calc_digests(path_f):
+			path, f = path_f
+			if digest_cache != None:
+				return path, f, digest_cache.calc_file_multi_digest(f, file_digest_algos, self._calc_file_multi_digest)
+			else:
+				return path, f, self._calc_file_multi_digest(f, file_digest_algos)
+
+		# hash concurrently if workers set, results returned in walk order for deterministic output
+		executor = None
+		if workers != None and workers > 1:
+			executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+			results = _map_bounded(executor, calc_digests, files, workers * 2)
+		else:
+			results = map(calc_digests, files)
+
+		try:
 
-				# calc digest
-				digest = self._calc_file_digest(f, file_digest_algo=file_digest_algo)
+			# loop through
+			for path, f, digests in results:
 
 				# if for version, make path relative
 				if version_state:
@@ -769,188 +1841,438 @@ class OCFLObject(object):
 				else:
 					f = f.replace('%s/' % self.full_path.rstrip('/'), '')
 
-				# DEBUG
-				logger.debug('%s : %s' % (f, digest))
+				for algo,digest in digests.items():
 
-				# add to dictioanry
-				if digest not in digest_d:
-					digest_d[digest] = [f]
-				else:
-					digest_d[digest].append(f)
+					# add to dictioanry
+					if digest not in digest_d[algo]:
+						digest_d[algo][digest] = [f]
+					else:
+						digest_d[algo][digest].append(f)
+
+		finally:
+			if executor != None:
+				executor.shutdown()
 
 		# return
-		return digest_d
+		if type(file_digest_algo) == str:
+			return digest_d[file_digest_algo]
+		else:
+			return digest_d
 
 
 	def update(self,
 		write_inventories=True,
 		reconcile_deltas=True,
-		calc_fixity=False):
+		calc_fixity=False,
+		incremental=False,
+		workers=None,
+		digests=None):
 
 		'''
 		Method to update object
 			- reconcile versions
 				- remove files if not forward-delta
 			- udpate inventory meta-digests
+
+		Args:
+			incremental (bool): If True, trust inventory for versions already recorded, hashing only new versions
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
+			digests (dict): Optional digests of all content files, used instead of hashing, see write_inventories
 		'''
 
-		# debug
-		stime = time.time()
+		with metrics.timer('update'):
+
+			# inventory will be modified
+			self._expand_inventory()
 
-		# write inventories
-		if write_inventories:
-			self.write_inventories()
+			# write inventories, calculating fixity in the same pass if requested
+			# if reconciling, inventory files are written once after reconciliation
+			if write_inventories:
+				with metrics.timer('update_write_inventories'):
+					if calc_fixity:
+						self.write_inventories(fixity_algos=[self.fixity_algo], incremental=incremental, workers=workers, write=not reconcile_deltas, digests=digests)
+					else:
+						self.write_inventories(incremental=incremental, workers=workers, write=not reconcile_deltas, digests=digests)
 
-		# reconcile deltas
-		if reconcile_deltas:
-			self.reconcile_deltas()
+			# reconcile deltas
+			if reconcile_deltas:
+				with metrics.timer('update_reconcile_deltas'):
+					self.reconcile_deltas(write=not write_inventories)
+				if write_inventories:
+					self._write_inventory_files()
 
-		# update fixity
-		if calc_fixity:
-			self.calc_fixity(fixity_algo=self.fixity_algo)
+			# update fixity
+			if calc_fixity and not write_inventories:
+				with metrics.timer('update_calc_fixity'):
+					self.calc_fixity(fixity_algo=self.fixity_algo, workers=workers)
 
-		# debug
-		logger.debug('updated elapsed: %s' % (time.time()-stime))
+			# update Storage Root object index
+			if self.storage_root != None and getattr(self.storage_root, 'object_index', None) != None:
+				with metrics.timer('update_index_object'):
+					self.storage_root.object_index.index_object(self)
 
 
-	def write_inventories(self):
+	def write_inventories(self, fixity_algos=None, incremental=False, workers=None, write=True, digests=None, use_digest_cache=True):
 
 
 		'''
 		Method to wrap the calculation of file digests and writing of inventories
+			- each content file is read once, with manifest, version state, and fixity derived from the same digests
+
+		Args:
+			fixity_algos (list): If provided, fixity digests for these algorithms are calculated
+				in the same read of each file as the manifest digests
+			incremental (bool): If True, trust inventory for versions already recorded with state,
+				and hash only version directories not yet in inventory
+				- falls back to hashing all versions if manifest or fixity algorithms lack pre-existing digests
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
+			write (bool): If False, update inventory in memory only, see _write_inventory_files
+			digests (dict): Optional {algorithm: {digest: [files]}} of all content files, e.g. from copy_object,
+				used instead of hashing, and must include manifest and fixity algorithms
+			use_digest_cache (bool): If False, bypass digest cache and read all content
 		'''
 
+		# inventory will be modified
+		self._expand_inventory()
+
 		# get versions from fs
 		fs_versions = sorted(self.get_fs_version_numbers())
 
-		# calc object files manifest
-		self.object_inventory.inventory['manifest'] = self.calc_file_digests([ os.path.join(self.full_path,'v%s/content' % v) for v in fs_versions ])
+		# determine versions to hash
+		if digests != None:
+			incremental = False
+			hash_versions = fs_versions
+		elif incremental and self._can_write_incrementally(fixity_algos):
+			hash_versions = self.get_untracked_version_numbers(fs_versions)
+			logger.debug('incremental update, hashing versions: %s' % hash_versions)
+		else:
+			incremental = False
+			hash_versions = fs_versions
+
+		# determine algorithms to calculate in single pass
+		digest_algos = [self.file_digest_algo]
+		if fixity_algos != None:
+			digest_algos.extend(fixity_algos)
+
+		# calc object files manifest, and fixity, unless provided
+		if digests != None:
+			missing_algos = [ algo for algo in digest_algos if algo not in digests ]
+			if len(missing_algos) > 0:
+				raise Exception('digests not provided for algorithms: %s' % missing_algos)
+			digest_d = digests
+		else:
+			digest_d = self.calc_file_digests([ os.path.join(self.full_path,'v%s/content' % v) for v in hash_versions ], file_digest_algo=digest_algos, use_digest_cache=use_digest_cache, workers=workers)
+		manifest_d = digest_d[self.file_digest_algo]
+
+		# sizes of hashed files
+		sizes_d = { f:os.stat(os.path.join(self.full_path, f)).st_size for files in manifest_d.values() for f in files }
+
+		# merge with pre-existing manifest, fixity, and sizes
+		if incremental:
+			self.object_inventory.set_manifest(self._merge_digests(self.object_inventory.manifest, manifest_d))
+			self.object_inventory.update_file_sizes(sizes_d)
+			if fixity_algos != None:
+				self.object_inventory.update_fixity({
+					algo:self._merge_digests(self.object_inventory.fixity[algo], digest_d[algo]) for algo in fixity_algos
+				})
+
+		# else, replace
+		else:
+			self.object_inventory.set_manifest(manifest_d)
+			self.object_inventory.update_file_sizes(sizes_d, replace=True)
+			if fixity_algos != None:
+				self.object_inventory.update_fixity({
+					algo:self._merge_digests({}, digest_d[algo]) for algo in fixity_algos
+				})
+
+		# set version state for versions not yet recorded, derived from manifest paths of hashed versions
+		# state of recorded versions is kept, as it cannot be derived from reconciled content
+		state_versions = self.get_untracked_version_numbers(hash_versions)
+		states = { 'v%s' % v:{} for v in state_versions }
+		for digest,files in manifest_d.items():
+			for f in files:
+				v_key, content_dir, filepath = f.split('/', 2)
+				if v_key not in states:
+					continue
+				if digest not in states[v_key]:
+					states[v_key][digest] = [filepath]
+				else:
+					states[v_key][digest].append(filepath)
+		for v in state_versions:
+			self.object_inventory.update_version_state('v%s' % v, states['v%s' % v])
+
+		# write inventory files
+		if write:
+			self._write_inventory_files()
 
-		# set version state
-		for v in fs_versions:
-			self.object_inventory.update_version_state(
-				'v%s' % v, self.calc_file_digests([os.path.join(self.full_path,'v%s/content' % v)], version_state=True)
-			)
 
-		# write inventory
-		with open(os.path.join(self.full_path,'inventory.json'), 'w') as f:
-			f.write(json.dumps(self.object_inventory.inventory, sort_keys=True, indent=4))
+	def _write_inventory_files(self, force=False):
+
+		'''
+		Method to write inventory.json and version inventories, with digest sidecars
+			- only inventories changed since last write, or missing from disk, are written
+			- each inventory is serialized once, hashed in memory, and written atomically
+
+		Args:
+			force (bool): If True, write all inventories
+		'''
 
-		# write object inventory digest
-		inventory_digest = self._calc_file_digest(os.path.join(self.full_path,'inventory.json'), file_digest_algo=self.file_digest_algo)
-		with open(os.path.join(self.full_path,'inventory.json.%s' % self.file_digest_algo), 'w') as f:
-			f.write(inventory_digest)
+		object_inventory = self.object_inventory
 
-		# write version manifests
-		for k,v in self.object_inventory.inventory['versions'].items():
+		with metrics.timer('inventory_write'):
 
-			# create path
-			v_inv_path = os.path.join(self.full_path, k, 'inventory.json')
+			# write inventory
+			if force or object_inventory.is_dirty or not os.path.exists(os.path.join(self.full_path, 'inventory.json')):
+				object_inventory.save(self.full_path, digest_algo=self.file_digest_algo, compact=self.compact_json)
 
-			# write to fs
-			with open(v_inv_path, 'w') as f:
-				f.write(json.dumps(v, sort_keys=True, indent=4))
+			# write version inventories
+			for v_key in object_inventory.inventory['versions'].keys():
+				if force or v_key in object_inventory.dirty_versions or not os.path.exists(os.path.join(self.full_path, v_key, 'inventory.json')):
+					object_inventory.save_version(self.full_path, v_key, digest_algo=self.file_digest_algo, compact=self.compact_json)
 
-			# get and write digest
-			v_inventory_digest = self._calc_file_digest(v_inv_path, file_digest_algo=self.file_digest_algo)
-			with open('%s.%s' % (v_inv_path, self.file_digest_algo), 'w') as f:
-				f.write(v_inventory_digest)
+			object_inventory.mark_clean()
 
 
-	def reconcile_deltas(self):
+	def add_version(self, source_dir, message=None, workers=None):
 
 		'''
-		Method to reconcile forward deltas
-			- REQUIRED: inventory.json is current
+		Method to add new version from directory of files, copying only content not already stored in object
+			- source directory is hashed and compared against digests in manifest
+			- only files with new digests are copied to new version content, remaining files recorded in state only
 
-		Approach:
-			- begin with v2, work forwards
+		Args:
+			source_dir (str): directory of files representing full state of new version
+			message (str): message for version
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
+
+		Returns:
+			str: new version, e.g. 'v2'
 		'''
 
-		# get versions from inventory
-		v_nums = self.object_inventory.get_version_numbers()
+		# inventory will be modified
+		self._expand_inventory()
+
+		# determine new version
+		v_num = max(self.object_inventory.get_version_numbers() + self.get_fs_version_numbers()) + 1
+		v_key = 'v%s' % v_num
+		logger.debug('adding version %s from %s' % (v_key, source_dir))
+
+		# hash source directory, with fixity algorithms already used by object in same read
+		source_dir = source_dir.rstrip('/')
+		digest_algo = self.object_inventory.digestAlgorithm
+		fixity_algos = [ algo for algo in (self.object_inventory.fixity or {}).keys() if algo != INVENTORY_FILE_SIZE_FIXITY_ALGO ]
+		digest_d = self.calc_file_digests([source_dir], version_state=True, file_digest_algo=[digest_algo] + fixity_algos, workers=workers)
+		state = digest_d[digest_algo]
+
+		# copy files with digests not yet in manifest to temporary version directory
+		manifest = self.object_inventory.manifest
+		v_tmp = os.path.join(self.full_path, _unique_id())
+		os.makedirs(os.path.join(v_tmp, 'content'))
+		new_filepaths = {}
+		for digest,filepaths in state.items():
+			if digest not in manifest:
+				filepath = filepaths[0]
+				target = os.path.join(v_tmp, 'content', filepath)
+				os.makedirs(os.path.dirname(target), exist_ok=True)
+				shutil.copyfile(os.path.join(source_dir, filepath), target)
+				new_filepaths[filepath] = digest
+
+		# rename temporary version directory
+		os.rename(v_tmp, os.path.join(self.full_path, v_key))
+		if metrics.enabled:
+			metrics.incr('files_copied', len(new_filepaths))
+		logger.debug('%s: copied %s new files, %s files already stored' % (v_key, len(new_filepaths), sum([ len(filepaths) for filepaths in state.values() ]) - len(new_filepaths)))
+
+		# update manifest and fixity with new files
+		self.object_inventory.set_manifest(self._merge_digests(manifest, {
+			digest:['%s/content/%s' % (v_key, filepath)] for filepath,digest in new_filepaths.items()
+		}))
+		self.object_inventory.update_file_sizes({
+			'%s/content/%s' % (v_key, filepath):os.stat(os.path.join(self.full_path, v_key, 'content', filepath)).st_size for filepath in new_filepaths.keys()
+		})
+		for algo in fixity_algos:
+			algo_digests = { filepath:digest for digest,filepaths in digest_d[algo].items() for filepath in filepaths }
+			new_fixity_d = {}
+			for filepath in new_filepaths.keys():
+				new_fixity_d.setdefault(algo_digests[filepath], []).append('%s/content/%s' % (v_key, filepath))
+			self.object_inventory.update_fixity({ algo:self._merge_digests(self.object_inventory.fixity[algo], new_fixity_d) })
+
+		# update version state, message, and head
+		self.object_inventory.update_version_state(v_key, state)
+		self.object_inventory.set_version_message(v_key, message)
+		self.object_inventory.set_head(v_key)
+
+		# write inventory files
+		self._write_inventory_files()
+
+		# update Storage Root object index
+		if self.storage_root != None and getattr(self.storage_root, 'object_index', None) != None:
+			self.storage_root.object_index.index_object(self)
+
+		return v_key
+
+
+	def _can_write_incrementally(self, fixity_algos=None):
 
-		# if versioned
-		if len(v_nums) > 1:
+		'''
+		Method to determine if pre-existing inventory digests can be trusted for incremental update
+
+		Args:
+			fixity_algos (list): fixity algorithms that will be calculated
 
-			# pop v1
-			v_nums.remove(1)
+		Returns:
+			bool
+		'''
+
+		# manifest must exist, with same algorithm
+		if self.object_inventory.manifest == None or self.object_inventory.digestAlgorithm != self.file_digest_algo:
+			return False
 
-			# loop through versions
-			for i,v_num in enumerate(v_nums):
+		# fixity blocks must exist for requested algorithms
+		if fixity_algos != None:
+			fixity = self.object_inventory.fixity or {}
+			for algo in fixity_algos:
+				if algo not in fixity:
+					return False
 
-				logger.debug('reconcialing v%s' % v_num)
+		return True
+
+
+	def get_untracked_version_numbers(self, fs_versions=None):
+
+		'''
+		Method to return versions present on disk but not yet recorded with state in inventory
+
+		Args:
+			fs_versions (list): version numbers from filesystem, read if not provided
+		'''
+
+		if fs_versions == None:
+			fs_versions = self.get_fs_version_numbers()
+
+		untracked = []
+		for v in sorted(fs_versions):
+			v_dict = self.object_inventory.get_version_entry(v)
+			if v_dict == None or not v_dict.get('state'):
+				untracked.append(v)
+		return untracked
 
-				# get version
-				v_dict = self.object_inventory.get_version_entry(v_num)
-				logger.debug(v_dict)
 
-				# loop through files in state and check if version ancestor
-				for digest,filepath in v_dict['state'].items():
+	def _merge_digests(self, digest_d, new_digest_d):
 
-					logger.debug('checking version ancestors for digest: %s' % digest)
+		'''
+		Method to merge digest dictionaries, returning new dictionary
+
+		Args:
+			digest_d (dict): {digest: [files]}
+			new_digest_d (dict): {digest: [files]} to add
+		'''
+
+		merged_d = { digest:list(files) for digest,files in digest_d.items() }
+		for digest,files in new_digest_d.items():
+			if digest not in merged_d:
+				merged_d[digest] = list(files)
+			else:
+				merged_d[digest].extend(files)
+		return merged_d
+
+
+	def reconcile_deltas(self, write=True):
 
-					# loop through ancestors
-					ancestor_v_nums = list(range(1,v_num))
+		'''
+		Method to reconcile forward deltas
+			- REQUIRED: inventory.json is current
+
+		Approach:
+			- begin with v2, work forwards, accumulating digests of ancestor versions
+			- remove files from version if digest present in any ancestor, and file is stored in version
+			- apply all manifest and fixity removals in single batch
+		'''
 
-					# reverse
-					# ancestor_v_nums.reverse()
+		# inventory will be modified
+		self._expand_inventory()
+
+		# get versions from inventory
+		v_nums = self.object_inventory.get_version_numbers()
 
-					# sort
-					ancestor_v_nums = sorted(ancestor_v_nums)
+		# if versioned
+		if len(v_nums) > 1:
 
-					# loop through
-					for ancestor_v_num in ancestor_v_nums:
+			# physical files, as recorded in manifest
+			manifest_filepaths = set([ f for files in self.object_inventory.manifest.values() for f in files ])
 
-						# get ancestor v_dict
-						ancestor_v_dict = self.object_inventory.get_version_entry(ancestor_v_num)
+			# digests from ancestor versions, beginning with v1
+			ancestor_digests = set(self.object_inventory.get_version_entry(v_nums[0])['state'].keys())
 
-						# check if digest present
-						if digest in ancestor_v_dict['state']:
+			# track removed files by digest
+			removals = {}
 
-							logger.debug('digest found in v%s' % ancestor_v_num)
+			# loop through versions, after v1
+			for v_num in v_nums[1:]:
 
-							# remove file
-							self._remove_files_from_version(v_num, filepath, digest)
+				logger.debug('reconciling v%s' % v_num)
 
-							# break loop
-							break
+				# get version
+				v_dict = self.object_inventory.get_version_entry(v_num)
 
-						else:
+				# loop through files in state, and remove stored files if digest in ancestor
+				v_removals = 0
+				for digest,filepaths in v_dict['state'].items():
+					if digest in ancestor_digests:
+						removed = self._remove_files_from_version(v_num, [
+							filepath for filepath in filepaths if 'v%d/content/%s' % (v_num, filepath) in manifest_filepaths
+						])
+						if len(removed) > 0:
+							removals.setdefault(digest, set()).update(removed)
+							v_removals += len(removed)
 
-							logger.debug('digest not found, unique to v%s against ancestor v%s' % (v_num, ancestor_v_num))
+				# add digests from version to ancestors
+				ancestor_digests.update(v_dict['state'].keys())
 
 				# remove any empty directories
-				self._remove_empty_directories(v_num)
+				if v_removals > 0:
+					self._remove_empty_directories(v_num)
+
+			# remove files from manifest and fixity
+			self.object_inventory.remove_files_from_manifest(removals)
+			self.object_inventory.remove_files_from_fixity(set([ f for files in removals.values() for f in files ]))
 
 			# update manifest of physical files
-			logger.debug('updating inventory.json with new physical files manifest')
-			self.object_inventory.save(self.full_path)
+			if write:
+				logger.debug('updating inventory.json with new physical files manifest')
+				self._write_inventory_files()
 
 		else:
 			logger.debug('object contains only single version, skipping forward delta reconciliation')
 
 
-	def _remove_files_from_version(self, version, filepaths, digest):
+	def _remove_files_from_version(self, version, filepaths):
 
 		'''
-		Method to remove file from version
+		Method to remove files from version on disk
+			- manifest is not modified, see OCFLObjectInventory.remove_files_from_manifest
 
 		Args:
 			version (int): version number
 			filepaths (list): list of filepaths to remove, often single entry
+
+		Returns:
+			list: manifest filepaths removed
 		'''
 
+		manifest_filepaths = []
+
 		for filepath in filepaths:
 
 			# remove file from disk
 			v_filepath = os.path.join(self.full_path, 'v%d/content' % version, filepath)
-			logger.debug('removing file from v%s: %s' % (version, v_filepath))
 			os.remove(v_filepath)
+			manifest_filepaths.append('v%d/content/%s' % (version, filepath))
+
+		if metrics.enabled:
+			metrics.incr('files_removed', len(manifest_filepaths))
 
-			# remove file from manifest
-			manifest_filepath = os.path.join('v%d/content' % version, filepath)
-			self.object_inventory.remove_file_from_manifest(digest, manifest_filepath)
+		return manifest_filepaths
 
 
 	def _remove_empty_directories(self, version):
@@ -983,17 +2305,18 @@ class OCFLObject(object):
 		return [ int(re.match(v_num_regex, v_dir).group(1)) for v_dir in v_dirs ]
 
 
-	def checkout(self, output_path, overwrite=True, version=None):
+	def _get_version_key(self, version=None):
 
 		'''
-		Method to checkout latest, or specific, version of an Object
+		Method to normalize version to number and key, defaulting to latest
 
 		Args:
-			output_path (str): Path for output of actualzied version
-			version (None, int, str): Version to check out.  If None, latest, else, specific.
+			version (None, int, str): Version, e.g. 2 or 'v2'.  If None, latest.
+
+		Returns:
+			(tuple): (version number, version key)
 		'''
 
-		# determine version
 		if version != None:
 			# handle int or strings
 			if type(version) == int:
@@ -1004,52 +2327,253 @@ class OCFLObject(object):
 		else:
 			v_num = self.object_inventory.get_version_numbers()[-1]
 			v_key = 'v%s' % v_num
+		return v_num, v_key
+
+
+	def open(self, logical_path, version=None, start=None, end=None):
+
+		'''
+		Method to open file from version for reading, without checkout
+			- resolves logical path through version state and manifest to stored content
+
+		Args:
+			logical_path (str): Logical path of file in version state, e.g. 'level1/level2/bar.txt'
+			version (None, int, str): Version to read from.  If None, latest, else, specific.
+			start (int): If provided, byte offset where readable range begins
+			end (int): If provided, byte offset where readable range ends, exclusive
+
+		Returns:
+			(OCFLFileReader): seekable, binary file object over range of stored file
+		'''
+
+		# load version state from inventory
+		v_num, v_key = self._get_version_key(version)
+		v_dict = self.object_inventory.get_version_entry(v_num)
+		if v_dict == None:
+			raise Exception('version %s not found for object: %s' % (v_key, self.id))
+
+		# resolve logical path to stored content
+		for digest,filepaths in v_dict['state'].items():
+			if logical_path in filepaths:
+				matching_files = self.object_inventory.manifest[digest]
+				logger.debug('opening %s from %s as %s' % (logical_path, v_key, matching_files[0]))
+				return OCFLFileReader(
+					os.path.join(self.full_path, matching_files[0]),
+					start=start,
+					end=end,
+					logical_path=logical_path,
+					digest=digest)
+
+		raise Exception('logical path not found in %s state: %s' % (v_key, logical_path))
+
+
+	def checkout(self, output_path, overwrite=True, version=None, mode=DEFAULT_OBJECT_CHECKOUT_MODE, workers=None, include=None, exclude=None, paths=None):
+
+		'''
+		Method to checkout latest, or specific, version of an Object
+
+		Args:
+			output_path (str): Path for output of actualzied version
+			version (None, int, str): Version to check out.  If None, latest, else, specific.
+			mode (str): How files are materialized in output_path, ['copy','hardlink','reflink','symlink']
+				- hardlink: link to stored content, output_path must be on same filesystem as object
+				- reflink: copy-on-write clone of stored content where filesystem supports it, else copy
+				- symlink: absolute symbolic link to stored content
+				- note: hardlinked and symlinked files share content with the object, and must not be modified
+			workers (int): If greater than 1, materialize files concurrently with a thread pool of this size
+			include (str,list): If provided, checkout only logical paths matching these fnmatch patterns, e.g. 'images/*.tif'
+			exclude (str,list): If provided, skip logical paths matching these fnmatch patterns
+			paths (list): If provided, checkout only these logical paths
+				- patterns are matched against full logical path, with '*' matching across directories
+		'''
+
+		# validate mode
+		if mode not in ['copy','hardlink','reflink','symlink']:
+			raise Exception('"%s" is not a recognized checkout mode' % mode)
+
+		# determine version
+		v_num, v_key = self._get_version_key(version)
 		logger.debug('checking out version: %s' % (v_key))
 
 		# load version state from inventory
 		v_dict = self.object_inventory.get_version_entry(v_num)
 
-		# handle output path
+		# handle output path, noting if pre-existing files may need replacing
+		output_path_exists = os.path.exists(output_path)
 		output_path = self._handle_output_path(output_path, overwrite)
 		logger.debug('writing to: %s' % output_path)
 
-		# loop through version state and copy files to output
-		for digest,filepaths in v_dict['state'].items():
+		# pair files in version state with stored content
+		checkout_files = self._get_version_files(v_dict, v_key, include=include, exclude=exclude, paths=paths)
+
+		# create directories once
+		for target_dir in sorted(set([ os.path.dirname(filepath) for src_filepath,filepath in checkout_files ])):
+			os.makedirs(os.path.join(output_path, target_dir), exist_ok=True)
+
+		# materialize files, concurrently if workers set
+		def checkout_file(checkout_file):
+			self._checkout_file(checkout_file[0], output_path, checkout_file[1], mode=mode, replace=output_path_exists)
 
-			logger.debug('locating content for digest: %s' % digest)
+		if workers != None and workers > 1:
+			with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+				for result in _map_bounded(executor, checkout_file, checkout_files, workers * 2):
+					pass
+		else:
+			for f in checkout_files:
+				checkout_file(f)
+		if metrics.enabled:
+			metrics.incr('files_checked_out', len(checkout_files))
+
+
+	def _get_version_files(self, v_dict, v_key, include=None, exclude=None, paths=None):
+
+		'''
+		Method to pair logical paths from version state with stored content, optionally filtered
+
+		Args:
+			v_dict (dict): Version entry from inventory
+			v_key (str): Version key, e.g. 'v2'
+			include (str,list): If provided, only logical paths matching these fnmatch patterns
+			exclude (str,list): If provided, skip logical paths matching these fnmatch patterns
+			paths (list): If provided, only these logical paths, raising Exception if any are missing from state
+				- combined with include and exclude, paths are also filtered by patterns
+
+		Returns:
+			(list): tuples of (manifest filepath, logical path)
+		'''
+
+		# normalize logical path filters
+		if type(include) == str:
+			include = [include]
+		if type(exclude) == str:
+			exclude = [exclude]
+		if paths != None:
+			paths = set(paths)
+
+		def include_filepath(filepath):
+			if include != None and not any([ fnmatch.fnmatchcase(filepath, pattern) for pattern in include ]):
+				return False
+			if exclude != None and any([ fnmatch.fnmatchcase(filepath, pattern) for pattern in exclude ]):
+				return False
+			return True
 
-			# find matching files
-			matching_files = self.object_inventory.manifest[digest]
+		# pair files in version state with stored content, using 0th index from matching files
+		manifest = self.object_inventory.manifest
+		version_files = []
+		found_paths = set()
+		for digest,filepaths in v_dict['state'].items():
+			if paths != None:
+				filepaths = [ filepath for filepath in filepaths if filepath in paths ]
+				found_paths.update(filepaths)
+			filepaths = [ filepath for filepath in filepaths if include_filepath(filepath) ]
+			if len(filepaths) > 0:
+				matching_files = manifest[digest]
+				if len(matching_files) > 0:
+					for filepath in filepaths:
+						version_files.append((matching_files[0], filepath))
 
-			if len(matching_files) > 0:
-				logger.debug('Files with matching digest: %s' % matching_files)
+		# confirm explicit paths found in state, before filtering by patterns
+		if paths != None and len(found_paths) != len(paths):
+			raise Exception('paths not found in %s state: %s' % (v_key, sorted(paths - found_paths)))
 
-				# loop through files in filepaths for digest, copy, using 0th index from matching files
-				for filepath in filepaths:
-					self._copy_file(matching_files[0], output_path, filepath)
+		return version_files
 
 
-	def _copy_file(self, src_filepath, output_path, target_filepath):
+	def _checkout_file(self, src_filepath, output_path, target_filepath, mode=DEFAULT_OBJECT_CHECKOUT_MODE, replace=True):
 
 		'''
-		Method to handle copying of files
-			- notably, when they contain directory substrate not present in destination
+		Method to materialize stored file in output path
+			- directories in output path must already exist
 
 		Args:
 			src_filepath (str): Filepath from manifest
 			output_path (str): Output directory
 			target_filepath (str): Filepath, including local directories, destined for output_path
+			mode (str): ['copy','hardlink','reflink','symlink']
+			replace (bool): If True, remove pre-existing target first
+				- existing targets may be links to stored content, which must not be written through
 		'''
 
-		logger.debug('copying file: %ss to %s' % (src_filepath, os.path.join(output_path, target_filepath)))
+		src = os.path.join(self.full_path, src_filepath)
+		target = os.path.join(output_path, target_filepath)
 
-		# determine directory structure "under" file to create in output_path
-		target_filepath_dirs = '/'.join(target_filepath.split('/')[:-1])
-		if not os.path.exists(os.path.join(output_path, target_filepath_dirs)):
-			os.makedirs(os.path.join(output_path, target_filepath_dirs))
+		# remove pre-existing target
+		if replace and os.path.lexists(target):
+			os.remove(target)
 
-		# copy file
-		shutil.copyfile(os.path.join(self.full_path, src_filepath), os.path.join(output_path, target_filepath))
+		if mode == 'copy':
+			shutil.copyfile(src, target)
+		elif mode == 'hardlink':
+			os.link(src, target)
+		elif mode == 'symlink':
+			os.symlink(os.path.abspath(src), target)
+		elif mode == 'reflink':
+			_reflink_file(src, target)
+
+
+	def export_archive(self, fileobj, version=None, format=DEFAULT_OBJECT_ARCHIVE_FORMAT, prefix=None, include=None, exclude=None, paths=None):
+
+		'''
+		Method to stream version of an Object as archive, without checkout
+			- stored files are read directly into archive, in logical path order
+			- fileobj need not be seekable, e.g. sys.stdout.buffer or HTTP response
+
+		Args:
+			fileobj (file): Writable binary file object for archive
+			version (None, int, str): Version to export.  If None, latest, else, specific.
+			format (str): Archive format, ['tar','tar.gz','zip']
+			prefix (str): If provided, directory within archive for files, e.g. 'v2'
+			include (str,list): If provided, export only logical paths matching these fnmatch patterns
+			exclude (str,list): If provided, skip logical paths matching these fnmatch patterns
+			paths (list): If provided, export only these logical paths
+
+		Returns:
+			(int): Number of files archived
+		'''
+
+		# validate format
+		if format not in ['tar','tar.gz','zip']:
+			raise Exception('"%s" is not a recognized archive format' % format)
+
+		# load version state from inventory
+		v_num, v_key = self._get_version_key(version)
+		v_dict = self.object_inventory.get_version_entry(v_num)
+		if v_dict == None:
+			raise Exception('version %s not found for object: %s' % (v_key, self.id))
+		logger.debug('exporting version %s as %s' % (v_key, format))
+
+		# pair files in version state with stored content
+		version_files = sorted(self._get_version_files(v_dict, v_key, include=include, exclude=exclude, paths=paths), key=lambda f: f[1])
+
+		def arcname(filepath):
+			if prefix != None:
+				return '%s/%s' % (prefix.rstrip('/'), filepath)
+			return filepath
+
+		# stream tar
+		if format in ['tar','tar.gz']:
+			mode = 'w|gz' if format == 'tar.gz' else 'w|'
+			import tarfile
+			with tarfile.open(fileobj=fileobj, mode=mode) as tar:
+				for src_filepath,filepath in version_files:
+					src = os.path.join(self.full_path, src_filepath)
+					with open(src, 'rb') as f:
+						tarinfo = tar.gettarinfo(arcname=arcname(filepath), fileobj=f)
+						tarinfo.uid = tarinfo.gid = 0
+						tarinfo.uname = tarinfo.gname = ''
+						tar.addfile(tarinfo, f)
+
+		# stream zip
+		elif format == 'zip':
+			import zipfile
+			with zipfile.ZipFile(fileobj, mode='w', compression=zipfile.ZIP_STORED) as zf:
+				for src_filepath,filepath in version_files:
+					src = os.path.join(self.full_path, src_filepath)
+					zinfo = zipfile.ZipInfo.from_file(src, arcname=arcname(filepath))
+					with open(src, 'rb') as f, zf.open(zinfo, mode='w', force_zip64=True) as zf_target:
+						shutil.copyfileobj(f, zf_target, DEFAULT_OBJECT_READ_CHUNK_SIZE)
+
+		return len(version_files)
 
 
 	def _handle_output_path(self, output_path, overwrite):
@@ -1081,84 +2605,194 @@ class OCFLObject(object):
 		return output_path
 
 
-	def check_fixity(self, fixity_algo=None, use_manifest_digest=False):
+	def check_fixity(self, fixity_algo=None, use_manifest_digest=False, workers=None):
 
 		'''
 		Method to check fixity hashes for an object, and optionally update
 
 		Args:
-			fixity_algo (str): digest algorithm ['md5','sha256','sha512',etc.]
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
+				- when a list is passed, all algorithms are checked from a single read of each file
 			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
 				- pro: no re-compute time, con: limited to digest and freshness of manifest
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
+
+		Returns:
+			True,dict: True if all digests match, else failures; if list of algorithms passed, failures keyed by algorithm
 		'''
 
-		# prepare failures dict
-		fixity_failures = {}
-
-		# determine fixity algo
+		# determine fixity algos
 		if use_manifest_digest:
 			fixity_algo = self.object_inventory.digestAlgorithm
 		elif fixity_algo == None:
 			fixity_algo = self.fixity_algo
+		if type(fixity_algo) == str:
+			fixity_algos = [fixity_algo]
+		else:
+			fixity_algos = list(dict.fromkeys(fixity_algo))
 
 		# get fixity digests
-		fixity_old = self.object_inventory.fixity.get(fixity_algo,None)
-
-		if fixity_old != None:
+		fixity = self.object_inventory.fixity or {}
+		fixity_olds = { algo:fixity.get(algo) for algo in fixity_algos if fixity.get(algo,None) != None }
 
-			# re-calc fixity to compare and retrieve algo results
-			fixity_new = self.calc_fixity(
+		# re-calc fixity for all algorithms with stored digests, in single pass
+		if len(fixity_olds) > 0:
+			fixity_news = self.calc_fixity(
 				use_manifest_digest=use_manifest_digest,
-				fixity_algo=fixity_algo,
-				update_fixity=False
-			).get(fixity_algo)
+				fixity_algo=list(fixity_olds.keys()),
+				update_fixity=False,
+				use_digest_cache=False,
+				workers=workers
+			)
+
+		# compare pre-calculated against newly calculated
+		results_d = {}
+		for algo in fixity_algos:
+			if algo in fixity_olds:
+				results_d[algo] = self._compare_fixity(fixity_olds[algo], fixity_news.get(algo))
+			else:
+				results_d[algo] = {'no_fixity_digests_for_algorithm':algo}
 
-			# compare pre-calculated against newly calculated
-			for digest,files in fixity_old.items():
-				logger.debug('checking digest: %s' % digest)
+		# return
+		if type(fixity_algo) == str:
+			return results_d[fixity_algo]
+		elif all([ result == True for result in results_d.values() ]):
+			return True
+		else:
+			return { algo:result for algo,result in results_d.items() if result != True }
 
-				# check if fixity exists in new
-				if digest in fixity_new:
 
-					# check if 1:1 with digest from new
-					if files != fixity_new[digest]:
+	def audit_fixity(self, fixity_algo=None, use_manifest_digest=False, workers=None):
 
-						# loop through files in digest and check
-						for file in files:
-							if file not in fixity_new[digest]:
-								if digest not in fixity_failures:
-									fixity_failures[digest] = []
-								fixity_failures[digest].append(file)
+		'''
+		Method to check fixity, returning result with manifest files verified, e.g. for OCFLAuditLedger
 
-				# else, report old fixity digest not present in new
-				else:
-					if digest not in fixity_failures:
-						fixity_failures[digest] = []
-					fixity_failures[digest].append(files)
+		Args:
+			fixity_algo (str,list): digest algorithm, or list of algorithms, see check_fixity
+			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
 
-			# determine results and return
-			if len(fixity_failures) == 0:
-				return True
+		Returns:
+			dict: {'result': True or failures, see check_fixity, 'filepaths': manifest filepaths}
+		'''
+
+		result = self.check_fixity(fixity_algo=fixity_algo, use_manifest_digest=use_manifest_digest, workers=workers)
+		return {
+			'result':result,
+			'filepaths':sorted([ f for files in self.object_inventory.manifest.values() for f in files ])
+		}
+
+
+	def quick_audit(self):
+
+		'''
+		Method to compare files on disk to manifest, and sizes recorded in inventory, using stat only
+			- no content is read, see check_fixity for full audit
+			- sizes are compared only for files with sizes recorded in inventory,
+			  recorded when files are hashed by update or add_version
+
+		Returns:
+			True,dict: True if consistent, else dictionary with any of:
+				- missing (list): manifest files not on disk
+				- extra (list): files in version content directories not in manifest
+				- size_mismatch (dict): {filepath: {'expected': recorded size, 'actual': size on disk}}, e.g. truncated files
+		'''
+
+		# sizes of files on disk, in version content directories
+		disk_sizes = {}
+		for v_num in self.get_fs_version_numbers():
+			content_path = os.path.join(self.full_path, 'v%s/content' % v_num)
+			for f in self._list_files(content_path, files_only=True):
+				disk_sizes[os.path.relpath(f, self.full_path)] = os.stat(f).st_size
+		if metrics.enabled:
+			metrics.incr('files_statted', len(disk_sizes))
+
+		# compare with manifest and recorded sizes
+		manifest_filepaths = set([ f for files in self.object_inventory.manifest.values() for f in files ])
+		file_sizes = self.object_inventory.file_sizes or {}
+		audit_d = {
+			'missing':sorted(manifest_filepaths.difference(disk_sizes.keys())),
+			'extra':sorted(set(disk_sizes.keys()).difference(manifest_filepaths)),
+			'size_mismatch':{
+				f:{'expected':file_sizes[f], 'actual':disk_sizes[f]} for f in sorted(manifest_filepaths.intersection(disk_sizes.keys()))
+				if f in file_sizes and file_sizes[f] != disk_sizes[f]
+			}
+		}
+
+		# return
+		audit_d = { k:v for k,v in audit_d.items() if len(v) > 0 }
+		if len(audit_d) == 0:
+			return True
+		else:
+			return audit_d
+
+
+	def _compare_fixity(self, fixity_old, fixity_new):
+
+		'''
+		Method to compare pre-calculated fixity digests against newly calculated
+
+		Args:
+			fixity_old (dict): {digest: [files]} from inventory
+			fixity_new (dict): {digest: [files]} as calculated
+
+		Returns:
+			True,dict: True if consistent, else dictionary of failures
+		'''
+
+		# prepare failures dict
+		fixity_failures = {}
+
+		if metrics.enabled:
+			metrics.incr('fixity_digests_checked', len(fixity_old))
+
+		for digest,files in fixity_old.items():
+
+			# check if fixity exists in new
+			if digest in fixity_new:
+
+				# check if 1:1 with digest from new
+				if files != fixity_new[digest]:
+
+					# loop through files in digest and check
+					for file in files:
+						if file not in fixity_new[digest]:
+							if digest not in fixity_failures:
+								fixity_failures[digest] = []
+							fixity_failures[digest].append(file)
+
+			# else, report old fixity digest not present in new
 			else:
-				return fixity_failures
+				if digest not in fixity_failures:
+					fixity_failures[digest] = []
+				fixity_failures[digest].append(files)
 
+		# determine results and return
+		if len(fixity_failures) == 0:
+			return True
 		else:
-			return {'no_fixity_digests_for_algorithm':fixity_algo}
+			return fixity_failures
 
 
 	def calc_fixity(self,
 		use_manifest_digest=False,
 		fixity_algo=None,
-		update_fixity=True):
+		update_fixity=True,
+		use_digest_cache=True,
+		workers=None):
 
 		'''
 		Method to update fixity hashes for an object
 
 		Args:
-			fixity_algo (str): digest algorithm ['md5','sha256','sha512',etc.]
+			fixity_algo (str,list): digest algorithm ['md5','sha256','sha512',etc.], or list of algorithms
+				- when a list is passed, all algorithms are calculated from a single read of each file
 			use_manifest_digest (bool): If True, do not recalculate digests, but instead use from manifest
 				- pro: no re-compute time, con: limited to digest and freshness of manifest
 			update_fixity (bool): If True, write fixity to inventory.json
+			use_digest_cache (bool): If False, bypass digest cache and read all content
+				- fixity checks should always read content, as bit rot does not change file stat
+			workers (int): If greater than 1, hash files concurrently with a thread pool of this size
 		'''
 
 		logger.debug('calculating fixity hashes')
@@ -1169,27 +2803,35 @@ class OCFLObject(object):
 				self.object_inventory.digestAlgorithm: self.object_inventory.manifest
 			}
 
+			# write fixity and update inventories
+			if update_fixity:
+				self.object_inventory.update_fixity(fixity_d)
+				self.update(write_inventories=True, reconcile_deltas=False, calc_fixity=False, workers=workers)
+
 		# else, compute
 		else:
 
-			# determine fixity algo
-			if use_manifest_digest:
-				fixity_algo = self.object_inventory.digestAlgorithm
-			elif fixity_algo == None:
+			# determine fixity algos
+			if fixity_algo == None:
 				fixity_algo = self.fixity_algo
+			if type(fixity_algo) == str:
+				fixity_algos = [fixity_algo]
+			else:
+				fixity_algos = list(dict.fromkeys(fixity_algo))
 
-			# use generate_file_manifest
-			fixity_d = {
-				fixity_algo: self.calc_file_digests(
+			# write fixity and update inventories, calculating manifest and fixity in single pass
+			if update_fixity:
+				self.write_inventories(fixity_algos=fixity_algos, use_digest_cache=use_digest_cache, workers=workers)
+				fixity_d = { algo:self.object_inventory.fixity[algo] for algo in fixity_algos }
+
+			# else, calculate only
+			else:
+				fixity_d = self.calc_file_digests(
 					[os.path.join(self.full_path,'v%s/content' % v) for v in self.object_inventory.get_version_numbers()],
-					file_digest_algo=fixity_algo
+					file_digest_algo=fixity_algos,
+					use_digest_cache=use_digest_cache,
+					workers=workers
 				)
-			}
-
-		# write fixity and update inventories
-		if update_fixity:
-			self.object_inventory.update_fixity(fixity_d)
-			self.update(write_inventories=True, reconcile_deltas=False, calc_fixity=False)
 
 		# return
 		return fixity_d
@@ -1231,158 +2873,2157 @@ class OCFLObject(object):
 
 
 
-class OCFLObjectInventory(object):
+class OCFLFileReader(io.RawIOBase):
 
 	'''
-	Class for OCFL Object Inventory
+	Class for seekable, read-only binary file object over byte range of stored file
+		- offsets for seek and tell are relative to start of range
 	'''
 
-	def __init__(
-		self,
-		inventory=None):
+	def __init__(self, filepath, start=None, end=None, logical_path=None, digest=None):
 
-		# parse passed inventory
-		if inventory != None:
-			if type(inventory) == str:
-				self.inventory = json.loads(inventory)
-			elif type(inventory) == dict:
-				self.inventory = inventory
-			else:
-				raise Exception('JSON or python dictionary required when passed as inventory')
+		'''
+		Args:
+			filepath (str): Path of stored file
+			start (int): Byte offset where range begins, defaults to 0
+			end (int): Byte offset where range ends, exclusive, defaults to file size
+			logical_path (str): Logical path of file in version state
+			digest (str): Digest of complete stored file
+		'''
 
+		super().__init__()
 
-	@property
-	def digestAlgorithm(self):
+		self.filepath = filepath
+		self.logical_path = logical_path
+		self.digest = digest
+
+		# open and determine range
+		self._file = open(filepath, 'rb')
+		file_size = os.fstat(self._file.fileno()).st_size
+		self.start = 0 if start == None else min(max(start, 0), file_size)
+		self.end = file_size if end == None else min(max(end, self.start), file_size)
+		self._file.seek(self.start)
+		self._pos = 0
 
-		return self.inventory.get('digestAlgorithm',None)
+
+	def __repr__(self):
+		return '<OCFLFileReader: %s, bytes %s-%s>' % (self.logical_path or self.filepath, self.start, self.end)
 
 
 	@property
-	def manifest(self):
+	def size(self):
 
-		return self.inventory.get('manifest',None)
+		'''
+		Number of bytes in range
+		'''
+
+		return self.end - self.start
+
+
+	def readable(self):
+		return True
+
+
+	def seekable(self):
+		return True
+
+
+	def tell(self):
+		return self._pos
+
+
+	def seek(self, offset, whence=io.SEEK_SET):
+
+		'''
+		Method to seek within range
+
+		Args:
+			offset (int): offset relative to whence
+			whence (int): io.SEEK_SET, io.SEEK_CUR, or io.SEEK_END of range
+
+		Returns:
+			(int): new position in range
+		'''
+
+		if whence == io.SEEK_SET:
+			pos = offset
+		elif whence == io.SEEK_CUR:
+			pos = self._pos + offset
+		elif whence == io.SEEK_END:
+			pos = self.size + offset
+		else:
+			raise ValueError('invalid whence: %s' % whence)
+		if pos < 0:
+			raise ValueError('negative seek position: %s' % pos)
+		self._pos = pos
+		return self._pos
+
+
+	def readinto(self, b):
+
+		'''
+		Method to read bytes from current position into buffer, stopping at end of range
+		'''
+
+		remaining = self.size - self._pos
+		if remaining <= 0:
+			return 0
+		view = memoryview(b)[:remaining]
+		self._file.seek(self.start + self._pos)
+		n = self._file.readinto(view)
+		self._pos += n
+		return n
+
+
+	def iter_chunks(self, chunk_size=DEFAULT_OBJECT_READ_CHUNK_SIZE):
+
+		'''
+		Method to iterate over remaining bytes of range in chunks
+
+		Args:
+			chunk_size (int): Maximum bytes per chunk
+
+		Returns:
+			(generator): yields bytes
+		'''
+
+		while True:
+			chunk = self.read(chunk_size)
+			if not chunk:
+				break
+			yield chunk
+
+
+	def close(self):
+		if not self.closed:
+			self._file.close()
+		super().close()
+
+
+
+class _AsyncExecutor(object):
+
+	'''
+	Base class for asyncio facades, running blocking calls in a bounded thread pool
+		- executor is created on first use, and shut down by close if owned
+	'''
+
+	def __init__(self, executor=None, workers=DEFAULT_ASYNC_WORKERS):
+
+		'''
+		Args:
+			executor (concurrent.futures.Executor): Optional executor shared with other facades
+			workers (int): Size of thread pool, if executor not provided
+		'''
+
+		self.workers = workers
+		self._executor = executor
+		self._owns_executor = executor == None
 
 
 	@property
-	def fixity(self):
+	def executor(self):
+		if self._executor == None:
+			self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='pyocfl')
+		return self._executor
 
-		return self.inventory.get('fixity',None)
 
+	async def _run(self, func, *args, **kwargs):
+
+		'''
+		Method to await blocking function in executor
+		'''
+
+		import asyncio
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(self.executor, lambda: func(*args, **kwargs))
 
-	def new(self,**kwargs):
+
+	def close(self):
 
 		'''
-		Method to create JSON object inventory
+		Method to shut down executor, if created by this instance
 		'''
 
-		# OCFL Object inventory scaffold
-		self.inventory = {
-			'digestAlgorithm':DEFAULT_OBJECT_FILE_DIGEST_ALGO,
-			'head':'v1',
-			'id':uuid.uuid4().hex,
-			'manifest':{},
-			'type':'Object',
-			'versions':{
-				'v1':{
-					'created':'{:%Y-%m-%dT%H:%M:%SZ}'.format(datetime.datetime.now()),
-					'message':None,
-					'state':{}
-				}
-			}
-		}
+		if self._owns_executor and self._executor != None:
+			self._executor.shutdown(wait=False)
+			self._executor = None
 
-		# update with kwargs
-		self.inventory.update(kwargs)
 
-		# return
-		return self.inventory
+	async def __aenter__(self):
+		return self
 
 
-	def save(self, obj_path):
+	async def __aexit__(self, exc_type, exc, tb):
+		self.close()
+
+
+
+class AsyncOCFLStorageRoot(_AsyncExecutor):
+
+	'''
+	Class for asyncio facade over OCFLStorageRoot
+		- file I/O and inventory parsing run in a bounded thread pool, shared with objects returned
+	'''
+
+	def __init__(self, storage_root, executor=None, workers=DEFAULT_ASYNC_WORKERS, **kwargs):
 
 		'''
-		Method to write inventory to disk
+		Args:
+			storage_root (str,OCFLStorageRoot): Storage Root instance, or path
+				- if path, Storage Root is not loaded until load is awaited
+			executor (concurrent.futures.Executor): Optional executor, else thread pool of workers is created
+			workers (int): Size of thread pool, bounding concurrent blocking calls
+			kwargs (dict): Passed to OCFLStorageRoot, if path provided
 		'''
 
-		with open(os.path.join(obj_path,'inventory.json'), 'w') as f:
-			f.write(json.dumps(self.inventory, sort_keys=True, indent=4))
+		super().__init__(executor=executor, workers=workers)
+		if type(storage_root) == str:
+			kwargs['auto_load'] = False
+			storage_root = OCFLStorageRoot(storage_root, **kwargs)
+		self.storage_root = storage_root
 
 
-	def update_version_state(self, version, digest_d):
+	def __str__(self):
+		return 'AsyncOCFLStorageRoot: %s' % self.storage_root.path
+
+
+	@property
+	def path(self):
+		return self.storage_root.path
+
+
+	async def load(self):
 
 		'''
-		Method to update version state with passed dictionary of digests
+		Method to load Storage Root, see OCFLStorageRoot.load
 		'''
 
-		if version in self.inventory['versions']:
-			self.inventory['versions'][version]['state'] = digest_d
+		await self._run(self.storage_root.load)
+		return self
 
-		else:
-			self.inventory['versions'][version] = {
-				'created':'{:%Y-%m-%dT%H:%M:%SZ}'.format(datetime.datetime.now()),
-				'message':None,
-				'state':digest_d
-			}
 
+	async def get_object(self, obj_id=None, obj_path=None, auto_load=True):
 
-	def get_version_numbers(self):
+		'''
+		Method to retrieve object, see OCFLStorageRoot.get_object
 
+		Returns:
+			AsyncOCFLObject
 		'''
-		Convenience method to return version numbersd
+
+		obj = await self._run(self.storage_root.get_object, obj_id=obj_id, obj_path=obj_path, auto_load=auto_load)
+		return AsyncOCFLObject(obj, executor=self.executor)
+
+
+	async def get_objects(self, as_ocfl_objects=True, use_index=True, batch_size=DEFAULT_ASYNC_BATCH_SIZE):
+
 		'''
+		Async generator of all objects in Storage Root, see OCFLStorageRoot.get_objects
+			- object paths are read in batches, each in the executor
 
-		version_nums = [ int(v.split('v')[-1]) for v in self.inventory['versions'].keys() ]
-		version_nums.sort()
-		return version_nums
+		Args:
+			as_ocfl_objects (bool): If True, yield AsyncOCFLObject instances, with inventory parsed on first await, else object paths
+			use_index (bool): If True and object index is configured, read objects from index instead of filesystem
+			batch_size (int): Object paths read per blocking call
+		'''
 
+		obj_paths = await self._run(self.storage_root.get_objects, as_ocfl_objects=False, use_index=use_index)
+		while True:
+			batch = await self._run(lambda: list(itertools.islice(obj_paths, batch_size)))
+			if len(batch) == 0:
+				break
+			for obj_path in batch:
+				if as_ocfl_objects:
+					yield AsyncOCFLObject(OCFLObject(obj_path, storage_root=self.storage_root, auto_load=False), executor=self.executor)
+				else:
+					yield obj_path
 
-	def get_version_entry(self, version):
+
+	async def count_objects(self):
 
 		'''
-		Convenience function to return version entry
+		Method to count objects, see OCFLStorageRoot.count_objects
 		'''
 
-		# handle int or strings
-		if type(version) == int:
-			v_key = 'v%s' % version
-		elif type(version) == str:
-			v_key = version
+		return await self._run(self.storage_root.count_objects)
 
-		if v_key in self.inventory['versions']:
-			return self.inventory['versions'][v_key]
-		else:
-			return None
 
+	async def check_fixity(self, **kwargs):
+
+		'''
+		Method to check fixity for Objects in Storage Root, see OCFLStorageRoot.check_fixity
+		'''
+
+		return await self._run(self.storage_root.check_fixity, **kwargs)
 
-	def update_fixity(self, fixity_d):
+
+
+class AsyncOCFLObject(_AsyncExecutor):
+
+	'''
+	Class for asyncio facade over OCFLObject
+		- file I/O, inventory parsing, and hashing run in a bounded thread pool
+	'''
+
+	def __init__(self, ocfl_obj, executor=None, workers=DEFAULT_ASYNC_WORKERS):
 
 		'''
-		Method to update object manfiest with passed fixity dictionary
+		Args:
+			ocfl_obj (OCFLObject): Object instance
+			executor (concurrent.futures.Executor): Optional executor, e.g. of AsyncOCFLStorageRoot
+			workers (int): Size of thread pool, if executor not provided
 		'''
 
-		# create fixity entry in inventory if not present
-		if 'fixity' not in self.inventory:
-			self.inventory['fixity'] = {}
+		super().__init__(executor=executor, workers=workers)
+		self.ocfl_obj = ocfl_obj
+
 
-		# update
-		self.inventory['fixity'].update(fixity_d)
+	def __str__(self):
+		return 'AsyncOCFLObject: %s' % self.ocfl_obj.path
 
 
-	def remove_file_from_manifest(self, digest, filepath):
+	@property
+	def path(self):
+		return self.ocfl_obj.path
+
+
+	@property
+	def full_path(self):
+		return self.ocfl_obj.full_path
+
+
+	async def parse_object(self):
 
 		'''
-		Method to remove file from object manifest
-			- most likely done during delta reconciliation
+		Method to parse object inventory, see OCFLObject.parse_object
+		'''
+
+		await self._run(self.ocfl_obj.parse_object)
+		return self
+
+
+	async def get_id(self):
+
+		'''
+		Method to return id, read without parsing full inventory if not yet parsed
+		'''
+
+		return await self._run(lambda: self.ocfl_obj.id)
+
+
+	async def get_inventory(self):
+
+		'''
+		Method to return inventory, parsed on first await
+
+		Returns:
+			OCFLObjectInventory
 		'''
 
-		# copy manifest
-		manifest = self.manifest.copy()
+		return await self._run(lambda: self.ocfl_obj.object_inventory)
+
+
+	async def exists(self):
+		return await self._run(lambda: self.ocfl_obj.exists)
+
+
+	async def open(self, logical_path, version=None, start=None, end=None):
+
+		'''
+		Method to open file from version for reading, see OCFLObject.open
+
+		Returns:
+			AsyncOCFLFileReader
+		'''
+
+		reader = await self._run(self.ocfl_obj.open, logical_path, version=version, start=start, end=end)
+		return AsyncOCFLFileReader(reader, executor=self.executor)
+
+
+	async def read(self, logical_path, version=None, start=None, end=None):
+
+		'''
+		Method to read file, or byte range, from version
+
+		Returns:
+			bytes
+		'''
+
+		def read():
+			with self.ocfl_obj.open(logical_path, version=version, start=start, end=end) as reader:
+				return reader.read()
+		return await self._run(read)
+
+
+	async def iter_file(self, logical_path, version=None, start=None, end=None, chunk_size=DEFAULT_OBJECT_READ_CHUNK_SIZE):
+
+		'''
+		Async generator of file content, or byte range, from version in chunks, e.g. for a streaming response
+		'''
+
+		reader = await self.open(logical_path, version=version, start=start, end=end)
+		try:
+			async for chunk in reader.iter_chunks(chunk_size=chunk_size):
+				yield chunk
+		finally:
+			await reader.close()
+
+
+	async def checkout(self, output_path, **kwargs):
+
+		'''
+		Method to checkout version, see OCFLObject.checkout
+		'''
+
+		return await self._run(self.ocfl_obj.checkout, output_path, **kwargs)
+
+
+	async def check_fixity(self, **kwargs):
+
+		'''
+		Method to check fixity, see OCFLObject.check_fixity
+		'''
+
+		return await self._run(self.ocfl_obj.check_fixity, **kwargs)
+
+
+
+class AsyncOCFLFileReader(_AsyncExecutor):
+
+	'''
+	Class for asyncio facade over OCFLFileReader
+	'''
+
+	def __init__(self, reader, executor=None, workers=DEFAULT_ASYNC_WORKERS):
+
+		'''
+		Args:
+			reader (OCFLFileReader): Reader instance
+			executor (concurrent.futures.Executor): Optional executor, e.g. of AsyncOCFLObject
+			workers (int): Size of thread pool, if executor not provided
+		'''
+
+		super().__init__(executor=executor, workers=workers)
+		self.reader = reader
+
+
+	def __repr__(self):
+		return '<AsyncOCFLFileReader: %s, bytes %s-%s>' % (self.reader.logical_path or self.reader.filepath, self.reader.start, self.reader.end)
+
+
+	@property
+	def size(self):
+		return self.reader.size
+
+
+	@property
+	def logical_path(self):
+		return self.reader.logical_path
+
+
+	@property
+	def digest(self):
+		return self.reader.digest
+
+
+	def tell(self):
+		return self.reader.tell()
+
+
+	def seek(self, offset, whence=io.SEEK_SET):
+
+		'''
+		Method to seek within range, without I/O, see OCFLFileReader.seek
+		'''
+
+		return self.reader.seek(offset, whence)
+
+
+	async def read(self, size=-1):
+		return await self._run(self.reader.read, size)
+
+
+	async def iter_chunks(self, chunk_size=DEFAULT_OBJECT_READ_CHUNK_SIZE):
+
+		'''
+		Async generator over remaining bytes of range in chunks
+		'''
+
+		while True:
+			chunk = await self.read(chunk_size)
+			if not chunk:
+				break
+			yield chunk
+
+
+	async def close(self):
+
+		'''
+		Method to close reader, and shut down executor if owned
+		'''
+
+		await self._run(self.reader.close)
+		super().close()
+
+
+	async def __aexit__(self, exc_type, exc, tb):
+		await self.close()
+
+
+
+class OCFLThrottle(object):
+
+	'''
+	Class to limit rate of bytes and files read, and pause reading on a load signal
+		- shared by threads hashing files within an object, and by objects audited serially
+		- rates are paced without bursts, so time spent idle is not made up later
+		- when passed to process pool, callback must be picklable, e.g. module level function
+	'''
+
+	def __init__(self, bytes_per_sec=None, files_per_sec=None, pause_callback=None, pause_file=None, poll_interval=1.0):
+
+		'''
+		Args:
+			bytes_per_sec (int,float): If provided, maximum bytes read per second
+			files_per_sec (int,float): If provided, maximum files opened per second
+			pause_callback (callable): If provided, reading pauses while this returns True
+			pause_file (str): If provided, reading pauses while this file exists
+			poll_interval (float): Seconds between checks of pause signals, and while paused
+		'''
+
+		self.bytes_per_sec = bytes_per_sec
+		self.files_per_sec = files_per_sec
+		self.pause_callback = pause_callback
+		self.pause_file = pause_file
+		self.poll_interval = poll_interval
+		self._init_state()
+
+
+	def _init_state(self):
+
+		self._lock = threading.Lock()
+		self._bytes_t = 0.0
+		self._files_t = 0.0
+		self._pause_checked = 0.0
+
+
+	def __getstate__(self):
+
+		state = dict(self.__dict__)
+		del state['_lock']
+		return state
+
+
+	def __setstate__(self, state):
+
+		self.__dict__.update(state)
+		self._init_state()
+
+
+	def split(self, n):
+
+		'''
+		Method to return throttle with 1/n of rates, for each of n processes
+
+		Returns:
+			(OCFLThrottle)
+		'''
+
+		return OCFLThrottle(
+			bytes_per_sec=self.bytes_per_sec / n if self.bytes_per_sec != None else None,
+			files_per_sec=self.files_per_sec / n if self.files_per_sec != None else None,
+			pause_callback=self.pause_callback,
+			pause_file=self.pause_file,
+			poll_interval=self.poll_interval)
+
+
+	def paused(self):
+
+		'''
+		Method to return if pause signal is set
+		'''
+
+		if self.pause_callback != None and self.pause_callback():
+			return True
+		if self.pause_file != None and os.path.exists(self.pause_file):
+			return True
+		return False
+
+
+	def consume(self, nbytes=0, files=0):
+
+		'''
+		Method to account for bytes and files read, sleeping as needed to keep under rates, and while paused
+
+		Args:
+			nbytes (int): bytes about to be, or just, read
+			files (int): files about to be opened
+		'''
+
+		# check pause signals, at most once per poll interval
+		if self.pause_callback != None or self.pause_file != None:
+			now = time.monotonic()
+			if now - self._pause_checked >= self.poll_interval:
+				self._pause_checked = now
+				if self.paused():
+					if metrics.enabled:
+						metrics.incr('throttle_pauses')
+					logger.debug('throttle paused')
+					while self.paused():
+						time.sleep(self.poll_interval)
+					self._pause_checked = time.monotonic()
+
+		if self.bytes_per_sec == None and self.files_per_sec == None:
+			return
+
+		# reserve time slots for bytes and files, starting no earlier than now
+		with self._lock:
+			now = time.monotonic()
+			wait = 0.0
+			if self.bytes_per_sec != None and nbytes > 0:
+				self._bytes_t = max(self._bytes_t, now) + nbytes / self.bytes_per_sec
+				wait = max(wait, self._bytes_t - now)
+			if self.files_per_sec != None and files > 0:
+				self._files_t = max(self._files_t, now) + files / self.files_per_sec
+				wait = max(wait, self._files_t - now)
+
+		if wait > 0:
+			if metrics.enabled:
+				metrics.observe('throttle_sleep', wait)
+			time.sleep(wait)
+
+
+
+class _SQLiteFile(object):
+
+	'''
+	Base class for optional SQLite files kept alongside Storage Roots and Objects
+		- connection opened on first use, shared across threads and guarded by lock
+		- subclasses set SCHEMA, list of statements run when connection is opened
+		- opened in WAL mode with busy timeout, as processes of a pool may share the file
+	'''
+
+	SCHEMA = []
+	BUSY_TIMEOUT = 60 # seconds to wait for lock held by another connection
+
+	def __init__(self, path):
+
+		'''
+		Args:
+			path (str): path of SQLite file, created if not present
+		'''
+
+		self.path = path
+		self.root = os.path.dirname(os.path.abspath(path))
+		self._lock = threading.Lock()
+		self._conn = None
+
+
+	def __str__(self):
+		return '%s: %s' % (self.__class__.__name__, self.path)
+
+
+	@property
+	def conn(self):
+
+		'''
+		Property to return SQLite connection, creating tables if needed
+		'''
+
+		if self._conn == None:
+			import sqlite3
+			self._conn = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT, check_same_thread=False)
+			self._conn.execute('PRAGMA busy_timeout=%d' % (self.BUSY_TIMEOUT * 1000))
+			self._conn.execute('PRAGMA journal_mode=WAL')
+			for statement in self.SCHEMA:
+				self._conn.execute(statement)
+			self._conn.commit()
+		return self._conn
+
+
+	def commit(self):
+
+		'''
+		Method to persist changes
+		'''
+
+		with self._lock:
+			if self._conn != None:
+				self._conn.commit()
+
+
+	def close(self):
+
+		'''
+		Method to close connection
+		'''
+
+		with self._lock:
+			if self._conn != None:
+				self._conn.commit()
+				self._conn.close()
+				self._conn = None
+
+
+
+class OCFLDigestCache(_SQLiteFile):
+
+	'''
+	Class for persistent file digest cache, backed by SQLite
+		- entries keyed by relative path, inode, size, mtime_ns, and algorithm
+		- paths are stored relative to the directory of the cache file
+	'''
+
+	SCHEMA = [
+		'''CREATE TABLE IF NOT EXISTS digests (
+			path TEXT NOT NULL,
+			algo TEXT NOT NULL,
+			inode INTEGER NOT NULL,
+			size INTEGER NOT NULL,
+			mtime_ns INTEGER NOT NULL,
+			digest TEXT NOT NULL,
+			PRIMARY KEY (path, algo)
+		)'''
+	]
+
+
+	def _key_path(self, filepath):
+
+		'''
+		Method to return path of file relative to cache root
+		'''
+
+		return os.path.relpath(os.path.abspath(filepath), self.root)
+
+
+	def get(self, filepath, file_stat, algo):
+
+		'''
+		Method to retrieve cached digest for file, if stat unchanged
+
+		Args:
+			filepath (str): path of file
+			file_stat (os.stat_result): current stat of file
+			algo (str): digest algorithm
+
+		Returns:
+			str,None: hexdigest if cached and current, else None
+		'''
+
+		with self._lock:
+			row = self.conn.execute(
+				'SELECT digest FROM digests WHERE path=? AND algo=? AND inode=? AND size=? AND mtime_ns=?',
+				(self._key_path(filepath), algo, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+			).fetchone()
+		if row != None:
+			return row[0]
+		else:
+			return None
+
+
+	def set(self, filepath, file_stat, algo, digest):
+
+		'''
+		Method to cache digest for file
+
+		Args:
+			filepath (str): path of file
+			file_stat (os.stat_result): stat of file when digest was calculated
+			algo (str): digest algorithm
+			digest (str): hexdigest
+		'''
+
+		with self._lock:
+			self.conn.execute(
+				'INSERT OR REPLACE INTO digests (path, algo, inode, size, mtime_ns, digest) VALUES (?,?,?,?,?,?)',
+				(self._key_path(filepath), algo, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns, digest)
+			)
+
+
+	def calc_file_multi_digest(self, filepath, file_digest_algos, digest_func):
+
+		'''
+		Method to return digests for file, calculating only those not cached
+
+		Args:
+			filepath (str): path of file
+			file_digest_algos (list): hashlib algorithms
+			digest_func (callable): function accepting (filepath, algos), returning {algo: hexdigest}
+
+		Returns:
+			dict: {algorithm: hexdigest}
+		'''
+
+		# stat before reading, so concurrent modification is not cached as unchanged
+		file_stat = os.stat(filepath)
+
+		# retrieve cached digests
+		digests = {}
+		for algo in file_digest_algos:
+			digest = self.get(filepath, file_stat, algo)
+			if digest != None:
+				digests[algo] = digest
+		if metrics.enabled:
+			metrics.incr('digest_cache_hits', len(digests))
+			metrics.incr('digest_cache_misses', len(file_digest_algos) - len(digests))
+
+		# calculate missing digests in single read, and cache
+		missing_algos = [ algo for algo in file_digest_algos if algo not in digests ]
+		if len(missing_algos) > 0:
+			for algo,digest in digest_func(filepath, missing_algos).items():
+				self.set(filepath, file_stat, algo, digest)
+				digests[algo] = digest
+
+			# commit per file, so write lock is not held while hashing next file
+			self.commit()
+
+		return digests
+
+
+
+class OCFLObjectIndex(_SQLiteFile):
+
+	'''
+	Class for index of Objects in Storage Root, backed by SQLite
+		- records id, storage path, head version, file count, and byte size of each object
+		- paths are relative to Storage Root
+	'''
+
+	SCHEMA = [
+		'''CREATE TABLE IF NOT EXISTS objects (
+			id TEXT NOT NULL,
+			path TEXT PRIMARY KEY,
+			head TEXT,
+			file_count INTEGER,
+			byte_size INTEGER,
+			updated TEXT
+		)''',
+		'CREATE INDEX IF NOT EXISTS objects_id ON objects (id)'
+	]
+
+
+	def index_object(self, obj, commit=True):
+
+		'''
+		Method to add or update object in index
+
+		Args:
+			obj (OCFLObject): object with associated Storage Root
+			commit (bool): If True, commit after update
+		'''
+
+		# determine head, file count, and size from manifest
+		v_nums = obj.object_inventory.get_version_numbers()
+		head = 'v%s' % v_nums[-1] if len(v_nums) > 0 else None
+		manifest_files = [ f for files in obj.object_inventory.manifest.values() for f in files ]
+
+		# sizes recorded in inventory, only files without recorded size are read from filesystem
+		file_sizes = obj.object_inventory.file_sizes or {}
+		byte_size = 0
+		for f in manifest_files:
+			size = file_sizes.get(f, None)
+			if size == None:
+				size = os.stat(os.path.join(obj.full_path, f)).st_size
+			byte_size += size
+
+		with self._lock:
+			self.conn.execute(
+				'INSERT OR REPLACE INTO objects (id, path, head, file_count, byte_size, updated) VALUES (?,?,?,?,?,?)',
+				(obj.id, obj.path, head, len(manifest_files), byte_size, '{:%Y-%m-%dT%H:%M:%SZ}'.format(datetime.datetime.now()))
+			)
+		if commit:
+			self.commit()
+
+
+	def remove(self, obj_path, commit=True):
+
+		'''
+		Method to remove object from index by path
+
+		Args:
+			obj_path (str): object path relative to Storage Root
+			commit (bool): If True, commit after removal
+		'''
+
+		with self._lock:
+			self.conn.execute('DELETE FROM objects WHERE path=?', (obj_path,))
+		if commit:
+			self.commit()
+
+
+	def clear(self):
+
+		'''
+		Method to remove all objects from index
+		'''
+
+		with self._lock:
+			self.conn.execute('DELETE FROM objects')
+		self.commit()
+
+
+	def get_paths(self):
+
+		'''
+		Generator of object paths in index, ordered by path
+		'''
+
+		# page through index by path, to avoid loading all paths
+		last_path = ''
+		while True:
+			with self._lock:
+				rows = self.conn.execute('SELECT path FROM objects WHERE path > ? ORDER BY path LIMIT 10000', (last_path,)).fetchall()
+			if len(rows) == 0:
+				break
+			for row in rows:
+				yield row[0]
+			last_path = rows[-1][0]
+
+
+	def get(self, obj_id=None, obj_path=None):
+
+		'''
+		Method to return index entry for object by id or path
+
+		Returns:
+			dict,None
+		'''
+
+		with self._lock:
+			if obj_id != None:
+				cursor = self.conn.execute('SELECT id, path, head, file_count, byte_size, updated FROM objects WHERE id=?', (obj_id,))
+			else:
+				cursor = self.conn.execute('SELECT id, path, head, file_count, byte_size, updated FROM objects WHERE path=?', (obj_path,))
+			row = cursor.fetchone()
+		if row != None:
+			return dict(zip(['id','path','head','file_count','byte_size','updated'], row))
+		else:
+			return None
+
+
+	def get_sizes(self):
+
+		'''
+		Method to return byte size of each indexed object, e.g. to schedule largest first without walking objects
+
+		Returns:
+			dict: {object path: byte size}
+		'''
+
+		with self._lock:
+			return dict(self.conn.execute('SELECT path, byte_size FROM objects').fetchall())
+
+
+	def count(self):
+
+		'''
+		Method to return count of objects in index
+		'''
+
+		with self._lock:
+			return self.conn.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+
+
+
+class OCFLAuditLedger(_SQLiteFile):
+
+	'''
+	Class for persistent ledger of fixity audits, backed by SQLite
+		- records when each object, and each manifest file of the object, was last verified, and the result
+		- results are 'pass', 'fail', or 'error' if the object could not be checked
+		- paths are relative to Storage Root
+	'''
+
+	SCHEMA = [
+		'''CREATE TABLE IF NOT EXISTS objects (
+			path TEXT PRIMARY KEY,
+			id TEXT,
+			verified REAL NOT NULL,
+			result TEXT NOT NULL,
+			failures TEXT
+		)''',
+		'CREATE INDEX IF NOT EXISTS objects_verified ON objects (verified)',
+		'''CREATE TABLE IF NOT EXISTS files (
+			path TEXT NOT NULL,
+			filepath TEXT NOT NULL,
+			verified REAL NOT NULL,
+			result TEXT NOT NULL,
+			PRIMARY KEY (path, filepath)
+		)'''
+	]
+
+
+	def record(self, obj_path, obj_id, result, filepaths=None, commit=True):
+
+		'''
+		Method to record audit result for object, and its manifest files
+
+		Args:
+			obj_path (str): object path relative to Storage Root
+			obj_id (str): object id
+			result (True,dict): True, or failures from OCFLObject.check_fixity, or {'error': message}
+			filepaths (list): If provided, manifest filepaths verified, recorded as failed if in failures, else passed
+			commit (bool): If True, commit after recording
+		'''
+
+		verified = time.time()
+
+		# determine object result, and failed files
+		failed = set()
+		if result == True:
+			obj_result = 'pass'
+		elif type(result) == dict and 'error' in result:
+			obj_result = 'error'
+		else:
+			obj_result = 'fail'
+
+			# collect files from failures, keyed by digest, or by algorithm then digest
+			# files of digests missing from calculated fixity are reported as nested lists, see _compare_fixity
+			def collect(failures):
+				for k,v in failures.items():
+					if type(v) == dict:
+						if not collect(v):
+							return False
+					elif type(v) == list:
+						for f in v:
+							if type(f) == list:
+								failed.update(f)
+							else:
+								failed.add(f)
+					else:
+						return False
+				return True
+
+			# failures not naming files, e.g. no fixity for algorithm, leave files unverified
+			if not collect(result):
+				obj_result = 'error'
+
+		with self._lock:
+			self.conn.execute(
+				'INSERT OR REPLACE INTO objects (path, id, verified, result, failures) VALUES (?,?,?,?,?)',
+				(obj_path, obj_id, verified, obj_result, json.dumps(result, sort_keys=True) if result != True else None)
+			)
+			if filepaths != None and obj_result != 'error':
+				self.conn.execute('DELETE FROM files WHERE path=?', (obj_path,))
+				self.conn.executemany(
+					'INSERT INTO files (path, filepath, verified, result) VALUES (?,?,?,?)',
+					[ (obj_path, f, verified, 'fail' if f in failed else 'pass') for f in filepaths ]
+				)
+		if commit:
+			self.commit()
+
+
+	def schedule(self, obj_paths):
+
+		'''
+		Method to order object paths by time last verified, oldest first
+			- objects never verified are first, in given order
+
+		Args:
+			obj_paths (iterable): object paths relative to Storage Root
+
+		Returns:
+			list: object paths
+		'''
+
+		with self._lock:
+			verified = dict(self.conn.execute('SELECT path, verified FROM objects').fetchall())
+		return sorted(obj_paths, key=lambda obj_path: verified.get(obj_path, -1))
+
+
+	def get(self, obj_path):
+
+		'''
+		Method to return last audit of object
+
+		Returns:
+			dict,None: {'path','id','verified','result','failures'}
+		'''
+
+		with self._lock:
+			row = self.conn.execute('SELECT path, id, verified, result, failures FROM objects WHERE path=?', (obj_path,)).fetchone()
+		if row != None:
+			entry = dict(zip(['path','id','verified','result','failures'], row))
+			if entry['failures'] != None:
+				entry['failures'] = json.loads(entry['failures'])
+			return entry
+		else:
+			return None
+
+
+	def get_files(self, obj_path):
+
+		'''
+		Method to return last audit of manifest files of object
+
+		Returns:
+			dict: {filepath: {'verified','result'}}
+		'''
+
+		with self._lock:
+			rows = self.conn.execute('SELECT filepath, verified, result FROM files WHERE path=?', (obj_path,)).fetchall()
+		return { filepath:{'verified':verified, 'result':result} for filepath,verified,result in rows }
+
+
+	def remove(self, obj_path, commit=True):
+
+		'''
+		Method to remove object from ledger by path
+		'''
+
+		with self._lock:
+			self.conn.execute('DELETE FROM objects WHERE path=?', (obj_path,))
+			self.conn.execute('DELETE FROM files WHERE path=?', (obj_path,))
+		if commit:
+			self.commit()
+
+
+	def count(self, result=None):
+
+		'''
+		Method to return count of objects in ledger, optionally with result, e.g. 'fail'
+		'''
+
+		with self._lock:
+			if result != None:
+				return self.conn.execute('SELECT COUNT(*) FROM objects WHERE result=?', (result,)).fetchone()[0]
+			return self.conn.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+
+
+
+class OCFLObjectInventory(object):
+
+	'''
+	Class for OCFL Object Inventory
+	'''
+
+	def __init__(
+		self,
+		inventory=None):
+
+		# sections and versions changed since parsed or written, see mark_dirty
+		self.dirty_sections = set()
+		self.dirty_versions = set()
+
+		# parse passed inventory
+		if inventory != None:
+			if type(inventory) == str:
+				self.inventory = json.loads(inventory)
+			elif type(inventory) == dict:
+				self.inventory = inventory
+			else:
+				raise Exception('JSON or python dictionary required when passed as inventory')
+
+
+	@property
+	def id(self):
+
+		return self.inventory.get('id',None)
+
+
+	@property
+	def digestAlgorithm(self):
+
+		return self.inventory.get('digestAlgorithm',None)
+
+
+	@property
+	def manifest(self):
+
+		return self.inventory.get('manifest',None)
+
+
+	@property
+	def fixity(self):
+
+		return self.inventory.get('fixity',None)
+
+
+	@property
+	def file_sizes(self):
+
+		'''
+		Property to return sizes of manifest files from size fixity block
+
+		Returns:
+			dict,None: {manifest filepath: size in bytes}
+		'''
+
+		fixity = self.fixity
+		if fixity == None or INVENTORY_FILE_SIZE_FIXITY_ALGO not in fixity:
+			return None
+		return { f:int(size) for size,files in fixity[INVENTORY_FILE_SIZE_FIXITY_ALGO].items() for f in files }
+
+
+	def new(self,**kwargs):
+
+		'''
+		Method to create JSON object inventory
+		'''
+
+		# OCFL Object inventory scaffold
+		self.inventory = {
+			'digestAlgorithm':DEFAULT_OBJECT_FILE_DIGEST_ALGO,
+			'head':'v1',
+			'id':_unique_id(),
+			'manifest':{},
+			'type':'Object',
+			'versions':{
+				'v1':{
+					'created':'{:%Y-%m-%dT%H:%M:%SZ}'.format(datetime.datetime.now()),
+					'message':None,
+					'state':{}
+				}
+			}
+		}
+
+		# update with kwargs
+		self.inventory.update(kwargs)
+
+		# all sections and versions are new
+		for section in self.inventory.keys():
+			self.mark_dirty(section)
+		for v_key in self.inventory['versions'].keys():
+			self.mark_dirty('versions', version=v_key)
+
+		# return
+		return self.inventory
+
+
+	@property
+	def is_dirty(self):
+
+		'''
+		Property to return if inventory has changed since parsed or written
+		'''
+
+		return len(self.dirty_sections) > 0
+
+
+	def mark_dirty(self, section, version=None):
+
+		'''
+		Method to record change to inventory, so it is written
+
+		Args:
+			section (str): top-level section of inventory, e.g. 'manifest'
+			version (str): If provided, version key whose entry changed, e.g. 'v2'
+		'''
+
+		self.dirty_sections.add(section)
+		if version != None:
+			self.dirty_versions.add(version)
+
+
+	def mark_clean(self):
+
+		'''
+		Method to clear record of changes, after inventories are written
+		'''
+
+		self.dirty_sections = set()
+		self.dirty_versions = set()
+
+
+	def set_id(self, obj_id):
+
+		'''
+		Method to set id of inventory
+		'''
+
+		if self.inventory.get('id') != obj_id:
+			self.inventory['id'] = obj_id
+			self.mark_dirty('id')
+
+
+	def set_head(self, v_key):
+
+		'''
+		Method to set head version of inventory
+		'''
+
+		if self.inventory.get('head') != v_key:
+			self.inventory['head'] = v_key
+			self.mark_dirty('head')
+
+
+	def set_manifest(self, manifest_d):
+
+		'''
+		Method to replace manifest, marking dirty only if changed
+		'''
+
+		if self.manifest != manifest_d:
+			self.inventory['manifest'] = manifest_d
+			self.mark_dirty('manifest')
+
+
+	def set_version_message(self, version, message):
+
+		'''
+		Method to set message for version
+		'''
+
+		if self.inventory['versions'][version].get('message') != message:
+			self.inventory['versions'][version]['message'] = message
+			self.mark_dirty('versions', version=version)
+
+
+	def serialize(self, inventory=None, compact=False):
+
+		'''
+		Method to serialize inventory, or version entry, to JSON
+
+		Args:
+			inventory (dict): If provided, serialize this instead of full inventory, e.g. version entry
+			compact (bool): If True, no indentation or whitespace
+
+		Returns:
+			(bytes): UTF-8 encoded JSON
+		'''
+
+		if inventory == None:
+			inventory = self.inventory
+		if compact:
+			return json.dumps(inventory, sort_keys=True, separators=(',',':')).encode('utf-8')
+		return json.dumps(inventory, sort_keys=True, indent=4).encode('utf-8')
+
+
+	def save(self, obj_path, digest_algo=None, compact=False):
+
+		'''
+		Method to write inventory.json, and digest sidecar, to disk
+
+		Args:
+			obj_path (str): full path of object
+			digest_algo (str): Algorithm for sidecar, defaults to digestAlgorithm of inventory
+			compact (bool): If True, write without indentation or whitespace
+		'''
+
+		self._save_inventory_file(obj_path, self.serialize(compact=compact), digest_algo)
+
+
+	def save_version(self, obj_path, version, digest_algo=None, compact=False):
+
+		'''
+		Method to write version inventory.json, and digest sidecar, to version directory
+
+		Args:
+			obj_path (str): full path of object
+			version (int, str): version, e.g. 2 or 'v2'
+			digest_algo (str): Algorithm for sidecar, defaults to digestAlgorithm of inventory
+			compact (bool): If True, write without indentation or whitespace
+		'''
+
+		# handle int or strings
+		v_key = 'v%s' % version if type(version) == int else version
+		self._save_inventory_file(os.path.join(obj_path, v_key), self.serialize(inventory=self.get_version_entry(v_key), compact=compact), digest_algo)
+
+
+	def _save_inventory_file(self, path, data, digest_algo=None):
+
+		'''
+		Method to atomically write serialized inventory, and sidecar with digest of same bytes
+		'''
+
+		if digest_algo == None:
+			digest_algo = self.digestAlgorithm
+		digest = hashlib.new(digest_algo, data).hexdigest()
+		_write_file_atomic(os.path.join(path, 'inventory.json'), data)
+		_write_file_atomic(os.path.join(path, 'inventory.json.%s' % digest_algo), digest.encode('utf-8'))
+		if metrics.enabled:
+			metrics.incr('inventories_written')
+			metrics.incr('inventory_bytes_written', len(data))
+
+
+	def update_version_state(self, version, digest_d):
+
+		'''
+		Method to update version state with passed dictionary of digests
+		'''
+
+		if version in self.inventory['versions']:
+			if self.inventory['versions'][version]['state'] == digest_d:
+				return
+			self.inventory['versions'][version]['state'] = digest_d
+
+		else:
+			self.inventory['versions'][version] = {
+				'created':'{:%Y-%m-%dT%H:%M:%SZ}'.format(datetime.datetime.now()),
+				'message':None,
+				'state':digest_d
+			}
+
+		self.mark_dirty('versions', version=version)
+
+
+	def get_version_numbers(self):
+
+		'''
+		Convenience method to return version numbersd
+		'''
+
+		version_nums = [ int(v.split('v')[-1]) for v in self.inventory['versions'].keys() ]
+		version_nums.sort()
+		return version_nums
+
+
+	def get_version_entry(self, version):
+
+		'''
+		Convenience function to return version entry
+		'''
+
+		# handle int or strings
+		if type(version) == int:
+			v_key = 'v%s' % version
+		elif type(version) == str:
+			v_key = version
+
+		if v_key in self.inventory['versions']:
+			return self.inventory['versions'][v_key]
+		else:
+			return None
+
+
+	def update_fixity(self, fixity_d):
+
+		'''
+		Method to update object manfiest with passed fixity dictionary
+		'''
+
+		# create fixity entry in inventory if not present
+		if 'fixity' not in self.inventory:
+			self.inventory['fixity'] = {}
+			self.mark_dirty('fixity')
+
+		# update, if changed
+		for algo,algo_fixity_d in fixity_d.items():
+			if self.inventory['fixity'].get(algo) != algo_fixity_d:
+				self.inventory['fixity'][algo] = algo_fixity_d
+				self.mark_dirty('fixity')
+
+
+	def update_file_sizes(self, sizes_d, replace=False):
+
+		'''
+		Method to record sizes of manifest files, in size fixity block
+
+		Args:
+			sizes_d (dict): {manifest filepath: size in bytes}
+			replace (bool): If True, replace recorded sizes, else merge
+		'''
+
+		file_sizes = self.file_sizes
+		if not replace and file_sizes != None:
+			file_sizes.update(sizes_d)
+		else:
+			file_sizes = sizes_d
+
+		# group by size, as fixity block
+		size_fixity_d = {}
+		for f,size in file_sizes.items():
+			size_fixity_d.setdefault(str(size), []).append(f)
+		self.update_fixity({ INVENTORY_FILE_SIZE_FIXITY_ALGO:size_fixity_d })
+
+
+	def remove_file_from_manifest(self, digest, filepath):
+
+		'''
+		Method to remove file from object manifest
+		'''
+
+		self.remove_files_from_manifest({digest:set([filepath])})
+
+
+	def remove_files_from_manifest(self, removals):
+
+		'''
+		Method to remove files from object manifest in single batch
+			- most likely done during delta reconciliation
+
+		Args:
+			removals (dict): {digest: set(filepaths)} to remove
+		'''
+
+		manifest = self.manifest
+		for digest,filepaths in removals.items():
+
+			# remove file entries, dropping digest if no files remain
+			files = [ f for f in manifest[digest] if f not in filepaths ]
+			if len(files) > 0:
+				manifest[digest] = files
+			else:
+				del manifest[digest]
+			self.mark_dirty('manifest')
+
+		# remove recorded sizes
+		self.remove_files_from_fixity(set([ f for filepaths in removals.values() for f in filepaths ]), fixity_algos=[INVENTORY_FILE_SIZE_FIXITY_ALGO])
+
+
+	def remove_files_from_fixity(self, filepaths, fixity_algos=None):
+
+		'''
+		Method to remove files from all fixity blocks
+			- most likely done during delta reconciliation
+
+		Args:
+			filepaths (set): manifest filepaths to remove
+			fixity_algos (list): If provided, remove from fixity blocks of these algorithms only
+		'''
+
+		# skip if no fixity, or no files
+		if self.fixity == None or len(filepaths) == 0:
+			return
+
+		for algo,fixity_d in self.fixity.items():
+			if fixity_algos != None and algo not in fixity_algos:
+				continue
+
+			# rebuild fixity block without removed files, dropping emptied digests
+			pruned_d = {}
+			for digest,files in fixity_d.items():
+				files = [ f for f in files if f not in filepaths ]
+				if len(files) > 0:
+					pruned_d[digest] = files
+			self.inventory['fixity'][algo] = pruned_d
+		self.mark_dirty('fixity')
+
+
+
+class OCFLCompactInventory(OCFLObjectInventory):
+
+	'''
+	Class for read-only, compact, in-memory representation of OCFL Object Inventory
+		- intended for reading large inventories, e.g. fixity audits and checkouts
+		- directories and file names are interned once, and paths stored as pairs of their ids
+		- digests are stored as sorted binary digests, with array-backed tables of path ids
+		- manifest, fixity, and version state are returned as read-only mappings of hex digest to list of paths
+		- modifying methods raise Exception, use to_inventory() to expand to OCFLObjectInventory
+	'''
+
+	def __init__(
+		self,
+		inventory=None):
+
+		# read-only, except id, see set_id
+		self.dirty_sections = set()
+		self.dirty_versions = set()
+
+		# directory and file name tables, path i is _directories[_path_directories[i]] + _names[_path_names[i]]
+		self._directory_ids = {}
+		self._name_ids = {}
+		self._path_directories = array.array('I')
+		self._path_names = array.array('I')
+
+		# parse passed inventory
+		if inventory != None:
+			if type(inventory) == str:
+				inventory = self._parse(inventory)
+			elif type(inventory) != dict:
+				raise Exception('JSON or python dictionary required when passed as inventory')
+			self._load(inventory)
+
+		# directories and file names in order of ids, dropping load-time lookups
+		self._directories = list(self._directory_ids)
+		self._names = list(self._name_ids)
+		self._directory_ids = None
+		self._name_ids = None
+
+
+	def _parse(self, text):
+
+		'''
+		Method to parse inventory JSON member by member
+			- each manifest, fixity, and version state entry is added to compact tables as parsed,
+			so plain dictionaries of them are never built
+			- other values are decoded whole
+
+		Returns:
+			dict: inventory, with manifest, fixity, and version state as _CompactDigestMap
+		'''
+
+		decoder = json.JSONDecoder()
+		whitespace = re.compile(r'[ \t\n\r]*')
+
+		# digest map entry with single path, and no escapes in digest or path, matched whole
+		entry = re.compile(r'[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:[ \t\n\r]*\[[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*\][ \t\n\r]*([,}])')
+		pos = 0
+
+		def skip(char=None):
+			nonlocal pos
+			pos = whitespace.match(text, pos).end()
+			if char != None:
+				if text[pos:pos+1] != char:
+					raise json.JSONDecodeError('Expecting %r delimiter' % char, text, pos)
+				pos = whitespace.match(text, pos + 1).end()
+
+		def member_key():
+			# key of object member, through ':' delimiter
+			nonlocal pos
+			skip()
+			if text[pos:pos+1] != '"':
+				raise json.JSONDecodeError('Expecting property name enclosed in double quotes', text, pos)
+			name, pos = json.decoder.scanstring(text, pos + 1)
+			skip(':')
+			return name
+
+		def members():
+			# generator of keys of object, each value must be parsed before next key
+			nonlocal pos
+			skip('{')
+			if text[pos:pos+1] == '}':
+				pos += 1
+				return
+			while True:
+				yield member_key()
+				skip()
+				if text[pos:pos+1] == '}':
+					pos += 1
+					return
+				skip(',')
+
+		def value():
+			nonlocal pos
+			value, pos = decoder.raw_decode(text, pos)
+			return value
+
+		def digest_map_entries():
+			# generator of (digest, [paths]) of digest map
+			nonlocal pos
+			skip('{')
+			if text[pos:pos+1] == '}':
+				pos += 1
+				return
+			while True:
+				match = entry.match(text, pos)
+				if match != None:
+					pos = match.end()
+					digest, path, delimiter = match.groups()
+					yield digest, (path,)
+				else:
+					digest = member_key()
+					yield digest, value()
+					skip()
+					delimiter = text[pos:pos+1]
+					pos += 1
+				if delimiter == '}':
+					return
+				elif delimiter != ',':
+					raise json.JSONDecodeError("Expecting ',' delimiter", text, pos - 1)
+
+		def digest_map(sizes=False):
+			if text[pos:pos+1] != '{':
+				return self._load_digest_map(value() or {}, sizes=sizes)
+			return self._compact_digest_map(digest_map_entries(), sizes=sizes)
+
+		def versions():
+			if text[pos:pos+1] != '{':
+				return value()
+			return { v_key:{ k:digest_map() if k == 'state' else value() for k in members() } for v_key in members() }
+
+		inventory = {}
+		for key in members():
+			if key == 'manifest':
+				inventory[key] = digest_map()
+			elif key == 'fixity' and text[pos:pos+1] == '{':
+				inventory[key] = { algo:digest_map(sizes=algo == INVENTORY_FILE_SIZE_FIXITY_ALGO) for algo in members() }
+			elif key == 'versions':
+				inventory[key] = versions()
+			else:
+				inventory[key] = value()
+		skip()
+		if pos != len(text):
+			raise json.JSONDecodeError('Extra data', text, pos)
+		return inventory
+
+
+	def _load(self, inventory):
+
+		'''
+		Method to load inventory dictionary into compact tables
+		'''
+
+		# scalar top-level values
+		self._scalars = { k:v for k,v in inventory.items() if k not in ['manifest','fixity','versions'] }
+
+		# manifest and fixity
+		self._manifest = self._load_digest_map(inventory.get('manifest',None) or {})
+		if inventory.get('fixity',None) != None:
+			self._fixity = { algo:self._load_digest_map(fixity_d, sizes=algo == INVENTORY_FILE_SIZE_FIXITY_ALGO) for algo,fixity_d in inventory['fixity'].items() }
+		else:
+			self._fixity = None
+
+		# versions, without state, and state
+		self._versions = {}
+		for v_key,v_dict in inventory.get('versions',{}).items():
+			self._versions[v_key] = (
+				{ k:v for k,v in v_dict.items() if k != 'state' },
+				self._load_digest_map(v_dict.get('state',None) or {})
+			)
+
+
+	def _get_path(self, path_id):
+
+		'''
+		Method to return path for path id
+		'''
+
+		return self._directories[self._path_directories[path_id]] + self._names[self._path_names[path_id]]
+
+
+	def _compact_digest_map(self, pairs, sizes=False):
+
+		'''
+		Method to return _CompactDigestMap for (digest, [paths]) pairs
+			- pairs may be a generator, as each entry is added to tables before the next is read
+
+		Args:
+			pairs (iterable): (digest, [paths]) tuples
+			sizes (bool): If True, keys are decimal file sizes, as in size fixity block
+		'''
+
+		# encode keys, and add paths to tables in parsed order, interning directories and file names
+		encode_key = _CompactDigestMap.encode_key
+		directory_ids = self._directory_ids
+		name_ids = self._name_ids
+		path_directories = self._path_directories
+		path_names = self._path_names
+		first_path_id = len(path_names)
+		keys = []
+		offsets = array.array('I', [0])
+		for digest,files in pairs:
+			keys.append(encode_key(digest, sizes))
+			for f in files:
+				i = f.rfind('/') + 1
+				path_directories.append(directory_ids.setdefault(f[:i], len(directory_ids)))
+				path_names.append(name_ids.setdefault(f[i:], len(name_ids)))
+			offsets.append(len(path_names) - first_path_id)
+
+		# sort by binary key, and build digest blob and path id table
+		if len(set(map(len, keys))) > 1:
+			raise Exception('digest map keys must be digests of single algorithm')
+		order = sorted(range(len(keys)), key=keys.__getitem__)
+		sorted_offsets = array.array('I', [0])
+		path_ids = array.array('I')
+		for i in order:
+			path_ids.extend(range(first_path_id + offsets[i], first_path_id + offsets[i+1]))
+			sorted_offsets.append(len(path_ids))
+
+		return _CompactDigestMap(self, b''.join([ keys[i] for i in order ]), len(keys[0]) if len(keys) > 0 else 0, sorted_offsets, path_ids, sizes=sizes)
+
+
+	def _load_digest_map(self, digest_d, sizes=False):
+
+		'''
+		Method to return _CompactDigestMap for dictionary of {digest: [paths]}, unless already compacted while parsed
+
+		Args:
+			sizes (bool): If True, keys are decimal file sizes, as in size fixity block
+		'''
+
+		if type(digest_d) == _CompactDigestMap:
+			return digest_d
+		return self._compact_digest_map(digest_d.items(), sizes=sizes)
+
+
+	@property
+	def inventory(self):
+
+		'''
+		Property to return inventory as dictionary
+			- note: materializes full inventory, negating memory savings
+		'''
+
+		return self.to_inventory().inventory
+
+
+	@property
+	def id(self):
+
+		return self._scalars.get('id',None)
+
+
+	@property
+	def digestAlgorithm(self):
+
+		return self._scalars.get('digestAlgorithm',None)
+
+
+	@property
+	def manifest(self):
+
+		return self._manifest
+
+
+	@property
+	def fixity(self):
+
+		return self._fixity
+
+
+	def get_version_numbers(self):
+
+		'''
+		Convenience method to return version numbers
+		'''
+
+		version_nums = [ int(v.split('v')[-1]) for v in self._versions.keys() ]
+		version_nums.sort()
+		return version_nums
+
+
+	def get_version_entry(self, version):
+
+		'''
+		Convenience function to return version entry, with state as read-only mapping
+		'''
+
+		# handle int or strings
+		if type(version) == int:
+			v_key = 'v%s' % version
+		elif type(version) == str:
+			v_key = version
+
+		if v_key in self._versions:
+			v_meta, v_state = self._versions[v_key]
+			v_dict = dict(v_meta)
+			v_dict['state'] = v_state
+			return v_dict
+		else:
+			return None
+
+
+	def to_inventory(self):
+
+		'''
+		Method to expand to OCFLObjectInventory
+
+		Returns:
+			OCFLObjectInventory
+		'''
+
+		inventory = dict(self._scalars)
+		inventory['manifest'] = self._manifest.to_dict()
+		if self._fixity != None:
+			inventory['fixity'] = { algo:fixity_map.to_dict() for algo,fixity_map in self._fixity.items() }
+		inventory['versions'] = {}
+		for v_key in self._versions.keys():
+			v_dict = self.get_version_entry(v_key)
+			v_dict['state'] = v_dict['state'].to_dict()
+			inventory['versions'][v_key] = v_dict
+		expanded = OCFLObjectInventory(inventory=inventory)
+		expanded.dirty_sections = set(self.dirty_sections)
+		return expanded
+
+
+	def set_id(self, obj_id):
+
+		'''
+		Method to set id of inventory
+		'''
+
+		if self._scalars.get('id') != obj_id:
+			self._scalars['id'] = obj_id
+			self.dirty_sections.add('id')
+
+
+	def _read_only(self, *args, **kwargs):
+		raise Exception('OCFLCompactInventory is read-only, expand with to_inventory() before modifying')
+
+	new = _read_only
+	update_file_sizes = _read_only
+	set_head = _read_only
+	set_manifest = _read_only
+	set_version_message = _read_only
+	update_version_state = _read_only
+	update_fixity = _read_only
+	remove_file_from_manifest = _read_only
+	remove_files_from_manifest = _read_only
+	remove_files_from_fixity = _read_only
+
+
+
+class _CompactDigestMap(collections.abc.Mapping):
+
+	'''
+	Read-only mapping of hex digest to list of paths, backed by OCFLCompactInventory tables
+	'''
+
+	def __init__(self, compact_inventory, digests, digest_size, offsets, path_ids, sizes=False):
+
+		self._inventory = compact_inventory
+		self._digests = digests
+		self._digest_size = digest_size
+		self._offsets = offsets
+		self._path_ids = path_ids
+		self._sizes = sizes
+
+
+	@staticmethod
+	def encode_key(digest, sizes=False):
+
+		'''
+		Method to return binary key for hex digest, or decimal size as 8 byte integer
+		'''
+
+		if sizes:
+			return int(digest).to_bytes(8, 'big')
+		return bytes.fromhex(digest)
+
+
+	def _find(self, digest):
+
+		'''
+		Method to binary search for index of hex digest, returning None if not present
+		'''
+
+		try:
+			key = self.encode_key(digest, self._sizes)
+		except (TypeError, ValueError, OverflowError):
+			return None
+
+		size = self._digest_size
+		lo, hi = 0, len(self)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self._digests[mid*size:(mid+1)*size] < key:
+				lo = mid + 1
+			else:
+				hi = mid
+		if lo < len(self) and self._digests[lo*size:(lo+1)*size] == key:
+			return lo
+		return None
+
+
+	def __getitem__(self, digest):
+
+		i = self._find(digest)
+		if i == None:
+			raise KeyError(digest)
+		return [ self._inventory._get_path(path_id) for path_id in self._path_ids[self._offsets[i]:self._offsets[i+1]] ]
+
+
+	def __contains__(self, digest):
+
+		return self._find(digest) != None
+
+
+	def __iter__(self):
+
+		size = self._digest_size
+		for i in range(len(self)):
+			if self._sizes:
+				yield str(int.from_bytes(self._digests[i*size:(i+1)*size], 'big'))
+			else:
+				yield self._digests[i*size:(i+1)*size].hex()
+
+
+	def __len__(self):
+
+		return len(self._offsets) - 1
+
+
+	def to_dict(self):
+
+		'''
+		Method to return mapping as dictionary of {digest: [paths]}
+		'''
+
+		return { digest:files for digest,files in self.items() }
+
+
+
+class OCFLMetrics(object):
+
+	'''
+	Class for instrumentation of pyocfl operations, dispatching counters and timings to attached collectors
+		- when no collectors are attached, instrumented code skips all metric work
+		- metrics from storage root operations run with processes are recorded in worker processes, and not collected
+	'''
+
+	def __init__(self):
+
+		self.collectors = []
+		self.enabled = False
+
+
+	def add_collector(self, collector):
+
+		'''
+		Method to attach collector
+
+		Args:
+			collector (OCFLMetricsCollector): collector receiving counters and timings
+
+		Returns:
+			(OCFLMetricsCollector): collector
+		'''
+
+		self.collectors = self.collectors + [collector]
+		self.enabled = True
+		return collector
+
+
+	def remove_collector(self, collector):
+
+		'''
+		Method to detach collector
+		'''
+
+		self.collectors = [ c for c in self.collectors if c is not collector ]
+		self.enabled = len(self.collectors) > 0
+
+
+	def incr(self, name, value=1):
+
+		'''
+		Method to increment counter, e.g. 'bytes_hashed'
+		'''
+
+		for collector in self.collectors:
+			collector.incr(name, value)
+
+
+	def observe(self, name, seconds):
+
+		'''
+		Method to record timing, in seconds, e.g. 'inventory_parse'
+		'''
+
+		for collector in self.collectors:
+			collector.observe(name, seconds)
+
+
+	def timer(self, name):
+
+		'''
+		Method to return context manager timing enclosed block
+
+		Args:
+			name (str): name of timing, e.g. 'update_reconcile_deltas'
+		'''
+
+		if not self.enabled:
+			return contextlib.nullcontext()
+		return self._timer(name)
+
+
+	@contextlib.contextmanager
+	def _timer(self, name):
+
+		stime = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(name, time.perf_counter() - stime)
+
+
+
+class OCFLMetricsCollector(object):
+
+	'''
+	Class to accumulate counters and timings in memory
+		- subclass and override incr and observe to forward metrics elsewhere
+	'''
+
+	def __init__(self):
+
+		self._lock = threading.Lock()
+		self.reset()
+
+
+	def reset(self):
+
+		'''
+		Method to clear accumulated metrics
+		'''
+
+		with self._lock:
+			self.counters = {}
+			self.timings = {}
+
+
+	def incr(self, name, value=1):
+
+		with self._lock:
+			self.counters[name] = self.counters.get(name, 0) + value
+
+
+	def observe(self, name, seconds):
+
+		with self._lock:
+			count, total = self.timings.get(name, (0, 0.0))
+			self.timings[name] = (count + 1, total + seconds)
+
+
+
+class OCFLPrometheusTextfileCollector(OCFLMetricsCollector):
+
+	'''
+	Class to accumulate metrics and write them in Prometheus text exposition format,
+	e.g. for the node_exporter textfile collector
+		- counters are written as <prefix>_<name>_total
+		- timings are written as summaries <prefix>_<name>_seconds, with _sum and _count
+	'''
+
+	def __init__(self, path, prefix='pyocfl'):
+
+		'''
+		Args:
+			path (str): Path of .prom file to write
+			prefix (str): Prefix for metric names
+		'''
+
+		self.path = path
+		self.prefix = prefix
+		super().__init__()
+
+
+	def render(self):
+
+		'''
+		Method to render accumulated metrics
+
+		Returns:
+			(str): metrics in Prometheus text exposition format
+		'''
+
+		with self._lock:
+			counters = dict(self.counters)
+			timings = dict(self.timings)
+
+		lines = []
+		for name,value in sorted(counters.items()):
+			metric = '%s_%s_total' % (self.prefix, name)
+			lines.append('# TYPE %s counter' % metric)
+			lines.append('%s %s' % (metric, value))
+		for name,(count,total) in sorted(timings.items()):
+			metric = '%s_%s_seconds' % (self.prefix, name)
+			lines.append('# TYPE %s summary' % metric)
+			lines.append('%s_sum %s' % (metric, repr(total)))
+			lines.append('%s_count %s' % (metric, count))
+		return '\n'.join(lines) + '\n'
+
+
+	def write(self):
+
+		'''
+		Method to write rendered metrics to path, atomically replacing previous file
+		'''
+
+		tmp_path = '%s.%s.tmp' % (self.path, os.getpid())
+		with open(tmp_path, 'w') as f:
+			f.write(self.render())
+		os.replace(tmp_path, self.path)
+
+
+
+# module metrics, see OCFLMetrics.add_collector
+metrics = OCFLMetrics()
 
-		# remove file entry
-		manifest[digest].remove(filepath)
 
-		# update inventory with modified manifest
-		self.inventory.update({'manifest':manifest})
 
 
 
@@ -57,17 +57,63 @@ def cd(args):
 	# identifier
 	obj_id = args.args[0]
 
-	# get path of identifier
-	obj = sr.get_object(obj_id)
+	# get path of identifier, without reading object
+	obj = sr.get_object(obj_id, auto_load=False)
 
 	# if obj exists, jump to path
-	if obj:
+	if obj.exists:
 		print(obj.full_path)
 	# else, raise exception
 	else:
 		raise Exception('OCFL Object could not be found for identifier: %s' % obj_id)
 
 
+def index(args):
+
+	'''
+	OS cmd to rebuild Object index for Storage Root
+	'''
+
+	# init OCFLStorageRoot instance
+	if args.args == []:
+		sr = OCFLStorageRoot(args.storage_root)
+	else:
+		sr = OCFLStorageRoot(args.args[0])
+
+	# confirm storage root
+	if not sr.verify_dec():
+		raise Exception('%s does not appear to be an OCFL Storage Root' % sr.path)
+
+	# rebuild
+	count = sr.rebuild_object_index()
+	print('indexed %s objects: %s' % (count, sr.object_index.path))
+
+
+def export(args):
+
+	'''
+	OS cmd to stream version of Object as archive to stdout
+	'''
+
+	# init OCFLStorageRoot instance
+	sr = OCFLStorageRoot(args.storage_root)
+
+	# identifier, and optional version
+	obj_id = args.args[0]
+	version = args.args[1] if len(args.args) > 1 else None
+	if version != None and version.isdigit():
+		version = int(version)
+
+	# get object, confirming exists before reading
+	obj = sr.get_object(obj_id, auto_load=False)
+	if not obj.exists:
+		raise Exception('OCFL Object could not be found for identifier: %s' % obj_id)
+
+	# stream archive
+	obj.export_archive(sys.stdout.buffer, version=version, format=args.format)
+	sys.stdout.buffer.flush()
+
+
 def mv(args):
 
 	'''
@@ -90,6 +136,8 @@ def tree(args):
 cmd_map = {
 	'ls':ls,
 	'cd':cd,
+	'index':index,
+	'export':export,
 	'mv':mv,
 	'tree':tree
 }
@@ -110,6 +158,9 @@ def main():
 	# ls
 	parser.add_argument('--ids', action='store_true', required=False)
 
+	# export
+	parser.add_argument('--format', action='store', default='tar', required=False, choices=['tar','tar.gz','zip'], help='archive format for export')
+
 	# parse args
 	args = parser.parse_args()
 	logger.debug(args)
@@ -1,14 +1,27 @@
 # unit tests for pyocfl
 
 # standard library
+import asyncio
+import concurrent.futures
 from distutils.dir_util import copy_tree
+import hashlib
+import io
 import os
 import pdb
 import pytest
 import shutil
+import sqlite3
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import tracemalloc
 import uuid
+import zipfile
 
 # pyocfl
+import pyocfl.pyocfl
 from pyocfl.pyocfl import *
 
 
@@ -18,6 +31,8 @@ from pyocfl.pyocfl import *
 ############################
 TESTS_DIR = os.path.join('test_data', 'test_%s' % uuid.uuid4().hex)
 TEARDOWN = True
+IMPORT_TIME_BUDGET = 0.25 # seconds, best of 5 runs
+LAZY_MODULES = ['asyncio','distutils','namaste','pdb','pypairtree','sqlite3','tarfile','uuid','zipfile']
 
 
 
@@ -170,6 +185,65 @@ class TestOCFLObject(object):
 		sr.add_object(obj, 'ocfl_obj1')
 
 
+	def test_batch_ingest(self):
+
+		'''
+		Test adding objects, or creating objects in storage root, hashes content while copying, reading each byte once
+		'''
+
+		# create objects from copies of raw directory
+		objs = []
+		for i in range(4):
+			obj_path = os.path.join(TESTS_DIR, 'ingest_objs/obj%s' % i)
+			copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+			obj = OCFLObject(obj_path)
+			obj.new()
+			objs.append(obj)
+		content_files = os.listdir(os.path.join(objs[0].full_path, 'v1/content'))
+		content_bytes = sum([ os.path.getsize(os.path.join(objs[0].full_path, 'v1/content', f)) for f in content_files ])
+		source_manifests = [ obj.object_inventory.manifest for obj in objs ]
+
+		# create storage root, and add objects concurrently
+		sr = OCFLStorageRoot('%s/sr_ingest' % TESTS_DIR)
+		sr.new()
+		collector = metrics.add_collector(OCFLMetricsCollector())
+		try:
+			added = sr.add_objects([ (obj, 'ingest_%s' % i) for i,obj in enumerate(objs) ], workers=2)
+		finally:
+			metrics.remove_collector(collector)
+
+		# assert each content byte read once
+		assert added == objs
+		assert collector.counters['files_copied'] == collector.counters['files_hashed'] == len(content_files) * len(objs)
+		assert collector.counters['bytes_hashed'] == content_bytes * len(objs)
+
+		# assert stored objects match sources, and inventories match digests from disk
+		for i,obj in enumerate(objs):
+			stored = sr.get_object('ingest_%s' % i)
+			assert stored.full_path == obj.full_path
+			assert stored.object_inventory.manifest == source_manifests[i]
+			assert stored.object_inventory.manifest == stored.calc_file_digests([os.path.join(stored.full_path, 'v1/content')])
+			assert stored.quick_audit() == True
+
+		# create object in storage root from directory, assert each content byte read once, and directory unchanged
+		raw_path = os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5')
+		raw_files = sorted(os.listdir(raw_path))
+		obj = OCFLObject(raw_path)
+		collector = metrics.add_collector(OCFLMetricsCollector())
+		try:
+			obj.new(obj_id='ingest_raw', storage_root=sr, workers=2)
+		finally:
+			metrics.remove_collector(collector)
+		assert collector.counters['files_copied'] == collector.counters['files_hashed'] == len(content_files)
+		assert collector.counters['bytes_hashed'] == content_bytes
+		assert sorted(os.listdir(raw_path)) == raw_files
+		stored = sr.get_object('ingest_raw')
+		assert stored.full_path == obj.full_path
+		assert stored.object_inventory.manifest == source_manifests[0]
+		assert stored.object_inventory.manifest == stored.calc_file_digests([os.path.join(stored.full_path, 'v1/content')])
+		assert stored.quick_audit() == True
+
+
 	def test_get_obj_by_id(self):
 
 		'''
@@ -381,6 +455,150 @@ class TestOCFLObject(object):
 		])
 
 
+	def test_checkout_modes(self):
+
+		'''
+		Test checkout materialization modes, serially and concurrently
+		'''
+
+		# load reconcile storage root
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+		v2_state = obj.object_inventory.get_version_entry(2)['state']
+
+		for mode in ['copy','hardlink','reflink','symlink']:
+			for workers in [None, 4]:
+
+				# checkout, assert digests match version state
+				output_path = '%s/checkouts/modes/%s_%s' % (TESTS_DIR, mode, workers)
+				obj.checkout(output_path, version=2, mode=mode, workers=workers)
+				assert obj.calc_file_digests([output_path], version_state=True) == v2_state
+
+		# assert links
+		output_path = '%s/checkouts/modes' % TESTS_DIR
+		stored = os.path.join(obj.full_path, 'v1/content/foo.xml')
+		assert os.stat(os.path.join(output_path, 'hardlink_None/foo.xml')).st_ino == os.stat(stored).st_ino
+		assert os.path.realpath(os.path.join(output_path, 'symlink_None/foo.xml')) == os.path.realpath(stored)
+
+		# assert overwriting linked checkout with copy does not write through to stored content
+		obj.checkout('%s/hardlink_None' % output_path, version=3)
+		obj.checkout('%s/symlink_None' % output_path, version=3)
+		assert not os.path.islink(os.path.join(output_path, 'symlink_None/foo.xml'))
+		assert obj.calc_file_digests([os.path.join(obj.full_path, 'v1/content')], version_state=True) == obj.object_inventory.get_version_entry(1)['state']
+
+		# assert unknown mode
+		with pytest.raises(Exception):
+			obj.checkout('%s/bad' % output_path, mode='teleport')
+
+
+	def test_selective_checkout(self):
+
+		'''
+		Test checkout of logical paths by pattern and explicit list
+		'''
+
+		# load reconcile storage root
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+		output_path = '%s/checkouts/selective' % TESTS_DIR
+
+		# include pattern
+		obj.checkout('%s/include' % output_path, version=1, include='level1/*')
+		assert glob.glob('%s/include/**/*.*' % output_path, recursive=True) == ['%s/include/level1/level2/bar.txt' % output_path]
+
+		# exclude pattern
+		obj.checkout('%s/exclude' % output_path, version=1, exclude=['*.txt'])
+		assert glob.glob('%s/exclude/**/*.*' % output_path, recursive=True) == ['%s/exclude/foo.xml' % output_path]
+
+		# explicit paths
+		obj.checkout('%s/paths' % output_path, version=1, paths=['foo.xml','to_be_gone.txt'])
+		assert sorted(os.listdir('%s/paths' % output_path)) == ['foo.xml','to_be_gone.txt']
+		with pytest.raises(Exception):
+			obj.checkout('%s/missing' % output_path, version=1, paths=['not_a_file.txt'])
+
+		# explicit paths, filtered by pattern
+		obj.checkout('%s/paths_exclude' % output_path, version=1, paths=['foo.xml','to_be_gone.txt'], exclude='*.txt')
+		assert os.listdir('%s/paths_exclude' % output_path) == ['foo.xml']
+
+
+	def test_open_file(self):
+
+		'''
+		Test reading files from version without checkout
+		'''
+
+		# load reconcile storage root
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+
+		# read whole file, assert matches stored content for each version
+		for v_num in obj.object_inventory.get_version_numbers():
+			with obj.open('foo.xml', version=v_num) as f:
+				data = f.read()
+			assert hashlib.md5(data).hexdigest() == f.digest
+
+		# byte range, seeking, and chunks
+		with obj.open('foo.xml') as f:
+			data = f.read()
+		with obj.open('foo.xml', start=2, end=10) as f:
+			assert f.size == 8
+			assert f.read() == data[2:10]
+			f.seek(-3, io.SEEK_END)
+			assert f.read(2) == data[7:9]
+			f.seek(0)
+			assert b''.join(f.iter_chunks(chunk_size=3)) == data[2:10]
+
+		# assert missing logical path
+		with pytest.raises(Exception):
+			obj.open('not_a_file.txt')
+
+
+	def test_export_archive(self):
+
+		'''
+		Test streaming version as tar and zip archives
+		'''
+
+		# load reconcile storage root
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+		v2_state = obj.object_inventory.get_version_entry(2)['state']
+		v2_digests = { filepath:digest for digest,filepaths in v2_state.items() for filepath in filepaths }
+
+		# write-only sink, confirming archive does not require seeking
+		class Sink(io.RawIOBase):
+			def __init__(self):
+				self.data = bytearray()
+			def writable(self):
+				return True
+			def write(self, b):
+				self.data.extend(b)
+				return len(b)
+
+		for format in ['tar','tar.gz','zip']:
+
+			sink = Sink()
+			count = obj.export_archive(sink, version=2, format=format, prefix='v2')
+			assert count == len(v2_digests)
+
+			# read back, assert digests match version state
+			if format == 'zip':
+				with zipfile.ZipFile(io.BytesIO(sink.data)) as zf:
+					archived = { name:hashlib.md5(zf.read(name)).hexdigest() for name in zf.namelist() }
+			else:
+				with tarfile.open(fileobj=io.BytesIO(sink.data)) as tar:
+					archived = { member.name:hashlib.md5(tar.extractfile(member).read()).hexdigest() for member in tar.getmembers() }
+			assert archived == { 'v2/%s' % filepath:digest for filepath,digest in v2_digests.items() }
+
+		# assert unknown format
+		with pytest.raises(Exception):
+			obj.export_archive(io.BytesIO(), format='rar')
+
+
 	def test_fixity_calculate(self):
 
 		'''
@@ -444,35 +662,1018 @@ class TestOCFLObject(object):
 		assert obj.check_fixity()
 
 
+	def test_fixity_multiple_algorithms(self):
 
+		'''
+		Test calculation and checking of multiple fixity algorithms in a single pass
+		'''
 
+		# load sr2
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
 
+		# get obj with 100 files
+		obj = sr.get_object('3a3f43c170434837beb7cef86859ad3c')
 
+		# calc md5 and sha256 together, assert matches single algorithm calculation
+		fixity_d = obj.calc_fixity(fixity_algo=['md5','sha256'])
+		assert set(fixity_d.keys()) == set(['md5','sha256'])
+		assert fixity_d['sha256'] == obj.calc_fixity(fixity_algo='sha256', update_fixity=False)['sha256']
+		assert fixity_d['md5'] == obj.object_inventory.manifest
 
+		# check together
+		assert obj.check_fixity(fixity_algo=['md5','sha256'])
 
+		# modify 1.txt, assert failures reported per algorithm
+		with open(os.path.join(obj.full_path, 'v1/content/1.txt'), 'w') as f:
+			f.write('THIS FILE HAS BEEN CHANGED.')
+		results = obj.check_fixity(fixity_algo=['md5','sha256'])
+		assert set(results.keys()) == set(['md5','sha256'])
 
 
+	def test_digest_cache(self):
 
+		'''
+		Test that files with unchanged stat are not re-hashed when digest cache is configured
+		'''
 
+		# load sr2 with digest cache
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location, digest_cache=True)
+		assert type(sr.digest_cache) == OCFLDigestCache
 
+		# get obj with 100 files, and populate cache
+		obj = sr.get_object('3a3f43c170434837beb7cef86859ad3c')
+		obj.update()
+		assert os.path.exists(os.path.join(storage_location, DEFAULT_DIGEST_CACHE_FILENAME))
+
+		# count file reads
+		hashed = []
+		calc_file_multi_digest = obj._calc_file_multi_digest
+		def counting_calc_file_multi_digest(filepath, file_digest_algos):
+			if '/content/' in filepath:
+				hashed.append(filepath)
+			return calc_file_multi_digest(filepath, file_digest_algos)
+		obj._calc_file_multi_digest = counting_calc_file_multi_digest
+
+		# update again, assert nothing re-hashed
+		manifest = obj.object_inventory.manifest
+		obj.update()
+		assert hashed == []
+		assert obj.object_inventory.manifest == manifest
 
+		# modify file, assert only that file re-hashed
+		with open(os.path.join(obj.full_path, 'v1/content/2.txt'), 'w') as f:
+			f.write('THIS FILE HAS BEEN CHANGED, AND IS LONGER.')
+		obj.update()
+		assert hashed == [os.path.join(obj.full_path, 'v1/content/2.txt')]
 
+		# fixity written without cache reads all content
+		hashed.clear()
+		collector = metrics.add_collector(OCFLMetricsCollector())
+		try:
+			obj.calc_fixity(update_fixity=True, use_digest_cache=False)
+		finally:
+			metrics.remove_collector(collector)
+		assert len(hashed) == 100
+		assert collector.counters.get('digest_cache_hits', 0) == 0
 
+		# fixity checks bypass cache
+		hashed.clear()
+		assert obj.check_fixity() == True
+		assert len(hashed) == 100
+		sr.digest_cache.close()
 
 
+	def test_incremental_update(self):
 
+		'''
+		Test incremental update hashes only versions not yet recorded in inventory
+		'''
 
+		# create object from raw directory
+		obj = OCFLObject(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj2'))
+		obj.new()
+		v1_state = obj.object_inventory.get_version_entry(1)['state']
 
+		# create v2 as copy of v1, with additional file
+		copy_tree(os.path.join(obj.full_path, 'v1'), os.path.join(obj.full_path, 'v2'))
+		with open(os.path.join(obj.full_path, 'v2/content/f3.txt'), 'w') as f:
+			f.write('This is a new file for v2')
 
+		# count file reads
+		hashed = []
+		calc_file_multi_digest = obj._calc_file_multi_digest
+		def counting_calc_file_multi_digest(filepath, file_digest_algos):
+			if '/content/' in filepath:
+				hashed.append(filepath)
+			return calc_file_multi_digest(filepath, file_digest_algos)
+		obj._calc_file_multi_digest = counting_calc_file_multi_digest
 
+		# update incrementally, assert only v2 hashed, once each
+		assert obj.get_untracked_version_numbers() == [2]
+		obj.update(incremental=True)
+		assert sorted(hashed) == sorted([ os.path.join(obj.full_path, 'v2/content', f) for f in ['f1.txt','f2.txt','f3.txt'] ])
 
+		# assert inventory
+		assert obj.object_inventory.get_version_entry(1)['state'] == v1_state
+		v2_state = obj.object_inventory.get_version_entry(2)['state']
+		assert sorted([ f for files in v2_state.values() for f in files ]) == ['f1.txt','f2.txt','f3.txt']
+		assert sorted([ f for files in obj.object_inventory.manifest.values() for f in files ]) == ['v1/content/f1.txt','v1/content/f2.txt','v2/content/f3.txt']
+		assert os.listdir(os.path.join(obj.full_path, 'v2/content')) == ['f3.txt']
 
 
+		# assert repeated incremental update and reconciliation leaves object unchanged
+		inventory = json.loads(json.dumps(obj.object_inventory.inventory))
+		obj.update(incremental=True)
+		assert obj.object_inventory.inventory == inventory
+		assert os.listdir(os.path.join(obj.full_path, 'v2/content')) == ['f3.txt']
 
 
+	def test_add_version(self):
 
+		'''
+		Test adding version from directory copies only new content
+		'''
+
+		# create object from copy of raw directory, with fixity
+		copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj3'), os.path.join(TESTS_DIR, 'add_version_obj'))
+		obj = OCFLObject(os.path.join(TESTS_DIR, 'add_version_obj'))
+		obj.new()
+		obj.calc_fixity(fixity_algo='sha256')
+
+		# checkout v1, then modify
+		source_dir = os.path.join(TESTS_DIR, 'add_version_source')
+		obj.checkout(source_dir)
+		with open(os.path.join(source_dir, 'waterbottle.txt'), 'a') as f:
+			f.write('refilled')
+		os.makedirs(os.path.join(source_dir, 'copies'))
+		shutil.copyfile(os.path.join(source_dir, 'waterbottle.txt'), os.path.join(source_dir, 'copies/waterbottle_copy.txt'))
+		with open(os.path.join(source_dir, 'lid.txt'), 'w') as f:
+			f.write('lid')
+
+		# add as new version, and add unchanged version
+		assert obj.add_version(source_dir, message='refilled waterbottle') == 'v2'
+		assert obj.add_version(source_dir, message='no changes') == 'v3'
+
+		# assert only new digests stored, once
+		assert sorted(glob.glob('%s/v2/content/**/*' % obj.full_path, recursive=True)) == sorted([
+			'%s/v2/content/lid.txt' % obj.full_path,
+			'%s/v2/content/waterbottle.txt' % obj.full_path
+		])
+		assert os.listdir(os.path.join(obj.full_path, 'v3/content')) == []
+
+		# assert inventory
+		assert obj.object_inventory.inventory['head'] == 'v3'
+		assert obj.object_inventory.get_version_entry(2)['message'] == 'refilled waterbottle'
+		assert obj.object_inventory.get_version_entry(3)['state'] == obj.object_inventory.get_version_entry(2)['state']
+		assert sorted([ f for files in obj.object_inventory.get_version_entry(2)['state'].values() for f in files ]) == ['copies/waterbottle_copy.txt','lid.txt','waterbottle.txt']
+		assert obj.check_fixity(fixity_algo='sha256')
+
+		# assert full update finds inventory consistent with disk
+		manifest = obj.object_inventory.manifest
+		obj.write_inventories()
+		assert obj.object_inventory.manifest == manifest
+
+		# assert checkout of new version matches source
+		obj.checkout(os.path.join(TESTS_DIR, 'add_version_checkout'), version=3)
+		assert obj.calc_file_digests([os.path.join(TESTS_DIR, 'add_version_checkout')], version_state=True) == obj.calc_file_digests([source_dir], version_state=True)
+
+
+	def test_inventory_writes(self):
+
+		'''
+		Test inventories written atomically, with sidecars matching written bytes, and compact encoding
+		'''
+
+		# create object from copy of raw directory, writing compact inventories
+		obj_path = os.path.join(TESTS_DIR, 'inventory_write_obj')
+		copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+		obj = OCFLObject(obj_path, compact_json=True)
+		obj.new()
+
+		# add version, duplicating file so reconciliation updates manifest
+		source_dir = os.path.join(TESTS_DIR, 'inventory_write_source')
+		obj.checkout(source_dir)
+		with open(os.path.join(source_dir, 'new.txt'), 'w') as f:
+			f.write('new')
+		obj.add_version(source_dir)
+		shutil.copytree(os.path.join(obj_path, 'v2'), os.path.join(obj_path, 'v3'))
+		obj.update()
+
+		# assert sidecars match, and compact encoding
+		for inv_path in [ obj_path ] + [ os.path.join(obj_path, 'v%s' % v) for v in [1,2,3] ]:
+			with open(os.path.join(inv_path, 'inventory.json'), 'rb') as f:
+				data = f.read()
+			with open(os.path.join(inv_path, 'inventory.json.md5')) as f:
+				assert f.read() == hashlib.md5(data).hexdigest()
+			assert b'\n' not in data
+		assert json.loads(data) == obj.object_inventory.get_version_entry(3)
 
+		# assert no temporary files remain
+		assert glob.glob('%s/**/*.tmp' % obj_path, recursive=True) == []
 
+		# assert default encoding readable
+		obj.object_inventory.save(obj_path)
+		with open(os.path.join(obj_path, 'inventory.json')) as f:
+			assert json.load(f) == obj.object_inventory.inventory
+
+
+	def test_dirty_inventory_writes(self):
+
+		'''
+		Test only inventories changed since last write are written
+		'''
 
+		# create object from copy of raw directory, and add versions
+		obj_path = os.path.join(TESTS_DIR, 'dirty_write_obj')
+		copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+		obj = OCFLObject(obj_path)
+		obj.new()
+		source_dir = os.path.join(TESTS_DIR, 'dirty_write_source')
+		obj.checkout(source_dir)
+		for i in range(3):
+			with open(os.path.join(source_dir, 'new.txt'), 'w') as f:
+				f.write('new %s' % i)
+			obj.add_version(source_dir)
+		assert not obj.object_inventory.is_dirty
+
+		collector = metrics.add_collector(OCFLMetricsCollector())
+		try:
+
+			# add version, assert only inventory.json and new version written
+			v3_mtime = os.stat(os.path.join(obj_path, 'v3/inventory.json')).st_mtime_ns
+			with open(os.path.join(source_dir, 'new.txt'), 'w') as f:
+				f.write('newer')
+			obj.add_version(source_dir, message='newer')
+			assert collector.counters['inventories_written'] == 2
+			assert os.stat(os.path.join(obj_path, 'v3/inventory.json')).st_mtime_ns == v3_mtime
+
+			# update of unchanged object, full and incremental, writes nothing
+			collector.reset()
+			obj = OCFLObject(obj_path)
+			obj.update()
+			obj.update(incremental=True)
+			assert collector.counters.get('inventories_written', 0) == 0
+
+			# version copied on disk, assert only inventory.json and new version written
+			shutil.copytree(os.path.join(obj_path, 'v5'), os.path.join(obj_path, 'v6'))
+			obj.update(incremental=True)
+			assert collector.counters['inventories_written'] == 2
+			with open(os.path.join(obj_path, 'v6/inventory.json')) as f:
+				assert json.load(f) == obj.object_inventory.get_version_entry(6)
+
+		finally:
+			metrics.remove_collector(collector)
+
+		# assert missing version inventory restored
+		os.remove(os.path.join(obj_path, 'v2/inventory.json'))
+		obj.update()
+		assert os.path.exists(os.path.join(obj_path, 'v2/inventory.json'))
+
+
+	def test_reconcile_many_versions(self):
+
+		'''
+		Test reconciliation across many versions removes only files present in ancestors
+		'''
+
+		# create object from raw directory
+		obj = OCFLObject(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj4'))
+		obj.new()
+
+		# create versions, each copy of previous with one new file
+		for v_num in range(2, 11):
+			copy_tree(os.path.join(obj.full_path, 'v%s' % (v_num-1)), os.path.join(obj.full_path, 'v%s' % v_num))
+			for f in os.listdir(os.path.join(obj.full_path, 'v%s/content' % (v_num-1))):
+				if f.startswith('new_'):
+					os.remove(os.path.join(obj.full_path, 'v%s/content' % v_num, f))
+			with open(os.path.join(obj.full_path, 'v%s/content/new_%s.txt' % (v_num, v_num)), 'w') as f:
+				f.write('file new in v%s' % v_num)
+
+			# materialize full state of previous versions, as would be checked out
+			for prev_v_num in range(2, v_num):
+				with open(os.path.join(obj.full_path, 'v%s/content/new_%s.txt' % (v_num, prev_v_num)), 'w') as f:
+					f.write('file new in v%s' % prev_v_num)
+		obj.update(incremental=True)
+
+		# assert each version stores only its new file
+		for v_num in range(2, 11):
+			assert os.listdir(os.path.join(obj.full_path, 'v%s/content' % v_num)) == ['new_%s.txt' % v_num]
+			assert len(obj.object_inventory.get_version_entry(v_num)['state']) == v_num
+		assert len(obj.object_inventory.manifest) == 10
+
+
+	def test_parallel_digests(self):
+
+		'''
+		Test concurrent hashing produces output identical to serial hashing
+		'''
+
+		# load sr2
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
 
+		# get obj with 100 files
+		obj = sr.get_object('3a3f43c170434837beb7cef86859ad3c')
+		v_paths = [os.path.join(obj.full_path,'v1/content')]
+
+		# assert identical, including order of files per digest
+		serial = obj.calc_file_digests(v_paths, file_digest_algo=['md5','sha256'])
+		parallel = obj.calc_file_digests(v_paths, file_digest_algo=['md5','sha256'], workers=4)
+		assert serial == parallel
+		assert list(serial['md5'].keys()) == list(parallel['md5'].keys())
+
+		# assert fixity check with workers
+		obj.calc_fixity(fixity_algo='sha256', workers=4)
+		assert obj.check_fixity(fixity_algo='sha256', workers=4)
+
+		# assert files submitted as results consumed, bounding tasks in flight
+		submitted = []
+		files = ( submitted.append(f) or f for f in obj._list_files(v_paths[0], files_only=True) )
+		with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+			for i,digests in enumerate(pyocfl.pyocfl._map_bounded(executor, lambda f: obj._calc_file_multi_digest(f, ['md5']), files, 8)):
+				assert len(submitted) <= i + 8
+		assert len(submitted) == 100
+
+
+	def test_compact_inventory(self):
+
+		'''
+		Test compact inventory provides same accessors as full inventory
+		'''
+
+		# load reconciled object with multiple versions, full and compact
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+		obj_compact = OCFLObject(obj.path, storage_root=sr, compact_inventory=True)
+		inv = obj.object_inventory
+		inv_compact = obj_compact.object_inventory
+		assert type(inv_compact) == OCFLCompactInventory
+
+		# assert accessors
+		assert obj_compact.id == obj.id
+		assert inv_compact.digestAlgorithm == inv.digestAlgorithm
+		assert inv_compact.manifest == inv.manifest
+		assert inv_compact.get_version_numbers() == inv.get_version_numbers()
+		for v_num in inv.get_version_numbers():
+			assert inv_compact.get_version_entry(v_num) == inv.get_version_entry(v_num)
+		assert 'not_a_digest' not in inv_compact.manifest
+		assert inv_compact.to_inventory().inventory == inv.inventory
+
+		# assert read-only
+		with pytest.raises(Exception):
+			inv_compact.update_fixity({})
+
+		# fixity check from compact inventory, then update expands inventory
+		obj_compact.calc_fixity()
+		assert type(obj_compact.object_inventory) == OCFLObjectInventory
+		obj_compact = OCFLObject(obj.path, storage_root=sr, compact_inventory=True)
+		assert obj_compact.object_inventory.fixity['md5'] == obj_compact.object_inventory.manifest
+		assert obj_compact.check_fixity()
+		assert sr.check_fixity(compact_inventory=True) == sr.check_fixity()
+
+		# assert parsed same as full inventory, for escaped and multiple paths, sizes, and each serialization
+		inventory = json.loads(json.dumps(obj.object_inventory.inventory))
+		inventory['manifest'][hashlib.new(inventory['digestAlgorithm'], b'dup').hexdigest()] = ['v1/content/\u00e9t\u00e9 "quoted"/a.txt', 'v1/content/b\\c.txt']
+		inventory['fixity'] = {'size': {'7':['v1/content/b\\c.txt'], '12':['v1/content/a.txt']}, 'md5': {}}
+		for text in [json.dumps(inventory, sort_keys=True, indent=4), json.dumps(inventory, separators=(',',':'), ensure_ascii=False)]:
+			assert OCFLCompactInventory(inventory=text).to_inventory().inventory == json.loads(text)
+		with pytest.raises(ValueError):
+			OCFLCompactInventory(inventory=json.dumps(inventory) + ' {}')
+
+		# assert peak memory of parse lower than full inventory
+		inventory = { 'digestAlgorithm':'sha512', 'id':'compact', 'manifest':{}, 'versions':{} }
+		for i in range(5000):
+			digest = hashlib.sha512(str(i).encode('utf-8')).hexdigest()
+			inventory['manifest'][digest] = [ 'v1/content/dir%s/file_%s.txt' % (i % 10, i) ]
+		for v_num in range(1, 4):
+			inventory['versions']['v%s' % v_num] = { 'created':'2020-01-01T00:00:00Z', 'state':{ digest:[ f.split('/',2)[-1] for f in files ] for digest,files in inventory['manifest'].items() } }
+		text = json.dumps(inventory, sort_keys=True, indent=4)
+		peaks = {}
+		for inventory_class in [OCFLObjectInventory, OCFLCompactInventory]:
+			tracemalloc.start()
+			try:
+				parsed = inventory_class(inventory=text)
+				peaks[inventory_class] = tracemalloc.get_traced_memory()[1]
+			finally:
+				tracemalloc.stop()
+		assert parsed.manifest.to_dict() == inventory['manifest']
+		assert peaks[OCFLCompactInventory] < peaks[OCFLObjectInventory] * 0.9
+
+
+
+class TestOCFLStorageRootFixity(object):
+
+	'''
+	Class for tests related to Storage Root fixity
+	'''
+
+	def test_parallel_fixity_audit(self):
+
+		'''
+		Test process pool fixity audit streams same results as serial audit
+		'''
+
+		# load sr2
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+
+		# calc fixity across process pool
+		results = list(sr.iter_calc_fixity(fixity_algo='sha256', processes=2))
+		assert len(results) == sr.count_objects()
+		assert all([ result == True for obj_path, obj_id, result in results ])
+
+		# check serially and across process pool, assert same results
+		serial = { obj_id:result for obj_path, obj_id, result in sr.iter_check_fixity(fixity_algo='sha256') }
+		parallel = { obj_id:result for obj_path, obj_id, result in sr.iter_check_fixity(fixity_algo='sha256', processes=2) }
+		assert serial == parallel
+		assert sr.check_fixity(fixity_algo='sha256', processes=2) == sr.check_fixity(fixity_algo='sha256')
+
+
+	def test_fixity_audit_storage_root_state(self):
+
+		'''
+		Test Storage Root fixity uses its digest cache and object index, and raises original exceptions
+		'''
+
+		# create storage root of objects, with digest cache and index
+		sr = OCFLStorageRoot('%s/sr_fixity_state' % TESTS_DIR)
+		sr.new()
+		sr = OCFLStorageRoot(sr.path, digest_cache=True, object_index=True)
+		objs = []
+		for i in range(2):
+			obj_path = os.path.join(TESTS_DIR, 'fixity_state_objs/obj%s' % i)
+			copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+			obj = OCFLObject(obj_path)
+			obj.new()
+			objs.append((obj, 'fixity_state_%s' % i))
+		sr.add_objects(objs)
+		file_count = sum([ len(os.listdir(os.path.join(obj.full_path, 'v1/content'))) for obj,obj_id in objs ])
+
+		# assert second calculation read from digest cache of Storage Root
+		sr.calc_fixity(fixity_algo='sha256')
+		collector = metrics.add_collector(OCFLMetricsCollector())
+		try:
+			sr.calc_fixity(fixity_algo='sha256')
+		finally:
+			metrics.remove_collector(collector)
+		assert collector.counters['digest_cache_hits'] >= file_count
+		assert collector.counters.get('digest_cache_misses', 0) == 0
+		assert collector.counters.get('files_hashed', 0) == 0
+
+		# assert process pool, scheduled by index sizes, matches
+		assert sr.object_index.get_sizes() == { obj.path:os.path.getsize(os.path.join(obj.full_path, 'v1/content/0.txt')) * (file_count // 2) for obj,obj_id in objs }
+		sr.calc_fixity(fixity_algo='sha256', processes=2)
+		assert sr.check_fixity(fixity_algo='sha256', processes=2) == True
+
+		# assert original exception raised, serially and across process pool
+		os.remove(os.path.join(objs[0][0].full_path, 'inventory.json'))
+		with pytest.raises(FileNotFoundError):
+			sr.calc_fixity(fixity_algo='sha256')
+		with pytest.raises(FileNotFoundError):
+			sr.calc_fixity(fixity_algo='sha256', processes=2)
+
+
+	def test_parallel_fixity_audit_digest_cache(self):
+
+		'''
+		Test process pool fixity audit populates shared digest cache, without holding its write lock
+		'''
+
+		# create storage root of objects, with empty digest cache
+		sr = OCFLStorageRoot('%s/sr_fixity_cache' % TESTS_DIR)
+		sr.new()
+		sr = OCFLStorageRoot(sr.path, digest_cache=True)
+		objs = []
+		for i in range(4):
+			obj_path = os.path.join(TESTS_DIR, 'fixity_cache_objs/obj%s' % i)
+			copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+			obj = OCFLObject(obj_path)
+			obj.new()
+			objs.append((obj, 'fixity_cache_%s' % i))
+		sr.add_objects(objs)
+		cache_path = os.path.join(sr.path, DEFAULT_DIGEST_CACHE_FILENAME)
+
+		# assert write lock released after each file, so other processes may write
+		obj = sr.get_object('fixity_cache_0')
+		other = sqlite3.connect(cache_path, timeout=0)
+		sr.digest_cache.calc_file_multi_digest(os.path.join(obj.full_path, 'v1/content/0.txt'), ['sha256'], obj._calc_file_multi_digest)
+		other.execute('BEGIN IMMEDIATE')
+		other.rollback()
+		other.close()
+		sr.digest_cache.close()
+
+		# calc fixity across process pool, assert each file cached once
+		sr.calc_fixity(fixity_algo='sha256', processes=2)
+		assert sr.check_fixity(fixity_algo='sha256', processes=2) == True
+		with sqlite3.connect(cache_path) as conn:
+			assert conn.execute("SELECT COUNT(*) FROM digests WHERE algo='sha256' AND path LIKE '%/content/%'").fetchone()[0] == 400
+
+
+
+	def test_quick_audit(self):
+
+		'''
+		Test stat-only audit reports missing, extra, and truncated files
+		'''
+
+		# load sr2, and record sizes for an object
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object(obj_path='b5940d25c1ad5f22a39e3e9921e8dcde')
+		obj.update()
+		file_sizes = obj.object_inventory.file_sizes
+		assert sorted(file_sizes.keys()) == sorted([ f for files in obj.object_inventory.manifest.values() for f in files ])
+		assert sr.quick_audit() == True
+
+		# assert sizes recorded as size fixity, read from compact inventory, and checked as fixity
+		assert obj.object_inventory.fixity['size'] == { str(size):[ f for f in file_sizes if file_sizes[f] == size ] for size in set(file_sizes.values()) }
+		obj_compact = OCFLObject(obj.path, storage_root=sr, compact_inventory=True)
+		assert obj_compact.object_inventory.file_sizes == file_sizes
+		assert obj_compact.object_inventory.fixity['size'].to_dict() == obj.object_inventory.fixity['size']
+		assert obj.check_fixity(fixity_algo='size') == True
+
+		# truncate, remove, and add files
+		truncated, removed = sorted(file_sizes.keys(), key=lambda f: file_sizes[f], reverse=True)[:2]
+		with open(os.path.join(obj.full_path, truncated), 'rb') as f:
+			truncated_data = f.read()
+		with open(os.path.join(obj.full_path, removed), 'rb') as f:
+			removed_data = f.read()
+		with open(os.path.join(obj.full_path, truncated), 'wb') as f:
+			f.write(truncated_data[:1])
+		os.remove(os.path.join(obj.full_path, removed))
+		with open(os.path.join(obj.full_path, 'v1/content/extra.txt'), 'w') as f:
+			f.write('extra')
+
+		# assert object and storage root audits, serial and across process pool
+		audit = {
+			'missing':[removed],
+			'extra':['v1/content/extra.txt'],
+			'size_mismatch':{ truncated:{'expected':len(truncated_data), 'actual':1} }
+		}
+		assert obj.quick_audit() == audit
+		assert sr.quick_audit() == { obj.id:audit }
+		assert sr.quick_audit(processes=2, compact_inventory=True) == { obj.id:audit }
+
+		# restore
+		with open(os.path.join(obj.full_path, truncated), 'wb') as f:
+			f.write(truncated_data)
+		with open(os.path.join(obj.full_path, removed), 'wb') as f:
+			f.write(removed_data)
+		os.remove(os.path.join(obj.full_path, 'v1/content/extra.txt'))
+		assert obj.quick_audit() == True
+
+
+	def test_throttled_fixity_audit(self):
+
+		'''
+		Test fixity audit limited by bytes and files per second, and paused by flag file
+		'''
+
+		# load sr2, with fixity, and object of 128 byte files
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		sr.calc_fixity(fixity_algo='md5')
+		obj = sr.get_object(obj_path='b5940d25c1ad5f22a39e3e9921e8dcde')
+		file_count = len(os.listdir(os.path.join(obj.full_path, 'v1/content')))
+
+		# bytes per second
+		obj.throttle = OCFLThrottle(bytes_per_sec=file_count * 128 * 4)
+		stime = time.time()
+		assert obj.check_fixity(fixity_algo='md5') == True
+		assert time.time() - stime >= 0.2
+
+		# files per second, across threads
+		obj.throttle = OCFLThrottle(files_per_sec=file_count * 4)
+		stime = time.time()
+		assert obj.check_fixity(fixity_algo='md5', workers=4) == True
+		assert time.time() - stime >= 0.2
+
+		# paused while flag file exists
+		pause_file = os.path.join(TESTS_DIR, 'audit.pause')
+		open(pause_file, 'w').close()
+		results = []
+		throttle = OCFLThrottle(pause_file=pause_file, poll_interval=0.05)
+		audit = threading.Thread(target=lambda: results.append(sr.check_fixity(fixity_algo='md5', throttle=throttle)))
+		audit.start()
+		time.sleep(0.3)
+		assert audit.is_alive()
+		os.remove(pause_file)
+		audit.join(timeout=10)
+		assert results == [True]
+
+		# shared across processes
+		assert sr.check_fixity(fixity_algo='md5', processes=2, throttle=OCFLThrottle(bytes_per_sec=10**9, files_per_sec=10**6)) == True
+
+
+	def test_audit_ledger(self):
+
+		'''
+		Test audits recorded in ledger, scheduled oldest verified first, resumed within budget, and failures recorded
+		'''
+
+		# create storage root of objects, with fixity
+		sr = OCFLStorageRoot('%s/sr_audit' % TESTS_DIR)
+		sr.new()
+		objs = []
+		for i in range(3):
+			obj_path = os.path.join(TESTS_DIR, 'audit_objs/obj%s' % i)
+			copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+			obj = OCFLObject(obj_path)
+			obj.new()
+			objs.append((obj, 'audit_%s' % i))
+		sr.add_objects(objs)
+		sr.calc_fixity(fixity_algo='md5')
+		obj_paths = list(sr.get_objects(as_ocfl_objects=False))
+		ledger = OCFLAuditLedger(os.path.join(TESTS_DIR, 'audit_ledger.sqlite'))
+
+		# first run bounded by max_objects, never verified objects audited first
+		audited = [ obj_path for obj_path, obj_id, result in sr.iter_audit(fixity_algo='md5', ledger=ledger, max_objects=1) ]
+		assert len(audited) == 1
+		assert ledger.count() == 1
+		assert ledger.schedule(obj_paths)[-1] == audited[0]
+
+		# resumed run audits remaining objects before first
+		resumed = [ obj_path for obj_path, obj_id, result in sr.iter_audit(fixity_algo='md5', ledger=ledger) ]
+		assert sorted(resumed) == sorted(obj_paths)
+		assert resumed[-1] == audited[0]
+		assert ledger.count() == ledger.count(result='pass') == len(obj_paths)
+
+		# across processes
+		assert sr.audit(fixity_algo='md5', ledger=ledger, processes=2) == True
+		assert ledger.count(result='pass') == len(obj_paths)
+
+		# manifest files recorded
+		obj = sr.get_object('audit_0')
+		files = ledger.get_files(obj.path)
+		assert set(files.keys()) == set([ f for fs in obj.object_inventory.manifest.values() for f in fs ])
+		assert set([ entry['result'] for entry in files.values() ]) == set(['pass'])
+
+		# corrupt file, failure recorded for object and file through audit
+		filepath = sorted(files.keys())[0]
+		with open(os.path.join(obj.full_path, filepath), 'ab') as f:
+			f.write(b'corrupt')
+		results = { obj_path:result for obj_path, obj_id, result in sr.iter_audit(fixity_algo='md5', ledger=ledger) }
+		assert results[obj.path] != True
+		assert [ obj_path for obj_path,result in results.items() if result != True ] == [obj.path]
+		assert ledger.get(obj.path)['result'] == 'fail'
+		assert ledger.get_files(obj.path)[filepath]['result'] == 'fail'
+		assert set([ entry['result'] for f,entry in ledger.get_files(obj.path).items() if f != filepath ]) == set(['pass'])
+		assert ledger.count(result='fail') == 1
+		assert 'audit_0' in sr.audit(fixity_algo='md5', ledger=ledger)
+
+
+class TestOCFLStorageRootIndex(object):
+
+	'''
+	Class for tests related to Storage Root object index
+	'''
+
+	def test_rebuild_index(self):
+
+		'''
+		Test rebuilding of index matches objects found on filesystem
+		'''
+
+		# load sr2
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+
+		# get objects from filesystem, then rebuild index
+		fs_obj_paths = sorted(sr.get_objects(as_ocfl_objects=False))
+		assert sr.rebuild_object_index() == len(fs_obj_paths)
+		assert os.path.exists(os.path.join(storage_location, DEFAULT_OBJECT_INDEX_FILENAME))
+
+		# assert listing and counting from index
+		sr = OCFLStorageRoot(storage_location)
+		assert sr.object_index != None
+		assert list(sr.get_objects(as_ocfl_objects=False)) == fs_obj_paths
+		assert sr.count_objects() == len(fs_obj_paths)
+
+		# assert index entry
+		obj_entry = sr.object_index.get(obj_id='3a3f43c170434837beb7cef86859ad3c')
+		assert obj_entry['head'] == 'v1'
+		assert obj_entry['file_count'] == 100
+
+
+	def test_index_add_move_object(self):
+
+		'''
+		Test index is kept current when adding and moving objects
+		'''
+
+		# create storage root with index
+		sr = OCFLStorageRoot('%s/sr_index' % TESTS_DIR, object_index=True)
+		sr.new()
+
+		# add object
+		obj = OCFLObject(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj3'))
+		obj.new()
+		sr.add_object(obj, 'ocfl_obj3')
+		assert sr.count_objects() == 1
+		assert sr.object_index.get(obj_id='ocfl_obj3')['path'] == obj.path
+
+		# move object
+		sr.move_object(obj, 'ocfl_obj300')
+		assert sr.count_objects() == 1
+		assert sr.object_index.get(obj_id='ocfl_obj3') == None
+		assert sr.object_index.get(obj_id='ocfl_obj300')['path'] == obj.path
+		assert list(sr.get_objects(as_ocfl_objects=False)) == list(sr.get_objects(as_ocfl_objects=False, use_index=False))
+
+		# assert size indexed from sizes recorded in inventory, without reading content files
+		byte_size = sum(obj.object_inventory.file_sizes.values())
+		content_file = os.path.join(obj.full_path, sorted(obj.object_inventory.file_sizes.keys())[0])
+		os.rename(content_file, '%s.moved' % content_file)
+		try:
+			sr.object_index.index_object(obj)
+		finally:
+			os.rename('%s.moved' % content_file, content_file)
+		assert sr.object_index.get(obj_id='ocfl_obj300')['byte_size'] == byte_size
+
+
+
+class TestOCFLStorageRootListing(object):
+
+	'''
+	Class for tests related to listing objects from Storage Root
+	'''
+
+	def test_walk_objects(self):
+
+		'''
+		Test walking of Storage Root stops at object roots, serially and concurrently
+		'''
+
+		# load sr2
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location, object_index=False)
+
+		# add file resembling object declaration to object content, which should not be walked
+		obj = sr.get_object('3a3f43c170434837beb7cef86859ad3c')
+		os.makedirs(os.path.join(obj.full_path, 'v1/content/nested'))
+		open(os.path.join(obj.full_path, 'v1/content/nested/0=ocfl_object_1.0'), 'w').close()
+
+		# assert serial and concurrent walks match declarations at object roots only
+		obj_paths = sorted([ d for d in os.listdir(storage_location) if os.path.exists(os.path.join(storage_location, d, '0=ocfl_object_1.0')) ])
+		assert list(sr.get_objects(as_ocfl_objects=False)) == obj_paths
+		assert list(sr.get_objects(as_ocfl_objects=False, workers=4)) == obj_paths
+
+		# cleanup
+		shutil.rmtree(os.path.join(obj.full_path, 'v1/content/nested'))
+
+
+	def test_lazy_objects(self):
+
+		'''
+		Test objects from Storage Root parse inventory only on first access
+		'''
+
+		# load sr2
+		storage_location = '%s/sr2' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location, object_index=False)
+
+		for obj in sr.get_objects():
+
+			# assert id read without parsing inventory
+			obj_id = obj.id
+			assert obj._object_inventory == None
+
+			# assert id matches full parse
+			assert obj.object_inventory.inventory['id'] == obj_id
+			assert obj._object_inventory != None
+
+			# assert namaste directory type matches eager load
+			assert obj.nam_d_dec == sr.get_object(obj_path=obj.path).nam_d_dec
+			assert obj.nam_d_dec['name'] == 'ocfl_object'
+
+		# assert id read across chunks, with escaped characters
+		obj = sr.get_object('3a3f43c170434837beb7cef86859ad3c')
+		obj.object_inventory.inventory['id'] = 'info:test/"escaped"\\id'
+		obj.object_inventory.save(obj.full_path)
+		obj = OCFLObject(obj.path, storage_root=sr, auto_load=False)
+		assert obj.read_id(chunk_size=7) == 'info:test/"escaped"\\id'
+
+		# assert nested id keys, before top-level id, are skipped
+		fixity = obj.object_inventory.inventory.get('fixity')
+		obj.object_inventory.inventory['extension'] = {'id':'nested', 'items':[{'id':'nested_in_list'}], 'paths':['"id":']}
+		obj.object_inventory.inventory['fixity'] = {'md5':{'0123':['v1/content/id']}}
+		obj.object_inventory.save(obj.full_path)
+		for chunk_size in [3, 7, 65536]:
+			assert OCFLObject(obj.path, storage_root=sr, auto_load=False).read_id(chunk_size=chunk_size) == 'info:test/"escaped"\\id'
+		del obj.object_inventory.inventory['extension']
+		obj.object_inventory.inventory['fixity'] = fixity
+		if fixity == None:
+			del obj.object_inventory.inventory['fixity']
+		obj.object_inventory.inventory['id'] = '3a3f43c170434837beb7cef86859ad3c'
+		obj.object_inventory.save(obj.full_path)
+
+
+
+class TestOCFLAsync(object):
+
+	'''
+	Class for tests related to asyncio facade
+	'''
+
+	def test_async_facade(self):
+
+		'''
+		Test object lookup, listing, reads, and checkout from event loop
+		'''
+
+		async def run():
+
+			async with AsyncOCFLStorageRoot('%s/sr_reconcile' % TESTS_DIR, workers=4) as sr:
+				await sr.load()
+
+				# async iteration matches synchronous listing
+				obj_paths = [ obj.path async for obj in sr.get_objects(batch_size=1) ]
+				assert obj_paths == list(sr.storage_root.get_objects(as_ocfl_objects=False))
+
+				# concurrent lookups and reads
+				obj = await sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+				assert await obj.get_id() == 'c101f4143b954a4891cc15c15e3ab9b7'
+				with obj.ocfl_obj.open('foo.xml') as f:
+					data = f.read()
+				results = await asyncio.gather(*[ obj.read('foo.xml', start=i, end=i + 4) for i in range(8) ])
+				assert results == [ data[i:i + 4] for i in range(8) ]
+
+				# streamed chunks, and reader seeking
+				assert b''.join([ chunk async for chunk in obj.iter_file('foo.xml', chunk_size=5) ]) == data
+				reader = await obj.open('foo.xml', start=2)
+				reader.seek(3)
+				assert await reader.read(4) == data[5:9]
+				await reader.close()
+
+				# checkout
+				checkout_path = os.path.join(TESTS_DIR, 'async_checkout')
+				await obj.checkout(checkout_path)
+				with open(os.path.join(checkout_path, 'foo.xml'), 'rb') as f:
+					assert f.read() == data
+
+		asyncio.run(run())
+
+
+
+class TestOCFLMetrics(object):
+
+	'''
+	Class to test instrumentation of OCFL operations
+	'''
+
+	def test_metrics_collectors(self):
+
+		'''
+		Test counters and timings dispatched to attached collectors
+		'''
+
+		# create object from copy of raw directory
+		obj_path = os.path.join(TESTS_DIR, 'metrics_obj')
+		copy_tree(os.path.join(TESTS_DIR, 'fixtures/raw_objs/raw_obj5'), obj_path)
+		content_bytes = sum([ os.path.getsize(os.path.join(obj_path, f)) for f in os.listdir(obj_path) ])
+
+		# attach collectors
+		collector = metrics.add_collector(OCFLMetricsCollector())
+		prom_path = os.path.join(TESTS_DIR, 'pyocfl.prom')
+		prom_collector = metrics.add_collector(OCFLPrometheusTextfileCollector(prom_path))
+		try:
+			obj = OCFLObject(obj_path)
+			obj.new()
+			obj.checkout(os.path.join(TESTS_DIR, 'checkouts/metrics'))
+		finally:
+			metrics.remove_collector(collector)
+			metrics.remove_collector(prom_collector)
+		assert not metrics.enabled
+
+		# assert counters, with content read once, and inventory digests calculated in memory
+		assert collector.counters['files_checked_out'] == len(os.listdir(os.path.join(obj_path, 'v1/content')))
+		assert collector.counters['files_hashed'] == collector.counters['files_checked_out']
+		assert collector.counters['bytes_hashed'] == content_bytes
+		assert collector.counters['inventories_written'] == 2
+
+		# assert timings
+		for name in ['update','update_write_inventories','update_reconcile_deltas','inventory_write']:
+			assert collector.timings[name][0] >= 1
+
+		# assert textfile written
+		prom_collector.write()
+		with open(prom_path) as f:
+			prom = f.read()
+		assert '# TYPE pyocfl_bytes_hashed_total counter\npyocfl_bytes_hashed_total %s\n' % collector.counters['bytes_hashed'] in prom
+		assert 'pyocfl_update_seconds_count %s\n' % collector.timings['update'][0] in prom
+
+
+
+class TestBenchmarks(object):
+
+	'''
+	Class to test benchmark suite against small synthetic dataset
+	'''
+
+	def test_benchmark_report(self):
+
+		'''
+		Test benchmarks run, report, and compare against baseline
+		'''
+
+		import bench_pyocfl
+
+		# run with small shape
+		report = bench_pyocfl.Benchmark(
+			os.path.join(TESTS_DIR, 'bench'),
+			repeat=1,
+			objects=2,
+			files_per_object=12,
+			files_per_dir=5,
+			file_size=64,
+			file_size_distribution='lognormal',
+			versions=3,
+			churn=0.25
+		).run()
+
+		# assert all benchmarks reported, and report serializes
+		assert sorted(report['results'].keys()) == sorted(['new','add_object','update','reconcile_deltas','checkout','check_fixity','get_objects'])
+		assert report['results']['new']['count'] == 2
+		assert report['results']['update']['counters']['files_hashed'] > 0
+		json.loads(json.dumps(report))
+
+		# assert comparison flags only slowdowns beyond tolerance
+		baseline = json.loads(json.dumps(report))
+		baseline['results']['checkout']['seconds'] = report['results']['checkout']['seconds'] / 2
+		comparison = bench_pyocfl.compare(report, baseline, tolerance=0.5)
+		assert [ name for name,result in comparison.items() if result['regression'] ] == ['checkout']
+
+
+
+class TestImport(object):
+
+	'''
+	Class to test import time and CLI startup
+	'''
+
+	def test_import_time(self):
+
+		'''
+		Test import of pyocfl within budget, without loading modules needed only by some operations
+		'''
+
+		# best of several runs, in fresh interpreters
+		code = 'import sys, time; stime = time.perf_counter(); import pyocfl.pyocfl; print(time.perf_counter() - stime); print(" ".join(sys.modules))'
+		results = [ subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.splitlines() for i in range(5) ]
+
+		# assert budget
+		assert min([ float(result[0]) for result in results ]) < IMPORT_TIME_BUDGET
+
+		# assert lazy modules not imported
+		modules = set([ module.split('.')[0] for module in results[0][1].split() ])
+		assert modules.isdisjoint(LAZY_MODULES)
+
+
+	def test_cli_cd(self):
+
+		'''
+		Test pyocfl_bin cd resolves id to path, without loading modules needed only by other commands
+		'''
+
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
+
+		# run with import timing, reporting imported modules to stderr
+		result = subprocess.run(
+			[sys.executable, '-X', 'importtime', 'pyocfl/pyocfl_bin.py', '-sr', storage_location, 'cd', obj.id],
+			capture_output=True, text=True, check=True)
+		assert result.stdout.strip() == obj.full_path
+
+		# assert lazy modules not imported, except namaste needed to load Storage Root storage engine
+		modules = set([ line.split('|')[-1].strip().split('.')[0] for line in result.stderr.splitlines() if line.startswith('import time:') ])
+		assert modules.isdisjoint([ module for module in LAZY_MODULES if module != 'namaste' ])
+
+		# assert missing id
+		result = subprocess.run([sys.executable, 'pyocfl/pyocfl_bin.py', '-sr', storage_location, 'cd', 'not_an_id'], capture_output=True, text=True)
+		assert result.returncode != 0
+
+
+	def test_cli_export(self):
+
+		'''
+		Test pyocfl_bin export streams archive to stdout, and reports missing id
+		'''
+
+		storage_location = '%s/sr_reconcile' % TESTS_DIR
+		sr = OCFLStorageRoot(storage_location)
+		obj = sr.get_object('c101f4143b954a4891cc15c15e3ab9b7')
 
+		# assert archive of latest version
+		result = subprocess.run([sys.executable, 'pyocfl/pyocfl_bin.py', '-sr', storage_location, '--format', 'zip', 'export', obj.id], capture_output=True, check=True)
+		with zipfile.ZipFile(io.BytesIO(result.stdout)) as zf:
+			with zf.open('foo.xml') as f, obj.open('foo.xml') as stored:
+				assert f.read() == stored.read()
+
+		# assert missing id
+		result = subprocess.run([sys.executable, 'pyocfl/pyocfl_bin.py', '-sr', storage_location, 'export', 'not_an_id'], capture_output=True, text=True)
+		assert result.returncode != 0
+		assert 'OCFL Object could not be found for identifier: not_an_id' in result.stderr
+		assert 'AttributeError' not in result.stderr